@@ -107,6 +107,29 @@ def test_eq_unequal():
         c1 == c2
 
 
+WideC = attrs.make_class(
+    "WideC",
+    {
+        f"f{i}": attrs.field(
+            default=0, validator=attrs.validators.instance_of(int)
+        )
+        for i in range(60)
+    },
+    on_setattr=attrs.setters.validate,
+)
+
+
+def test_setattr_wide():
+    """
+    Benchmark assigning to the last field of a class with many validated
+    fields.
+    """
+    c = WideC()
+
+    for _ in range(ROUNDS):
+        c.f59 = 1
+
+
 @attrs.frozen
 class HashableC:
     x: int = 0
@@ -282,6 +282,13 @@ def attrs(
     field_transformer: _FieldTransformer | None = ...,
     match_args: bool = ...,
     unsafe_hash: bool | None = ...,
+    compact_pickle: bool = ...,
+    fast_evolve: bool = ...,
+    fast_copy: bool = ...,
+    intern: bool = ...,
+    track_changes: bool = ...,
+    invariants: Sequence[Callable[[Any], Any]] = ...,
+    check_types: bool = ...,
 ) -> _C: ...
 @overload
 @dataclass_transform(order_default=True, field_specifiers=(attrib, field))
@@ -310,6 +317,13 @@ def attrs(
     field_transformer: _FieldTransformer | None = ...,
     match_args: bool = ...,
     unsafe_hash: bool | None = ...,
+    compact_pickle: bool = ...,
+    fast_evolve: bool = ...,
+    fast_copy: bool = ...,
+    intern: bool = ...,
+    track_changes: bool = ...,
+    invariants: Sequence[Callable[[Any], Any]] = ...,
+    check_types: bool = ...,
 ) -> Callable[[_C], _C]: ...
 def fields(cls: type[AttrsInstance] | AttrsInstance) -> Any: ...
 def fields_dict(cls: type[AttrsInstance]) -> dict[str, Attribute[Any]]: ...
@@ -330,6 +344,7 @@ def make_class(
     attrs: list[str] | tuple[str, ...] | dict[str, Any],
     bases: tuple[type, ...] = ...,
     class_body: dict[str, Any] | None = ...,
+    pickle_by_spec: bool = ...,
     repr_ns: str | None = ...,
     repr: bool = ...,
     cmp: _EqOrderType | None = ...,
@@ -348,6 +363,13 @@ def make_class(
     collect_by_mro: bool = ...,
     on_setattr: _OnSetAttrArgType | None = ...,
     field_transformer: _FieldTransformer | None = ...,
+    compact_pickle: bool = ...,
+    fast_evolve: bool = ...,
+    fast_copy: bool = ...,
+    intern: bool = ...,
+    track_changes: bool = ...,
+    invariants: Sequence[Callable[[Any], Any]] = ...,
+    check_types: bool = ...,
 ) -> type: ...
 
 # _funcs --
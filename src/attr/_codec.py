@@ -0,0 +1,396 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Fixed-width binary codecs that are derived from field type annotations.
+"""
+
+import mmap
+import struct
+import typing
+import weakref
+
+from collections.abc import Sequence
+from pathlib import Path
+
+from ._funcs import has, resolve_types
+from ._make import (
+    _OBJ_SETATTR,
+    _bookkeeping_defaults,
+    _generate_unique_filename,
+    _linecache_and_compile,
+    fields,
+)
+
+
+# Standard sizes, little-endian, and no alignment padding.
+_BYTE_ORDER = "<"
+_DEFAULT_FORMATS = {bool: "?", int: "q", float: "d"}
+# The format characters that can be picked using typing.Annotated.
+_ALLOWED_FORMATS = {bool: "?", int: "bBhHiIlLqQ", float: "efd"}
+
+
+class Codec:
+    """
+    A fixed-width binary codec for an *attrs* class.
+
+    Don't instantiate it yourself, use `attrs.codec` instead.
+
+    Attributes:
+        cls (type): The class this codec packs and unpacks.
+
+        format (str): The `struct` format string of one record.
+
+        size (int): The size of one record in bytes.
+
+    .. versionadded:: 26.2.0
+    """
+
+    __slots__ = (
+        "_from_tuple",
+        "_struct",
+        "cls",
+        "format",
+        "pack",
+        "pack_into",
+        "size",
+    )
+
+    def __init__(self, cls, fmt, pack, pack_into, from_tuple):
+        self.cls = cls
+        self.format = fmt
+        self._struct = struct.Struct(fmt)
+        self.size = self._struct.size
+        self.pack = pack
+        self.pack_into = pack_into
+        self._from_tuple = from_tuple
+
+    def __repr__(self):
+        return f"<Codec for {self.cls.__qualname__} ({self.format!r}, {self.size} bytes)>"
+
+    def unpack(self, buffer):
+        """
+        Decode the instance in *buffer* that must be exactly `size` bytes long.
+
+        *buffer* can be any object that supports the buffer protocol -- like
+        `bytes`, `memoryview`, or `mmap.mmap` -- and is **not** copied.
+        """
+        return self._from_tuple(self._struct.unpack(buffer))
+
+    def unpack_from(self, buffer, offset=0):
+        """
+        Decode the instance that starts at *offset* in *buffer*.
+        """
+        return self._from_tuple(self._struct.unpack_from(buffer, offset))
+
+    def iter_unpack(self, buffer):
+        """
+        Lazily decode consecutive records from *buffer* whose size must be a
+        multiple of `size`.
+
+        Pass a `mmap.mmap` to stream records from a file without reading it
+        into memory.
+        """
+        return map(self._from_tuple, self._struct.iter_unpack(buffer))
+
+
+def codec(cls):
+    """
+    Return the fixed-width binary `Codec` for *cls*.
+
+    The layout is derived from the type annotations of the fields in the order
+    of `attrs.fields`:
+
+    - `int` is packed as a signed 64-bit integer,
+    - `float` as a double,
+    - `bool` as a single byte,
+    - ``typing.Annotated[bytes, 16]`` as 16 bytes,
+    - and nested *attrs* classes are inlined.
+
+    Shorter `bytes` values are padded with null bytes that are part of the
+    unpacked value -- so ``b"ab"`` comes back as ``b"ab\\x00\\x00"`` from a
+    4-byte field -- and longer values are silently truncated.
+
+    You can pick a different `struct` format character for `int` and `float`
+    fields using ``typing.Annotated``.  For example,
+    ``typing.Annotated[int, "I"]`` for an unsigned 32-bit integer.  Only
+    single characters without byte order or repeat count are allowed: one of
+    ``bBhHiIlLqQ`` for `int`, ``efd`` for `float`, and ``?`` for `bool`.
+
+    The codec is generated once per class and then cached.
+
+    Unpacking creates instances without calling ``__init__`` -- the same way
+    `pickle` does.  Therefore, neither converters nor validators, nor
+    ``__attrs_post_init__`` are run.
+
+    Args:
+        cls (type): An *attrs* class whose fields are all fixed-width.
+
+    Returns:
+        Codec: The codec for *cls*.
+
+    Raises:
+        attrs.exceptions.NotAnAttrsClassError:
+            If *cls* is not an *attrs* class.
+
+        TypeError: If a field has no fixed-width representation.
+
+    .. versionadded:: 26.2.0
+    """
+    c = cls.__dict__.get("__attrs_codec__")
+    if c is not None:
+        return c
+
+    c = _make_codec(cls)
+    cls.__attrs_codec__ = c
+
+    return c
+
+
+def _field_format(cls, a):
+    """
+    Return the struct format of field *a* of *cls* or None if it's a nested
+    *attrs* class.
+    """
+    t = a.type
+    metadata = ()
+    if typing.get_origin(t) is typing.Annotated:
+        metadata = t.__metadata__
+        t = t.__origin__
+
+    if has(t):
+        return None
+
+    if t is bytes:
+        for m in metadata:
+            if isinstance(m, int) and not isinstance(m, bool):
+                return f"{m}s"
+    elif t in _DEFAULT_FORMATS:
+        for m in metadata:
+            if isinstance(m, str):
+                if len(m) != 1 or m not in _ALLOWED_FORMATS[t]:
+                    msg = f"{m!r} is not a valid struct format for field '{a.name}' of {cls!r}: use one of {_ALLOWED_FORMATS[t]!r}."
+                    raise TypeError(msg)
+
+                return m
+
+        return _DEFAULT_FORMATS[t]
+
+    msg = f"Field '{a.name}' of {cls!r} has no fixed-width representation: {a.type!r}."
+    raise TypeError(msg)
+
+
+def _make_codec(cls):
+    globs = {"_setattr": _OBJ_SETATTR}
+    formats = []
+    getters = []
+    from_lines = []
+    counter = 0
+    instances = 0
+
+    def add_class(c, prefix, seen):
+        """
+        Add the fields of class *c* whose instance is accessed as *prefix* and
+        return the name of the variable that holds the decoded instance.
+        """
+        nonlocal counter, instances
+
+        if c in seen:
+            msg = f"{c!r} is recursive and has no fixed-width representation."
+            raise TypeError(msg)
+
+        resolve_types(c)
+
+        cls_name = f"_cls_{instances}"
+        inst_var = f"_inst_{instances}"
+        instances += 1
+        seen = (*seen, c)
+        globs[cls_name] = c
+
+        assignments = []
+        for a in fields(c):
+            fmt = _field_format(c, a)
+            if fmt is None:
+                t = a.type
+                if typing.get_origin(t) is typing.Annotated:
+                    t = t.__origin__
+                value_var = add_class(t, f"{prefix}.{a.name}", seen)
+            else:
+                formats.append(fmt)
+                getters.append(f"{prefix}.{a.name}")
+                value_var = f"_v{counter}"
+                counter += 1
+
+            assignments.append(
+                f"    _setattr({inst_var}, '{a.name}', {value_var})"
+            )
+
+        from_lines.append(f"    {inst_var} = {cls_name}.__new__({cls_name})")
+        from_lines.extend(assignments)
+        from_lines.extend(
+            f"    _setattr({inst_var}, '{name}', {value!r})"
+            for name, value in _bookkeeping_defaults(c).items()
+        )
+
+        return inst_var
+
+    root = add_class(cls, "inst", ())
+    fmt = _BYTE_ORDER + "".join(formats)
+    s = struct.Struct(fmt)
+    globs["_pack"] = s.pack
+    globs["_pack_into"] = s.pack_into
+
+    values = ", ".join(getters)
+    unpacked = "".join(f"_v{i}, " for i in range(counter))
+    script = "\n".join(
+        [
+            "def pack(inst):",
+            f"    return _pack({values})",
+            "def pack_into(buffer, offset, inst):",
+            f"    _pack_into(buffer, offset, {values})",
+            "def from_tuple(t):",
+            f"    {unpacked}= t" if counter else "    pass",
+            *from_lines,
+            f"    return {root}",
+        ]
+    )
+    locs = _linecache_and_compile(
+        script, _generate_unique_filename(cls, "codec"), globs
+    )
+
+    return Codec(cls, fmt, locs["pack"], locs["pack_into"], locs["from_tuple"])
+
+
+class MappedArray(Sequence):
+    """
+    A read-only sequence of instances of the *attrs* class *cls* that are
+    stored back-to-back in the file at *path* -- as written by
+    `attrs.Codec.pack`.
+
+    The file is memory-mapped and records are only decoded when they're
+    accessed, so you can index, slice, iterate, and binary-search (using
+    `bisect` with a *key*) files that are much bigger than the available
+    memory.
+
+    Slicing returns a new `MappedArray` that shares the memory-mapping with
+    the original one.
+
+    Args:
+        cls (type): An *attrs* class that is supported by `attrs.codec`.
+
+        path (str | os.PathLike): The file to map.
+
+    Raises:
+        ValueError: If *cls* has no fields or if the size of the file isn't a
+            multiple of the record size.
+
+    .. versionadded:: 26.2.0
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_codec",
+        "_mmap",
+        "_records",
+        "_size",
+        "_views",
+        "cls",
+    )
+
+    def __init__(self, cls, path):
+        c = codec(cls)
+        if not c.size:
+            msg = f"Can't map records of {cls!r} because they're empty."
+            raise ValueError(msg)
+
+        with Path(path).open("rb") as f:
+            try:
+                m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file
+                m = None
+
+        length = 0 if m is None else len(m)
+        if length % c.size:
+            m.close()
+            msg = f"The size of {path!r} ({length} bytes) is not a multiple of the record size of {cls!r} ({c.size} bytes)."
+            raise ValueError(msg)
+
+        self._init(
+            c,
+            m,
+            memoryview(b"" if m is None else m),
+            weakref.WeakSet(),
+            range(length // c.size),
+        )
+
+    def _init(self, c, m, buffer, views, records):
+        self.cls = c.cls
+        self._codec = c
+        self._size = c.size
+        self._mmap = m
+        self._buffer = buffer
+        # The views of the buffer that iterators use.
+        self._views = views
+        self._records = records
+
+    def __repr__(self):
+        return f"<MappedArray of {len(self)} {self.cls.__qualname__} records>"
+
+    def __len__(self):
+        return len(self._records)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            new = MappedArray.__new__(MappedArray)
+            new._init(
+                self._codec,
+                self._mmap,
+                self._buffer,
+                self._views,
+                self._records[index],
+            )
+
+            return new
+
+        return self._codec.unpack_from(
+            self._buffer, self._records[index] * self._size
+        )
+
+    def __iter__(self):
+        records = self._records
+        if records.step != 1:
+            return super().__iter__()
+
+        size = self._size
+        view = self._buffer[records.start * size : records.stop * size]
+        self._views.add(view)
+
+        return self._codec.iter_unpack(view)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Unmap the file.
+
+        This also invalidates all slices that share the mapping.  Closing a
+        closed array does nothing.
+
+        Raises:
+            BufferError:
+                If iterators over the array or its slices are still in use.
+                The array remains open in that case.
+        """
+        try:
+            for view in list(self._views):
+                view.release()
+        except BufferError:
+            msg = "Can't close the array while iterators over it are in use."
+            raise BufferError(msg) from None
+
+        self._buffer.release()
+        if self._mmap is not None:
+            self._mmap.close()
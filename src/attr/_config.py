@@ -3,6 +3,10 @@
 __all__ = ["get_run_validators", "set_run_validators"]
 
 _run_validators = True
+# Whether deep validators ignore their *sample* and *prefix* arguments.
+_validate_exhaustively = False
+# Whether validators derived by *check_types* are run.
+_check_types = True
 
 
 def set_run_validators(run):
@@ -1,26 +1,30 @@
 # SPDX-License-Identifier: MIT
 
 
-from ._compat import get_generic_base
-from ._make import _OBJ_SETATTR, NOTHING, fields
-from .exceptions import AttrsAttributeNotFoundError
-
-
-_ATOMIC_TYPES = frozenset(
-    {
-        type(None),
-        bool,
-        int,
-        float,
-        str,
-        complex,
-        bytes,
-        type(...),
-        type,
-        range,
-        property,
-    }
+import contextlib
+import enum
+import typing
+
+from . import _config, setters
+from ._compat import _lazy_is_generator, get_generic_base
+from ._make import (
+    _ATOMIC_TYPES,
+    _CHANGES_FIELD,
+    _HASH_CACHE_FIELD,
+    _OBJ_SETATTR,
+    NOTHING,
+    ClassProps,
+    _compile_validator,
+    _flatten_setters,
+    _generate_unique_filename,
+    _is_hashed,
+    _linecache_and_compile,
+    _restore_field,
+    evolve,
+    fields,
+    fields_dict,
 )
+from .exceptions import AttrsAttributeNotFoundError, FrozenInstanceError
 
 
 def asdict(
@@ -422,6 +426,625 @@ def assoc(inst, **changes):
     return new
 
 
+def assign(inst, **changes):
+    """
+    Set the fields of *inst* to *changes* in one go.
+
+    First, the *on_setattr* hooks of all changed fields -- like converters --
+    are run and the results are assigned.  Then, the validators of the
+    changed fields that are validated on assignment and the class's
+    invariants are run exactly once, on the updated instance.  If one of
+    them fails, the old values are restored before the exception is raised.
+
+    Unlike with individual assignments, intermediate states are never
+    validated.  The rest of generator hooks runs after all changes have been
+    validated.
+
+    The values are written directly, so a custom ``__setattr__`` of the
+    class is bypassed -- just like in ``__init__``.
+
+    Args:
+        inst: Instance of a class with *attrs* attributes.
+
+        changes: The names of the fields and their new values.
+
+    Raises:
+        attrs.exceptions.AttrsAttributeNotFoundError:
+            If a name in *changes* isn't a field of *inst*.
+
+        attrs.exceptions.FrozenInstanceError: If *inst* is frozen.
+
+        attrs.exceptions.NotAnAttrsClassError:
+            If *inst* is not an instance of an *attrs* class.
+
+    .. versionadded:: 26.2.0
+    """
+    cls = inst.__class__
+    attrs = fields(cls)
+    by_name = fields_dict(cls)
+    props = cls.__attrs_props__
+    if props.is_frozen:
+        raise FrozenInstanceError
+
+    to_set = []
+    for name, new in changes.items():
+        a = by_name.get(name, NOTHING)
+        if a is NOTHING:
+            msg = f"{name} is not an attrs attribute on {cls}."
+            raise AttrsAttributeNotFoundError(msg)
+
+        on_setattr = a.on_setattr or props.on_setattr_hook
+        hooks = (
+            _flatten_setters(on_setattr)
+            if on_setattr and on_setattr is not setters.NO_OP
+            else ()
+        )
+        val = new
+        validated = False
+        gen = None
+        for hook in hooks:
+            if hook is setters.validate:
+                validated = True
+            elif len(hooks) == 1 and _lazy_is_generator(hook)():
+                gen = hook(inst, a, val)
+                val = next(gen)
+            else:
+                val = hook(inst, a, val)
+
+        to_set.append((a, val, validated, gen))
+
+    old = [(a.name, getattr(inst, a.name, NOTHING)) for a, *_ in to_set]
+    for a, val, _, _ in to_set:
+        _OBJ_SETATTR(inst, a.name, val)
+
+    if _config._run_validators is True:
+        try:
+            for a, val, validated, _ in to_set:
+                if validated and a.validator is not None:
+                    _compile_validator(a.validator)(inst, a, val)
+
+            for invariant in props.invariants:
+                invariant(inst)
+        except BaseException:
+            for name, value in reversed(old):
+                _restore_field(inst, name, value)
+            for *_, gen in to_set:
+                if gen is not None:
+                    gen.close()
+            raise
+
+    if props.hashability is ClassProps.Hashability.HASHABLE_CACHED and any(
+        _is_hashed(a) for a, *_ in to_set
+    ):
+        _OBJ_SETATTR(inst, _HASH_CACHE_FIELD, None)
+    if props.added_change_tracking:
+        mask = getattr(inst, _CHANGES_FIELD)
+        for a, *_ in to_set:
+            mask |= 1 << attrs.index(a)
+        _OBJ_SETATTR(inst, _CHANGES_FIELD, mask)
+
+    for *_, gen in to_set:
+        if gen is None:
+            continue
+        try:
+            next(gen)
+        except StopIteration:
+            continue
+
+        gen.close()
+        msg = "Generator on_setattr hook yielded more than once."
+        raise RuntimeError(msg)
+
+
+class _BatchUpdate:
+    """
+    Collect the assignments to an instance in `batch_update`.
+
+    The state lives in a single name-mangled slot, so it can't shadow fields.
+    """
+
+    __slots__ = ("__batch",)
+
+    def __init__(self, inst, changes):
+        object.__setattr__(
+            self,
+            "_BatchUpdate__batch",
+            (inst, fields_dict(inst.__class__), changes),
+        )
+
+    def __getattr__(self, name):
+        inst, _, changes = self.__batch
+        val = changes.get(name, NOTHING)
+        if val is NOTHING:
+            return getattr(inst, name)
+
+        return val
+
+    def __setattr__(self, name, val):
+        inst, attrs, changes = self.__batch
+        if name not in attrs:
+            msg = f"{name} is not an attrs attribute on {inst.__class__}."
+            raise AttrsAttributeNotFoundError(msg)
+
+        changes[name] = val
+
+    def __repr__(self):
+        inst, _, changes = self.__batch
+
+        return f"<batch update of {inst!r} with {changes!r}>"
+
+
+@contextlib.contextmanager
+def batch_update(inst):
+    """
+    A context manager that yields a proxy of *inst* whose assignments are
+    collected and applied using `attrs.assign` when the block is left.
+
+    Reading attributes from the proxy returns the pending values.  If the
+    block raises an exception, *inst* remains unchanged.
+
+    Raises the same exceptions as `attrs.assign`.  Setting names that aren't
+    fields raises `attrs.exceptions.AttrsAttributeNotFoundError` right away.
+
+    .. versionadded:: 26.2.0
+    """
+    changes = {}
+
+    yield _BatchUpdate(inst, changes)
+
+    assign(inst, **changes)
+
+
+class _PathNode(dict):
+    """
+    A node of the trie of paths in `evolve_in_many`, mapping field names to
+    either another node or the new value.
+    """
+
+    __slots__ = ()
+
+
+def evolve_in(inst, path, value):
+    """
+    Create a new instance, based on *inst* with the field at *path* set to
+    *value*.
+
+    *path* is a sequence of field names that leads through nested *attrs*
+    instances.  Only the instances along *path* are recreated -- using
+    `attrs.evolve` -- everything else is shared with *inst*.
+
+    Args:
+        inst: Instance of a class with *attrs* attributes.
+
+        path (~collections.abc.Sequence[str]):
+            Names of the fields that lead to the field to change.
+
+        value: The new value.
+
+    Returns:
+        A copy of *inst* with the change incorporated.
+
+    Raises:
+        ValueError: If *path* is empty.
+
+        attrs.exceptions.AttrsAttributeNotFoundError:
+            If a name in *path* isn't a field of the respective instance.
+
+        attrs.exceptions.NotAnAttrsClassError:
+            If an instance along *path* is not an instance of an *attrs*
+            class.
+
+    .. versionadded:: 26.2.0
+    """
+    return evolve_in_many(inst, {tuple(path): value})
+
+
+def evolve_in_many(inst, changes):
+    """
+    Like `evolve_in`, but apply all *changes* -- a mapping of paths to values
+    -- at once.
+
+    Every instance that is touched by one or more paths is recreated exactly
+    once.
+
+    Raises:
+        ValueError:
+            If a path is empty or if one path is a prefix of another one.
+
+    .. versionadded:: 26.2.0
+    """
+    root = _PathNode()
+    for path, value in changes.items():
+        if not path:
+            msg = "Paths must not be empty."
+            raise ValueError(msg)
+
+        *spine, last = path
+        node = root
+        for name in spine:
+            child = node.get(name, NOTHING)
+            if child is NOTHING:
+                child = node[name] = _PathNode()
+            elif not isinstance(child, _PathNode):
+                break
+            node = child
+        else:
+            if last not in node:
+                node[last] = value
+                continue
+
+        msg = f"Path {tuple(path)!r} overlaps with another path."
+        raise ValueError(msg)
+
+    return _evolve_node(inst, root)
+
+
+def _evolve_node(inst, node):
+    # Not getattr() on fields() -- it would find tuple methods like count.
+    attrs = fields_dict(inst.__class__)
+    changes = {}
+    for name, value in node.items():
+        a = attrs.get(name, NOTHING)
+        if a is NOTHING:
+            msg = f"{name} is not an attrs attribute on {inst.__class__}."
+            raise AttrsAttributeNotFoundError(msg)
+
+        changes[a.alias] = (
+            _evolve_node(getattr(inst, name), value)
+            if isinstance(value, _PathNode)
+            else value
+        )
+
+    return evolve(inst, **changes)
+
+
+def _tracked_fields(inst):
+    cls = inst.__class__
+    attrs = fields(cls)
+    if not cls.__attrs_props__.added_change_tracking:
+        msg = f"{cls!r} doesn't track changes.  Pass track_changes=True to its decorator."
+        raise TypeError(msg)
+
+    return attrs
+
+
+def changed_fields(inst):
+    """
+    Return the names of the fields of *inst* that have been reassigned since
+    it's been initialized or since `attrs.clear_changes` has been called on
+    it.
+
+    Assignments count even if the new value is equal to the old one.
+
+    Args:
+        inst: An instance of an *attrs* class with *track_changes*.
+
+    Returns:
+        tuple[str, ...]: The names of the changed fields in definition order.
+
+    Raises:
+        attrs.exceptions.NotAnAttrsClassError:
+            If *inst* is not an instance of an *attrs* class.
+
+        TypeError: If the class of *inst* doesn't track changes.
+
+    .. versionadded:: 26.2.0
+    """
+    attrs = _tracked_fields(inst)
+    mask = getattr(inst, _CHANGES_FIELD)
+
+    return tuple(a.name for i, a in enumerate(attrs) if mask >> i & 1)
+
+
+def clear_changes(inst):
+    """
+    Forget about all changes of *inst*, for example after persisting them.
+
+    Raises the same exceptions as `attrs.changed_fields`.
+
+    .. versionadded:: 26.2.0
+    """
+    _tracked_fields(inst)
+    _OBJ_SETATTR(inst, _CHANGES_FIELD, 0)
+
+
+def diff(a, b, *, recurse=True, filter=None):
+    """
+    Return the paths of the fields whose values differ between *a* and *b*.
+
+    Fields are compared like the ``__eq__`` that *attrs* generates would
+    compare them: fields with ``eq=False`` are ignored and callables passed as
+    *eq* are honored.  But instead of stopping at the first difference, all
+    differing fields are collected.
+
+    The comparison is generated once per class and then cached.  Nothing is
+    allocated for fields that are equal.
+
+    Args:
+        a: An instance of an *attrs* class.
+
+        b: Another instance of the same class.
+
+        recurse (bool):
+            If True, fields whose values on both sides are instances of the
+            same *attrs* class with a generated ``__eq__`` are diffed
+            recursively instead of being compared as a whole.
+
+        filter (~typing.Callable):
+            A callable whose return code determines whether a field is
+            compared (`True`) or ignored (`False`).  Is called with the
+            `attrs.Attribute` as the first argument and the value of *a* as
+            the second argument.  See `attrs.filters`.
+
+    Returns:
+        list[tuple[str, ...]]:
+            The paths of the differing fields -- in the format that
+            `attrs.evolve_in_many` accepts.  Empty if *a* and *b* are equal.
+
+    Raises:
+        attrs.exceptions.NotAnAttrsClassError:
+            If *a* is not an instance of an *attrs* class.
+
+        TypeError: If *a* and *b* aren't instances of the same class.
+
+    .. versionadded:: 26.2.0
+    """
+    cls = a.__class__
+    if b.__class__ is not cls:
+        msg = f"Can't diff instances of different classes: {cls!r} and {b.__class__!r}."
+        raise TypeError(msg)
+
+    # The per-class diff functions return the differing paths and the pairs
+    # of nested instances in field order.  Nested pairs are diffed using an
+    # explicit stack instead of recursion, so arbitrarily deep object graphs
+    # don't hit the recursion limit.
+    rv = []
+    stack = [(_get_differ(cls), a, b, ())]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        d, x, y, path = pop()
+        if d is None:
+            rv.append(path)
+        else:
+            extend(reversed(d(x, y, path, recurse, filter)))
+
+    return rv
+
+
+def _get_differ(cls):
+    """
+    Return the diff function of *cls* -- creating and caching it if necessary.
+    """
+    d = cls.__dict__.get("__attrs_differ__")
+    if d is None:
+        d = cls.__attrs_differ__ = _make_differ(cls)
+
+    return d
+
+
+def _nested_differ(cls):
+    """
+    Return the diff function of *cls* if it's an *attrs* class with a
+    generated ``__eq__``, otherwise None.
+    """
+    props = cls.__dict__.get("__attrs_props__")
+    if props is None or not props.added_eq:
+        return None
+
+    return _get_differ(cls)
+
+
+def _make_differ(cls):
+    globs = {"_nested_differ": _nested_differ}
+    lines = ["def diff(a, b, path, recurse, filter):", "    rv = []"]
+    for a in fields(cls):
+        if not a.eq:
+            continue
+
+        attr_name = f"__attr_{a.name}"
+        globs[attr_name] = a
+        lines.extend(
+            [
+                f"    x = a.{a.name}",
+                f"    y = b.{a.name}",
+                f"    if x is not y and (filter is None or filter({attr_name}, x)):",
+            ]
+        )
+        if a.eq_key:
+            key_name = f"__key_{a.name}"
+            globs[key_name] = a.eq_key
+            lines.extend(
+                [
+                    f"        if not ({key_name}(x) == {key_name}(y)):",
+                    f"            rv.append((None, None, None, (*path, '{a.name}')))",
+                ]
+            )
+        else:
+            lines.extend(
+                [
+                    "        d = _nested_differ(x.__class__) if recurse and x.__class__ is y.__class__ else None",
+                    "        if d is not None:",
+                    f"            rv.append((d, x, y, (*path, '{a.name}')))",
+                    "        elif not (x == y):",
+                    f"            rv.append((None, None, None, (*path, '{a.name}')))",
+                ]
+            )
+    lines.append("    return rv")
+
+    return _linecache_and_compile(
+        "\n".join(lines), _generate_unique_filename(cls, "diff"), globs
+    )["diff"]
+
+
+# Kinds of entries on the stack of `walk`.
+_WALK_NODE = 0  # Only look for attrs instances in the value.
+_WALK_LEAF = 1  # Yield a field whose value can't contain attrs instances.
+_WALK_FIELD = 2  # Yield a field and look into its value.
+_WALK_EMIT = 3  # Yield a field whose value has been looked into.
+
+
+def walk(inst, *, order="pre", filter=None):
+    """
+    Iterate over the fields of *inst* and -- transitively -- of all *attrs*
+    instances that are reachable through them.
+
+    The traversal uses an explicit stack instead of recursion, so arbitrarily
+    deep object graphs don't hit the recursion limit.  *attrs* instances are
+    also found inside lists, tuples, and the values of dictionaries.
+
+    Fields whose declared type can't contain *attrs* instances -- like `int`
+    or ``list[str]`` -- are yielded but not looked into.  Which fields those
+    are is determined once per class and then cached.  Fields without a type
+    or with a string annotation are always looked into.
+
+    Reference cycles are not detected.
+
+    Args:
+        inst: An instance of an *attrs* class.
+
+        order (str):
+            ``"pre"`` yields a field before the fields of the instances in it,
+            ``"post"`` after.
+
+        filter (~typing.Callable):
+            A callable whose return code determines whether a field is yielded
+            and looked into (`True`) or skipped (`False`).  Is called with the
+            `attrs.Attribute` as the first argument and the value as the
+            second argument.  See `attrs.filters`.
+
+    Yields:
+        tuple[tuple, attrs.Attribute, typing.Any]:
+            The path of the field, the field, and its value.  Paths consist of
+            field names, indexes into lists and tuples, and dictionary keys.
+
+    Raises:
+        attrs.exceptions.NotAnAttrsClassError:
+            If *inst* is not an instance of an *attrs* class.
+
+        ValueError: If *order* is neither ``"pre"`` nor ``"post"``.
+
+    .. versionadded:: 26.2.0
+    """
+    if order not in ("pre", "post"):
+        msg = f"order must be 'pre' or 'post', not {order!r}."
+        raise ValueError(msg)
+
+    fields(inst.__class__)
+
+    return _walk(inst, order == "post", filter)
+
+
+def _walk(inst, post, filter):
+    # Entries only carry their depth and their own key; the path is kept in
+    # a single list that is truncated to the depth of the popped entry.
+    # Storing the whole path in every pending entry would make the memory
+    # consumption quadratic in the depth of the graph.
+    stack = [(_WALK_NODE, -1, None, None, inst)]
+    pop = stack.pop
+    push = stack.append
+    path = []
+    while stack:
+        kind, depth, key, a, value = pop()
+        if depth >= 0:
+            del path[depth:]
+            path.append(key)
+
+        if kind is _WALK_EMIT or kind is _WALK_LEAF:
+            yield tuple(path), a, value
+            continue
+
+        if kind is _WALK_FIELD:
+            if post:
+                push((_WALK_EMIT, depth, key, a, value))
+            else:
+                yield tuple(path), a, value
+
+        cls = value.__class__
+        if cls in _ATOMIC_TYPES:
+            continue
+
+        depth = len(path)
+        spec = _get_walk_spec(cls)
+        if spec is not None:
+            for name, field, maybe_attrs in spec:
+                v = getattr(value, name)
+                if filter is not None and not filter(field, v):
+                    continue
+
+                push(
+                    (
+                        _WALK_FIELD if maybe_attrs else _WALK_LEAF,
+                        depth,
+                        name,
+                        field,
+                        v,
+                    )
+                )
+        elif isinstance(value, (list, tuple)):
+            for i in range(len(value) - 1, -1, -1):
+                push((_WALK_NODE, depth, i, None, value[i]))
+        elif isinstance(value, dict):
+            for k, v in reversed(value.items()):
+                push((_WALK_NODE, depth, k, None, v))
+
+
+def _get_walk_spec(cls):
+    """
+    Return the names and fields of *cls* -- in reverse order for the stack --
+    and whether their values can contain *attrs* instances.
+
+    Return None if *cls* is not an *attrs* class.
+    """
+    try:
+        return cls.__dict__["__attrs_walk_spec__"]
+    except KeyError:
+        pass
+
+    attrs = getattr(cls, "__attrs_attrs__", None)
+    if attrs is None:
+        return None
+
+    spec = cls.__attrs_walk_spec__ = tuple(
+        (a.name, a, _may_contain_attrs(a.type)) for a in reversed(attrs)
+    )
+
+    return spec
+
+
+def _may_contain_attrs(t):
+    """
+    Return whether values of the declared type *t* can contain *attrs*
+    instances.
+    """
+    if t is None or isinstance(t, (str, typing.TypeVar)):
+        return True
+
+    origin = typing.get_origin(t)
+    if origin is None:
+        return not (
+            isinstance(t, type)
+            and (t in _ATOMIC_TYPES or issubclass(t, enum.Enum))
+        )
+
+    special = _MAY_CONTAIN_ATTRS_BY_ORIGIN.get(origin)
+    if special is not None:
+        return special(t)
+
+    args = typing.get_args(t)
+
+    return not args or any(
+        _may_contain_attrs(arg) for arg in args if arg is not Ellipsis
+    )
+
+
+# Generic origins whose arguments aren't the types of contained values.
+_MAY_CONTAIN_ATTRS_BY_ORIGIN = {
+    typing.Annotated: lambda t: _may_contain_attrs(t.__origin__),
+    typing.Literal: lambda t: False,
+}
+
+
 def resolve_types(
     cls, globalns=None, localns=None, attribs=None, include_extras=True
 ):
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import abc
 import contextlib
+import copyreg
 import enum
 import itertools
 import linecache
@@ -14,7 +15,7 @@ import weakref
 
 from collections.abc import Callable, Mapping
 from functools import cached_property
-from typing import Any, NamedTuple, TypeVar
+from typing import Any, NamedTuple, TypeVar, get_type_hints
 
 # We need to import _compat itself in addition to the _compat members to avoid
 # having the thread-local in the globals here.
@@ -32,11 +33,30 @@ from .exceptions import (
     FrozenInstanceError,
     NotAnAttrsClassError,
     UnannotatedAttributeError,
+    UnpicklableValidationError,
 )
 
 
 # This is used at least twice, so cache it here.
 _OBJ_SETATTR = object.__setattr__
+
+# Types whose instances are immutable and therefore never need to be copied.
+_ATOMIC_TYPES = frozenset(
+    {
+        type(None),
+        bool,
+        int,
+        float,
+        str,
+        complex,
+        bytes,
+        type(...),
+        type,
+        range,
+        property,
+    }
+)
+
 _INIT_FACTORY_PAT = "__attr_factory_%s"
 _CLASSVAR_PREFIXES = (
     "typing.ClassVar",
@@ -48,6 +68,7 @@ _CLASSVAR_PREFIXES = (
 # name mangling when trying to create a slot for the field
 # (when slots=True)
 _HASH_CACHE_FIELD = "_attrs_cached_hash"
+_CHANGES_FIELD = "_attrs_changes"
 
 _EMPTY_METADATA_SINGLETON = types.MappingProxyType({})
 
@@ -263,6 +284,31 @@ def _linecache_and_compile(
     return locs
 
 
+def _compile_methods(
+    cls: type, lines: list[str], filename: str, globs: dict[str, Any]
+) -> tuple:
+    """
+    Compile the method definitions in *lines* and return the functions in
+    the order of the names in the last line -- ``return name, ...``.
+
+    Like in class bodies, ``__class__`` is in the closure cells of the
+    methods -- for example for subclass detection.  It points to *cls* and
+    is replaced with the newly constructed class after construction.
+    """
+    script = "\n".join(
+        [
+            "def wrapper(_cls):",
+            "    __class__ = _cls",
+            *(f"    {line}" for line in lines),
+            "_methods = wrapper(_cls)",
+        ]
+    )
+
+    return _linecache_and_compile(script, filename, globs, {"_cls": cls})[
+        "_methods"
+    ]
+
+
 def _make_attr_tuple_class(cls_name: str, attr_names: list[str]) -> type:
     """
     Create a tuple subclass to hold `Attribute`s for an `attrs` class.
@@ -385,6 +431,7 @@ def _transform_attrs(
     kw_only,
     collect_by_mro,
     field_transformer,
+    check_types=False,
 ) -> _Attributes:
     """
     Transform all `_CountingAttr`s on a class into `Attribute`s.
@@ -394,6 +441,9 @@ def _transform_attrs(
     If *collect_by_mro* is True, collect them in the correct MRO order,
     otherwise use the old -- incorrect -- order.  See #428.
 
+    If *check_types* is True, validators that check the values of the fields
+    that are defined on *cls* against their annotations are added.
+
     Return an `_Attributes`.
     """
     cd = cls.__dict__
@@ -463,6 +513,9 @@ def _transform_attrs(
         own_attrs = [a.evolve(kw_only=True) for a in own_attrs]
         base_attrs = [a.evolve(kw_only=True) for a in base_attrs]
 
+    if check_types:
+        own_attrs = _add_type_checks(cls, own_attrs)
+
     attrs = base_attrs + own_attrs
 
     # Resolve default field alias before executing field_transformer, so that
@@ -506,6 +559,69 @@ def _transform_attrs(
     return _Attributes(AttrsClass(attrs), base_attrs, base_attr_map)
 
 
+def _add_type_checks(cls, attrs):
+    """
+    Return *attrs* with validators -- derived from their resolved annotations
+    -- prepended to their validators.
+
+    Annotations that can't be resolved yet -- like forward references to
+    *cls* -- are resolved when the first value is validated.  If *cls* is
+    defined in a function, it's warned about annotations that can't be
+    resolved even then.
+    """
+    from .validators import (
+        _lazy_type_check,
+        _resolve_type_hints,
+        _type_check,
+    )
+
+    warn = True
+    try:
+        hints = get_type_hints(cls)
+    except Exception:  # noqa: BLE001
+        hints = {}
+        if "<locals>" in cls.__qualname__:
+            # Only module globals and the classes of the MRO are available
+            # for lazy resolution -- the locals of the function are gone.
+            try:
+                _resolve_type_hints(cls)
+            except Exception as e:  # noqa: BLE001
+                import warnings
+
+                warnings.warn(
+                    f"Can't resolve the annotations of {cls.__qualname__}, so they aren't type-checked: {e}",
+                    stacklevel=_user_stacklevel(),
+                )
+                # Don't warn again when the first value is validated.
+                warn = False
+
+    rv = []
+    for a in attrs:
+        t = hints.get(a.name, a.type)
+        if t is None:
+            rv.append(a)
+            continue
+
+        check = (
+            _lazy_type_check(a.name, warn)
+            if isinstance(t, str)
+            else _type_check(t)
+        )
+        if check is None:
+            rv.append(a)
+            continue
+
+        rv.append(
+            a.evolve(
+                validator=check
+                if a.validator is None
+                else and_(check, a.validator)
+            )
+        )
+
+    return rv
+
+
 def _make_cached_property_getattr(cached_properties, original_getattr, cls):
     lines = [
         # Wrapped to get `__class__` into closure cell for super()
@@ -622,6 +738,8 @@ def evolve(*args, **changes):
        argument.
     .. versionchanged:: 24.1.0
        *inst* can't be passed as a keyword argument anymore.
+    .. versionchanged:: 26.2.0
+       Uses the generated ``__replace__`` of classes with *fast_evolve*.
     """
     try:
         (inst,) = args
@@ -632,6 +750,10 @@ def evolve(*args, **changes):
         raise TypeError(msg) from None
 
     cls = inst.__class__
+    props = cls.__dict__.get("__attrs_props__")
+    if props is not None and props.added_fast_evolve:
+        return cls.__replace__(inst, **changes)
+
     attrs = fields(cls)
     for a in attrs:
         if not a.init:
@@ -663,12 +785,14 @@ class _ClassBuilder:
         "_has_custom_setattr",
         "_has_post_init",
         "_has_pre_init",
+        "_invariants",
         "_is_exc",
         "_on_setattr",
         "_pre_init_has_args",
         "_repr_added",
         "_script_snippets",
         "_slots",
+        "_track_changes",
         "_weakref_slot",
         "_wrote_own_setattr",
     )
@@ -688,6 +812,7 @@ class _ClassBuilder:
             props.kw_only,
             props.collected_fields_by_mro,
             props.field_transformer,
+            props.added_type_checks,
         )
 
         self._cls = cls
@@ -702,6 +827,8 @@ class _ClassBuilder:
         self._cache_hash = (
             props.hashability is ClassProps.Hashability.HASHABLE_CACHED
         )
+        self._track_changes = props.added_change_tracking
+        self._invariants = props.invariants
         self._has_pre_init = bool(getattr(cls, "__attrs_pre_init__", False))
         self._pre_init_has_args = False
         if self._has_pre_init:
@@ -733,7 +860,9 @@ class _ClassBuilder:
             setters.validate,
             setters.convert,
         ):
-            has_validator = has_converter = False
+            # Invariants are checked like validators.
+            has_validator = bool(props.invariants)
+            has_converter = False
             for a in attrs:
                 if a.validator is not None:
                     has_validator = True
@@ -960,6 +1089,8 @@ class _ClassBuilder:
         cd.update(reused_slots)
         if self._cache_hash:
             slot_names.append(_HASH_CACHE_FIELD)
+        if self._track_changes and _CHANGES_FIELD not in existing_slots:
+            slot_names.append(_CHANGES_FIELD)
 
         cd["__slots__"] = tuple(slot_names)
 
@@ -1031,6 +1162,11 @@ class _ClassBuilder:
             an for an in self._attr_names if an != "__weakref__"
         )
 
+        if self._track_changes:
+            # Changes are part of the state, so copies stay as dirty as the
+            # original.
+            state_attr_names += (_CHANGES_FIELD,)
+
         def slots_getstate(self):
             """
             Automatically created by attrs.
@@ -1038,6 +1174,7 @@ class _ClassBuilder:
             return {name: getattr(self, name) for name in state_attr_names}
 
         hash_caching_enabled = self._cache_hash
+        change_tracking_enabled = self._track_changes
 
         def slots_setstate(self, state):
             """
@@ -1061,8 +1198,28 @@ class _ClassBuilder:
             if hash_caching_enabled:
                 __bound_setattr(_HASH_CACHE_FIELD, None)
 
+            if change_tracking_enabled and _CHANGES_FIELD not in state:
+                __bound_setattr(_CHANGES_FIELD, 0)
+
         return slots_getstate, slots_setstate
 
+    def add_compact_pickling(self):
+        self._cls_dict["__reduce_ex__"] = self._add_method_dunders(
+            _make_compact_reduce(
+                self._cls,
+                self._attrs,
+                _compact_unpickle,
+                "__class__, _version",
+                {
+                    "_version": getattr(
+                        self._cls, "__attrs_pickle_version__", 0
+                    )
+                },
+            )
+        )
+
+        return self
+
     def make_unhashable(self):
         self._cls_dict["__hash__"] = None
         return self
@@ -1096,6 +1253,8 @@ class _ClassBuilder:
             self._is_exc,
             self._on_setattr,
             attrs_init=False,
+            track_changes=self._track_changes,
+            invariants=self._invariants,
         )
 
         def _attach_init(cls_dict, globs):
@@ -1115,6 +1274,60 @@ class _ClassBuilder:
         self._cls_dict["__replace__"] = self._add_method_dunders(__replace__)
         return self
 
+    def add_fast_replace(self):
+        if self._is_exc:
+            msg = "Exception classes can't use fast_evolve."
+            raise ValueError(msg)
+        if self._pre_init_has_args:
+            msg = "fast_evolve can't be used with an __attrs_pre_init__ that takes arguments."
+            raise ValueError(msg)
+
+        self._cls_dict["__replace__"] = self._add_method_dunders(
+            _make_fast_replace(
+                self._cls,
+                self._attrs,
+                self._has_pre_init,
+                self._has_post_init,
+                self._cache_hash,
+                self._track_changes,
+                self._invariants,
+            )
+        )
+
+        return self
+
+    def add_copy(self):
+        (
+            self._cls_dict["__copy__"],
+            self._cls_dict["__deepcopy__"],
+        ) = (
+            self._add_method_dunders(meth)
+            for meth in _make_copy_methods(
+                self._cls,
+                self._attrs,
+                self._slots,
+                self._cache_hash,
+                self._base_attr_map,
+                self._track_changes,
+            )
+        )
+
+        return self
+
+    def add_interning(self):
+        if self._is_exc:
+            msg = "Exception classes can't use intern."
+            raise ValueError(msg)
+
+        self._cls_dict["__attrs_intern_table__"] = table = (
+            weakref.WeakValueDictionary()
+        )
+        new, reduce_ex = _make_intern_methods(self._cls, self._attrs, table)
+        self._cls_dict["__new__"] = staticmethod(self._add_method_dunders(new))
+        self._cls_dict["__reduce_ex__"] = self._add_method_dunders(reduce_ex)
+
+        return self
+
     def add_match_args(self):
         self._cls_dict["__match_args__"] = tuple(
             field.name
@@ -1136,6 +1349,8 @@ class _ClassBuilder:
             self._is_exc,
             self._on_setattr,
             attrs_init=True,
+            track_changes=self._track_changes,
+            invariants=self._invariants,
         )
 
         def _attach_attrs_init(cls_dict, globs):
@@ -1150,7 +1365,7 @@ class _ClassBuilder:
     def add_eq(self):
         cd = self._cls_dict
 
-        script, globs = _make_eq_script(self._attrs)
+        script, globs = _make_eq_script(self._attrs, self._cache_hash)
 
         def _attach_eq(cls_dict, globs):
             cls_dict["__eq__"] = self._add_method_dunders(globs["__eq__"])
@@ -1172,53 +1387,38 @@ class _ClassBuilder:
         return self
 
     def add_setattr(self):
-        sa_attrs = {}
-        for a in self._attrs:
-            on_setattr = a.on_setattr or self._on_setattr
-            if on_setattr and on_setattr is not setters.NO_OP:
-                sa_attrs[a.name] = (
-                    a,
-                    on_setattr,
-                    _lazy_is_generator(on_setattr),
-                )
-
-        if not sa_attrs:
-            return self
+        script, globs, has_hooks = _make_setattr_script(
+            self._attrs,
+            self._on_setattr,
+            # Mutable classes that cache their hash have to forget it once a
+            # field that is part of it changes.
+            invalidate_hash=self._cache_hash and not self._frozen,
+            track_changes=self._track_changes,
+            invariants=self._invariants,
+        )
 
         if self._has_custom_setattr:
-            # We need to write a __setattr__ but there already is one!
-            msg = "Can't combine custom __setattr__ with on_setattr hooks."
-            raise ValueError(msg)
-
-        # docstring comes from _add_method_dunders
-        def __setattr__(self, name, val):
-            try:
-                a, hook, is_gen = sa_attrs[name]
-            except KeyError:
-                _OBJ_SETATTR(self, name, val)
-
-                return
-
-            if is_gen():
-                gen = hook(self, a, val)
-                nval = next(gen)
-                _OBJ_SETATTR(self, name, nval)
-                try:
-                    next(gen)
-                except StopIteration:
-                    return
+            if self._track_changes:
+                msg = "Can't combine custom __setattr__ with track_changes."
+                raise ValueError(msg)
+            if has_hooks:
+                # We need to write a __setattr__ but there already is one!
+                msg = "Can't combine custom __setattr__ with on_setattr hooks."
+                raise ValueError(msg)
 
-                gen.close()
-                msg = "Generator on_setattr hook yielded more than once."
-                raise RuntimeError(msg)
+            # Invalidating the cache is up to the custom __setattr__.
+            return self
 
-            nval = hook(self, a, val)
-            _OBJ_SETATTR(self, name, nval)
+        if script is None:
+            return self
 
-            return
+        def _attach_setattr(cls_dict, globs):
+            cls_dict["__setattr__"] = self._add_method_dunders(
+                globs["__setattr__"]
+            )
 
+        self._script_snippets.append((script, globs, _attach_setattr))
         self._cls_dict["__attrs_own_setattr__"] = True
-        self._cls_dict["__setattr__"] = self._add_method_dunders(__setattr__)
         self._wrote_own_setattr = True
 
         return self
@@ -1227,15 +1427,7 @@ class _ClassBuilder:
         """
         Add __module__ and __qualname__ to a *method*.
         """
-        method.__module__ = self._cls.__module__
-
-        method.__qualname__ = f"{self._cls.__qualname__}.{method.__name__}"
-
-        method.__doc__ = (
-            f"Method generated by attrs for class {self._cls.__qualname__}."
-        )
-
-        return method
+        return _add_method_dunders(self._cls, method)
 
     def _add_method_dunders_safe(self, method: Callable) -> Callable:
         """
@@ -1253,6 +1445,19 @@ class _ClassBuilder:
         return method
 
 
+def _add_method_dunders(cls: type, method: Callable) -> Callable:
+    """
+    Add __module__ and __qualname__ to a *method* of *cls*.
+    """
+    method.__module__ = cls.__module__
+
+    method.__qualname__ = f"{cls.__qualname__}.{method.__name__}"
+
+    method.__doc__ = f"Method generated by attrs for class {cls.__qualname__}."
+
+    return method
+
+
 def _determine_attrs_eq_order(cmp, eq, order, default_eq):
     """
     Validate the combination of *cmp*, *eq*, and *order*. Derive the effective
@@ -1376,6 +1581,13 @@ def attrs(
     match_args=True,
     unsafe_hash=None,
     force_kw_only=True,
+    compact_pickle=False,
+    fast_evolve=False,
+    fast_copy=False,
+    intern=False,
+    track_changes=False,
+    invariants=(),
+    check_types=False,
 ):
     r"""
     A class decorator that adds :term:`dunder methods` according to the
@@ -1455,6 +1667,15 @@ def attrs(
        *kw_only* now only applies to attributes defined in the current class,
        and respects attribute-level ``kw_only=False`` settings.
     .. versionadded:: 25.4.0 *force_kw_only*
+    .. versionadded:: 26.2.0 *compact_pickle*
+    .. versionadded:: 26.2.0 *fast_evolve*
+    .. versionadded:: 26.2.0 *fast_copy*
+    .. versionadded:: 26.2.0 *intern*
+    .. versionchanged:: 26.2.0
+       Reassigning hashed fields of mutable classes clears the cached hash.
+    .. versionadded:: 26.2.0 *track_changes*
+    .. versionadded:: 26.2.0 *invariants*
+    .. versionadded:: 26.2.0 *check_types*
     """
     if repr_ns is not None:
         import warnings
@@ -1559,8 +1780,19 @@ def attrs(
             ),
             on_setattr_hook=on_setattr,
             field_transformer=field_transformer,
+            added_compact_pickling=compact_pickle,
+            added_fast_evolve=fast_evolve,
+            added_fast_copy=fast_copy,
+            added_interning=intern,
+            added_change_tracking=track_changes,
+            invariants=_collect_invariants(cls, invariants),
+            added_type_checks=check_types,
         )
 
+        if track_changes and is_frozen:
+            msg = "track_changes can't be used with frozen classes."
+            raise ValueError(msg)
+
         if not props.is_hashable and cache_hash:
             msg = "Invalid value for cache_hash.  To use hash caching, hashing must be either explicitly or implicitly enabled."
             raise TypeError(msg)
@@ -1592,7 +1824,23 @@ def attrs(
         elif props.hashability is Hashability.UNHASHABLE:
             builder.make_unhashable()
 
-        if props.added_init:
+        if props.added_interning:
+            if not is_frozen:
+                msg = "intern can only be used with frozen classes."
+                raise ValueError(msg)
+            if not props.added_init:
+                msg = "intern can't be used with a custom __init__."
+                raise ValueError(msg)
+            if slots and not weakref_slot:
+                msg = "intern can't be used without a weakref slot."
+                raise ValueError(msg)
+            if compact_pickle or fast_evolve or fast_copy:
+                msg = "intern can't be combined with compact_pickle, fast_evolve, or fast_copy."
+                raise ValueError(msg)
+
+            builder.add_attrs_init()
+            builder.add_interning()
+        elif props.added_init:
             builder.add_init()
         else:
             builder.add_attrs_init()
@@ -1600,12 +1848,30 @@ def attrs(
                 msg = "Invalid value for cache_hash.  To use hash caching, init must be True."
                 raise TypeError(msg)
 
-        if PY_3_13_PLUS and not _has_own_attribute(cls, "__replace__"):
+        if props.added_fast_evolve:
+            if not props.added_init:
+                msg = "fast_evolve can't be used with a custom __init__."
+                raise ValueError(msg)
+
+            builder.add_fast_replace()
+        elif PY_3_13_PLUS and not _has_own_attribute(cls, "__replace__"):
             builder.add_replace()
 
+        if props.added_compact_pickling:
+            builder.add_compact_pickling()
+
         if match_args and not _has_own_attribute(cls, "__match_args__"):
             builder.add_match_args()
 
+        if props.added_fast_copy:
+            # Copying the fields would drop the state of built-in bases like
+            # the items of a dict or the args of an exception.
+            if any(c.__module__ == "builtins" for c in cls.__mro__[1:-1]):
+                msg = "fast_copy can't be used with subclasses of built-in types like dict or list."
+                raise ValueError(msg)
+
+            builder.add_copy()
+
         return builder.build_class()
 
     # maybe_cls's type depends on the usage of the decorator.  It's a class
@@ -1641,12 +1907,36 @@ def _generate_unique_filename(cls: type, func_name: str) -> str:
     )
 
 
+def _user_stacklevel() -> int:
+    """
+    Return the *stacklevel* for a warning that the caller emits such that it
+    points to the first frame outside of *attrs* and the code it generated.
+    """
+    level = 1
+    with contextlib.suppress(AttributeError, ValueError):
+        frame = sys._getframe(1)
+        while frame.f_back is not None and (
+            frame.f_globals.get("__name__", "").partition(".")[0]
+            in ("attr", "attrs")
+            or frame.f_code.co_filename.startswith("<attrs generated")
+        ):
+            frame = frame.f_back
+            level += 1
+
+    return level
+
+
+def _is_hashed(a: Attribute) -> bool:
+    """
+    Return whether the field *a* is part of the hash.
+    """
+    return a.hash is True or (a.hash is None and a.eq is True)
+
+
 def _make_hash_script(
     cls: type, attrs: list[Attribute], frozen: bool, cache_hash: bool
 ) -> tuple[str, dict]:
-    attrs = tuple(
-        a for a in attrs if a.hash is True or (a.hash is None and a.eq is True)
-    )
+    attrs = tuple(a for a in attrs if _is_hashed(a))
 
     tab = "        "
 
@@ -1739,17 +2029,252 @@ def __ne__(self, other):
     return not result
 
 
-def _make_eq_script(attrs: list) -> tuple[str, dict]:
+def _flatten_setters(on_setattr):
+    """
+    Return the hooks that *on_setattr* consists of, unpacking `setters.pipe`.
+    """
+    inner = getattr(on_setattr, "__attrs_setters__", None)
+    if inner is None:
+        return [on_setattr]
+
+    return [s for setter in inner for s in _flatten_setters(setter)]
+
+
+def _make_setattr_script(
+    attrs: list[Attribute],
+    cls_on_setattr,
+    invalidate_hash: bool,
+    track_changes: bool = False,
+    invariants: tuple = (),
+) -> tuple[str | None, dict, bool]:
+    """
+    Create the script of a __setattr__ that runs the on_setattr hooks of
+    *attrs* and, if *invalidate_hash* is True, clears the hash cache if a
+    hashed field is set.  It dispatches to a setter per field by name.  If
+    *track_changes* is True, it also records the index of the field in the
+    changes bitmask.
+
+    After fields that are validated on assignment are set, the class
+    *invariants* are checked.  If they fail, the old value is restored.
+
+    Return the script -- or None if no field needs special treatment --, its
+    globals, and whether any field has hooks.  Fields whose hooks are all
+    no-ops -- like `setters.validate` without a validator -- are set directly.
+
+    `setters.validate`, `setters.convert`, and pipes of them are inlined.
+    """
+    globs = {
+        "_config": _config,
+        "_object_setattr": _OBJ_SETATTR,
+        "_set_with_generator": _set_with_generator,
+        "_restore_field": _restore_field,
+        "NOTHING": NOTHING,
+        "attr_dict": {a.name: a for a in attrs},
+    }
+    invariant_calls = _fmt_invariant_calls(invariants, globs)
+    lines = []
+    names = []
+    has_hooks = False
+    for i, a in enumerate(attrs):
+        on_setattr = a.on_setattr or cls_on_setattr
+        hooked = on_setattr and on_setattr is not setters.NO_OP
+        invalidates = invalidate_hash and _is_hashed(a)
+        if not (hooked or invalidates or track_changes):
+            continue
+
+        attr_name = f"__attr_{a.name}"
+        globs[attr_name] = a
+        body = []
+        is_set = False
+        if invalidates:
+            body.append(f"_object_setattr(self, '{_HASH_CACHE_FIELD}', None)")
+
+        hooks = _flatten_setters(on_setattr) if hooked else []
+        has_hooks = has_hooks or bool(hooks)
+        for j, hook in enumerate(hooks):
+            if hook is setters.validate:
+                if a.validator is not None:
+                    val_name = f"__attr_validator_{a.name}"
+                    globs[val_name] = _compile_validator(a.validator)
+                    body.extend(
+                        [
+                            "if _config._run_validators is True:",
+                            f"    {val_name}(self, {attr_name}, val)",
+                        ]
+                    )
+            elif hook is setters.convert:
+                if a.converter is not None:
+                    converter = (
+                        a.converter
+                        if isinstance(a.converter, Converter)
+                        else Converter(a.converter)
+                    )
+                    globs[converter._get_global_name(a.name)] = (
+                        converter.converter
+                    )
+                    body.append(
+                        f"val = {converter._fmt_converter_call(a.name, 'val')}"
+                    )
+            else:
+                hook_name = f"__attr_on_setattr_{a.name}_{j}"
+                globs[hook_name] = hook
+                if len(hooks) == 1:
+                    # Only stand-alone hooks may be generators.
+                    is_gen_name = f"__attr_on_setattr_is_gen_{a.name}"
+                    globs[is_gen_name] = _lazy_is_generator(hook)
+                    body.extend(
+                        [
+                            f"if {is_gen_name}():",
+                            f"    _set_with_generator(self, name, {attr_name}, {hook_name}, val)",
+                            "else:",
+                            f"    _object_setattr(self, name, {hook_name}(self, {attr_name}, val))",
+                        ]
+                    )
+                    is_set = True
+                else:
+                    body.append(f"val = {hook_name}(self, {attr_name}, val)")
+
+        checks_invariants = bool(invariant_calls) and setters.validate in hooks
+        if not (body or track_changes or checks_invariants):
+            # All hooks are no-ops for this field.
+            continue
+
+        if checks_invariants:
+            body.extend(
+                [
+                    "_old = getattr(self, name, NOTHING)",
+                    "_object_setattr(self, name, val)",
+                    "if _config._run_validators is True:",
+                    "    try:",
+                    *(f"        {line}" for line in invariant_calls),
+                    "    except BaseException:",
+                    "        _restore_field(self, name, _old)",
+                    "        raise",
+                ]
+            )
+        elif not is_set:
+            body.append("_object_setattr(self, name, val)")
+        if track_changes:
+            body.append(
+                f"_object_setattr(self, '{_CHANGES_FIELD}', self.{_CHANGES_FIELD} | {1 << i})"
+            )
+
+        setter_name = f"__attrs_setattr_{a.name}"
+        names.append((a.name, setter_name))
+        lines.append(f"def {setter_name}(self, name, val):")
+        lines.extend(f"    {line}" for line in body)
+
+    if not names:
+        return None, globs, has_hooks
+
+    # Dispatch through a dict to keep assignments to wide classes O(1).
+    globs["_setattr_dispatch"] = {}
+    lines.extend(
+        [
+            "def __setattr__(self, name, val):",
+            "    setter = _setattr_dispatch.get(name)",
+            "    if setter is None:",
+            "        _object_setattr(self, name, val)",
+            "    else:",
+            "        setter(self, name, val)",
+            "_setattr_dispatch.update({",
+            *(f"    '{name}': {setter_name}," for name, setter_name in names),
+            "})",
+        ]
+    )
+
+    return "\n".join(lines), globs, has_hooks
+
+
+def _restore_field(inst, name, old):
+    """
+    Set the field *name* of *inst* back to *old* -- or unset it if *old* is
+    NOTHING.
+    """
+    if old is NOTHING:
+        object.__delattr__(inst, name)
+    else:
+        _OBJ_SETATTR(inst, name, old)
+
+
+def _fmt_invariant_calls(invariants, globs):
+    """
+    Return the lines that check *invariants* on ``self`` and add them to
+    *globs*.
+    """
+    lines = []
+    for i, invariant in enumerate(invariants):
+        name = f"__attrs_invariant_{i}"
+        globs[name] = invariant
+        lines.append(f"{name}(self)")
+
+    return lines
+
+
+def _collect_invariants(cls, invariants):
+    """
+    Return the invariants of the *attrs* base classes of *cls* followed by
+    *invariants*, without duplicates.
+    """
+    for invariant in invariants:
+        if not callable(invariant):
+            msg = f"Invariants must be callable (got {invariant!r})."
+            raise TypeError(msg)
+
+    collected = []
+    for base in reversed(cls.__mro__[1:-1]):
+        props = base.__dict__.get("__attrs_props__")
+        if props is not None:
+            collected.extend(i for i in props.invariants if i not in collected)
+
+    collected.extend(i for i in invariants if i not in collected)
+
+    return tuple(collected)
+
+
+def _set_with_generator(inst, name, a, hook, val):
+    """
+    Run the generator on_setattr *hook*, set the value it yields, and resume
+    it.
+    """
+    gen = hook(inst, a, val)
+    _OBJ_SETATTR(inst, name, next(gen))
+    try:
+        next(gen)
+    except StopIteration:
+        return
+
+    gen.close()
+    msg = "Generator on_setattr hook yielded more than once."
+    raise RuntimeError(msg)
+
+
+def _make_eq_script(attrs: list, cache_hash: bool = False) -> tuple[str, dict]:
     """
     Create __eq__ method for *cls* with *attrs*.
+
+    If *cache_hash* is True, instances whose hashes are both cached and differ
+    are unequal without comparing their fields.
     """
     attrs = [a for a in attrs if a.eq]
 
     lines = [
         "def __eq__(self, other):",
+        "    if other is self:",
+        "        return True",
         "    if other.__class__ is not self.__class__:",
         "        return NotImplemented",
     ]
+    if cache_hash and attrs:
+        lines.extend(
+            [
+                f"    _h = self.{_HASH_CACHE_FIELD}",
+                "    if _h is not None:",
+                f"        _other_h = other.{_HASH_CACHE_FIELD}",
+                "        if _other_h is not None and _h != _other_h:",
+                "            return False",
+            ]
+        )
 
     globs = {}
     if attrs:
@@ -2003,76 +2528,555 @@ def fields_dict(cls):
 
 def validate(inst):
     """
-    Validate all attributes on *inst* that have a validator.
+    Validate all attributes on *inst* that have a validator and check the
+    invariants of its class.
 
     Leaves all exceptions through.
 
     Args:
         inst: Instance of a class with *attrs* attributes.
+
+    .. versionchanged:: 26.2.0
+       Uses a validation function that is generated once per class.
     """
     if _config._run_validators is False:
         return
 
-    for a in fields(inst.__class__):
-        v = a.validator
-        if v is not None:
-            v(inst, a, getattr(inst, a.name))
+    cls = inst.__class__
+    v = cls.__dict__.get("__attrs_validate__")
+    if v is None:
+        v = _get_validate(cls)
 
+    v(inst)
 
-def _is_slot_attr(a_name, base_attr_map):
-    """
-    Check if the attribute name comes from a slot class.
+
+def validate_many(instances, *, executor=None, chunksize=1024):
     """
-    cls = base_attr_map.get(a_name)
-    return cls and "__slots__" in cls.__dict__
+    Like `attrs.validate`, but validate all *instances* and collect the
+    failures instead of raising the first one.
+
+    The validation function of each class is looked up only once for runs of
+    instances of the same class.
+
+    If an *executor* is passed, the instances are split into chunks of
+    *chunksize* that are validated by it.  Chunks for a
+    `concurrent.futures.ProcessPoolExecutor` contain the classes and the
+    field values of the instances -- instead of pickled instances -- that are
+    turned back into instances in the worker processes without calling
+    ``__init__``.  Their classes must be importable there.  Exceptions that
+    can't be pickled to be sent back are replaced by
+    `attrs.exceptions.UnpicklableValidationError`.  Thread pools validate the
+    instances themselves, which only runs in parallel on free-threaded builds
+    of Python.
 
+    Args:
+        instances (~collections.abc.Iterable):
+            Instances of classes with *attrs* attributes.
 
-def _make_init_script(
-    cls,
-    attrs,
-    pre_init,
-    pre_init_has_args,
-    post_init,
-    frozen,
-    slots,
-    cache_hash,
-    base_attr_map,
-    is_exc,
-    cls_on_setattr,
-    attrs_init,
-) -> tuple[str, dict, dict]:
-    has_cls_on_setattr = (
-        cls_on_setattr is not None and cls_on_setattr is not setters.NO_OP
-    )
+        executor (concurrent.futures.Executor | None):
+            The executor that validates the chunks.  If None, the instances
+            are validated one after another in the current thread.
 
-    if frozen and has_cls_on_setattr:
-        msg = "Frozen classes can't use on_setattr."
+        chunksize (int): How many instances are validated per task.
+
+    Returns:
+        list[tuple[int, str | None, Exception]]:
+            The failures, sorted by the position of the instance in
+            *instances*, the name of the field whose validator failed -- None
+            for invariants --, and the exception.  Empty if all instances are
+            valid.
+
+    Raises:
+        ValueError: If *chunksize* is smaller than 1.
+
+    .. versionadded:: 26.2.0
+    """
+    if chunksize < 1:
+        msg = "chunksize must be at least 1."
         raise ValueError(msg)
 
-    needs_cached_setattr = cache_hash or frozen
-    filtered_attrs = []
-    attr_dict = {}
-    for a in attrs:
-        if not a.init and a.default is NOTHING:
-            continue
+    if _config._run_validators is False:
+        return []
 
-        filtered_attrs.append(a)
-        attr_dict[a.name] = a
+    if executor is None:
+        return _validate_chunk(0, instances)
 
-        if a.on_setattr is not None:
-            if frozen is True and a.on_setattr is not setters.NO_OP:
-                msg = "Frozen classes can't use on_setattr."
-                raise ValueError(msg)
+    import concurrent.futures
+    import os
 
-            needs_cached_setattr = True
-        elif has_cls_on_setattr and a.on_setattr is not setters.NO_OP:
-            needs_cached_setattr = True
+    pack = isinstance(executor, concurrent.futures.ProcessPoolExecutor)
+    window = 2 * (os.cpu_count() or 1)
+    instances = iter(instances)
+    start = 0
+    pending = set()
+    failures = []
+    try:
+        while True:
+            chunk = list(itertools.islice(instances, chunksize))
+            if chunk:
+                pending.add(
+                    executor.submit(
+                        _validate_packed_chunk, start, *_pack_chunk(chunk)
+                    )
+                    if pack
+                    else executor.submit(_validate_chunk, start, chunk)
+                )
+                start += len(chunk)
+            elif not pending:
+                break
 
-    script, globs, annotations = _attrs_to_init_script(
-        filtered_attrs,
-        frozen,
-        slots,
-        pre_init,
+            if not chunk or len(pending) >= window:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for f in done:
+                    failures.extend(f.result())
+    except BaseException:
+        for f in pending:
+            f.cancel()
+        raise
+
+    failures.sort(key=lambda f: f[0])
+
+    return failures
+
+
+def _validate_chunk(start, instances):
+    """
+    Validate *instances* and return their failures, numbering them from
+    *start*.
+    """
+    failures = []
+    last_cls = v = None
+    for i, inst in enumerate(instances, start):
+        cls = inst.__class__
+        if cls is not last_cls:
+            v = _get_validate(cls)
+            last_cls = cls
+
+        try:
+            v(inst)
+        except Exception as e:  # noqa: BLE001
+            found = _collect_failures(inst)
+            failures.extend(
+                [(i, name, exc) for name, exc in found] or [(i, None, e)]
+            )
+
+    return failures
+
+
+def _collect_failures(inst):
+    """
+    Run all validators and invariants of *inst* -- one by one -- and return
+    the names of the fields whose validators failed and the exceptions.
+    """
+    rv = []
+    for a in fields(inst.__class__):
+        if a.validator is None:
+            continue
+
+        e = _failure_of(
+            _compile_validator(a.validator), inst, a, getattr(inst, a.name)
+        )
+        if e is not None:
+            rv.append((a.name, e))
+
+    for invariant in inst.__class__.__attrs_props__.invariants:
+        e = _failure_of(invariant, inst)
+        if e is not None:
+            rv.append((None, e))
+
+    return rv
+
+
+def _failure_of(check, *args):
+    """
+    Call *check* with *args* and return the exception it raises -- or None.
+    """
+    try:
+        check(*args)
+    except Exception as e:  # noqa: BLE001
+        return e
+
+    return None
+
+
+def _pack_chunk(chunk):
+    """
+    Return the classes of the instances in *chunk* and rows of their indexes
+    in the classes and their field values.
+
+    Instances that can't be recreated from their field values -- because
+    they're interned or because fields are missing -- are passed as is, with
+    an index of -1.
+    """
+    classes = {}
+    rows = []
+    for inst in chunk:
+        cls = inst.__class__
+        spec = classes.get(cls)
+        if spec is None:
+            props = cls.__attrs_props__
+            spec = classes[cls] = (
+                len(classes),
+                None
+                if props.added_interning
+                else tuple(
+                    a.name for a in fields(cls) if a.name != "__weakref__"
+                ),
+            )
+
+        ci, names = spec
+        if names is None:
+            rows.append((-1, inst))
+            continue
+
+        try:
+            rows.append((ci, *[getattr(inst, name) for name in names]))
+        except AttributeError:
+            rows.append((-1, inst))
+
+    return tuple(classes), rows
+
+
+def _validate_packed_chunk(start, classes, rows):
+    """
+    Recreate the instances of a chunk that has been created by `_pack_chunk`
+    and validate them.
+    """
+    from_values = [_get_compact_unpickler(cls)[1] for cls in classes]
+
+    def rebuild():
+        for ci, *values in rows:
+            if ci < 0:
+                yield values[0]
+            else:
+                yield from_values[ci](classes[ci], *values)
+
+    return [
+        (i, name, _picklable_failure(e, name))
+        for i, name, e in _validate_chunk(start, rebuild())
+    ]
+
+
+def _picklable_failure(e, field):
+    """
+    Return the exception *e* if it can be sent back from a worker process --
+    otherwise an `UnpicklableValidationError` that describes it.
+    """
+    import pickle
+
+    try:
+        pickle.loads(pickle.dumps(e))  # noqa: S301 -- our own bytes
+    except Exception:  # noqa: BLE001
+        cls = e.__class__
+        return UnpicklableValidationError(
+            f"{cls.__module__}.{cls.__qualname__}", str(e), field
+        )
+
+    return e
+
+
+def _get_validate(cls):
+    """
+    Return the validation function of *cls* -- creating and caching it if
+    necessary.
+    """
+    v = cls.__dict__.get("__attrs_validate__")
+    if v is None:
+        v = cls.__attrs_validate__ = _make_validate(cls)
+
+    return v
+
+
+def _make_validate(cls):
+    """
+    Create a function that runs the validators of all fields of *cls* that
+    have one and its invariants.
+    """
+    globs = {}
+    lines = ["def __attrs_validate__(self):"]
+    for a in fields(cls):
+        if a.validator is None:
+            continue
+
+        val_name = f"__attr_validator_{a.name}"
+        attr_name = f"__attr_{a.name}"
+        globs[val_name] = _compile_validator(a.validator)
+        globs[attr_name] = a
+        lines.append(f"    {val_name}(self, {attr_name}, self.{a.name})")
+
+    lines.extend(
+        f"    {line}"
+        for line in _fmt_invariant_calls(cls.__attrs_props__.invariants, globs)
+    )
+    if len(lines) == 1:
+        lines.append("    pass")
+
+    return _linecache_and_compile(
+        "\n".join(lines), _generate_unique_filename(cls, "validate"), globs
+    )["__attrs_validate__"]
+
+
+def _bookkeeping_defaults(cls):
+    """
+    Return the internal attributes -- and their initial values -- that an
+    instance of *cls* needs if it's created without calling ``__init__``.
+    """
+    props = getattr(cls, "__attrs_props__", None)
+    if props is None:
+        return {}
+
+    rv = {}
+    if props.hashability is ClassProps.Hashability.HASHABLE_CACHED:
+        rv[_HASH_CACHE_FIELD] = None
+    if props.added_change_tracking:
+        rv[_CHANGES_FIELD] = 0
+
+    return rv
+
+
+_BUFFER_TYPES = (bytes, bytearray, memoryview)
+_BUFFER_TYPE_NAMES = ("bytes", "bytearray", "memoryview")
+
+
+def _is_buffer_field(a):
+    """
+    Check whether *a* is annotated as `bytes`, `bytearray`, or `memoryview`.
+    """
+    t = a.type
+    # typing.Annotated
+    t = getattr(t, "__origin__", t) if hasattr(t, "__metadata__") else t
+
+    return t in _BUFFER_TYPES or t in _BUFFER_TYPE_NAMES
+
+
+def _make_to_out_of_band():
+    """
+    Create a function that wraps buffers in a `pickle.PickleBuffer` so pickle
+    protocol 5 can transfer them out-of-band.
+
+    Wrapped in a factory, so `pickle` is only imported if it's needed.
+    """
+    from pickle import PickleBuffer
+
+    def to_out_of_band(value):
+        if isinstance(value, memoryview) and not value.c_contiguous:
+            return value.tobytes()
+
+        try:
+            return PickleBuffer(value)
+        except TypeError:
+            return value
+
+    return to_out_of_band
+
+
+def _to_in_band(value):
+    """
+    memoryviews can't be pickled before protocol 5, so copy them into bytes.
+    """
+    if isinstance(value, memoryview):
+        return value.tobytes()
+
+    return value
+
+
+def _from_buffer(value):
+    """
+    Buffers that have been transferred out-of-band arrive as whatever object
+    has been passed to `pickle.loads` -- make sure it's at least a
+    `memoryview`.
+
+    Annotations aren't enforced, so values that don't support the buffer
+    protocol -- and thus have been pickled in-band -- are returned as is.
+    """
+    if value is None or isinstance(value, _BUFFER_TYPES):
+        return value
+
+    try:
+        return memoryview(value)
+    except TypeError:
+        return value
+
+
+def _make_compact_reduce(cls, attrs, unpickle, args, globs):
+    """
+    Create a ``__reduce_ex__`` that pickles instances of *cls* as a call to
+    *unpickle* with a flat tuple of *args* -- the source code of the leading
+    arguments that are looked up in *globs* -- and the values of *attrs*.
+
+    Fields that are annotated as buffers are transferred out-of-band if the
+    pickle protocol is 5 or higher.
+    """
+    attrs = [a for a in attrs if a.name != "__weakref__"]
+    values = "".join(f"self.{a.name}, " for a in attrs)
+    lines = [
+        "def __reduce_ex__(self, protocol):",
+        "    if self.__class__ is not __class__:",
+        "        return _object_reduce_ex(self, protocol)",
+    ]
+    globs = {
+        **globs,
+        "_unpickle": unpickle,
+        "_object_reduce_ex": object.__reduce_ex__,
+    }
+
+    if any(_is_buffer_field(a) for a in attrs):
+        globs["_to_out_of_band"] = _make_to_out_of_band()
+        globs["_to_in_band"] = _to_in_band
+
+        def wrap(fn):
+            return "".join(
+                f"{fn}(self.{a.name}), "
+                if _is_buffer_field(a)
+                else f"self.{a.name}, "
+                for a in attrs
+            )
+
+        lines += [
+            "    if protocol >= 5:",
+            f"        return _unpickle, ({args}, {wrap('_to_out_of_band')})",
+            f"    return _unpickle, ({args}, {wrap('_to_in_band')})",
+        ]
+    else:
+        lines.append(f"    return _unpickle, ({args}, {values})")
+
+    lines.append("return __reduce_ex__,")
+
+    (reduce_ex,) = _compile_methods(
+        cls, lines, _generate_unique_filename(cls, "reduce"), globs
+    )
+
+    return reduce_ex
+
+
+def _make_compact_unpickler(cls):
+    """
+    Create a function that creates an instance of *cls* from the values of its
+    fields -- without calling ``__init__``.
+    """
+    attrs = [a for a in fields(cls) if a.name != "__weakref__"]
+    args = "".join(f", _v{i}" for i in range(len(attrs)))
+    lines = [
+        f"def from_values(cls{args}):",
+        "    inst = cls.__new__(cls)",
+    ]
+    lines.extend(
+        f"    _setattr(inst, '{a.name}', _from_buffer(_v{i}))"
+        if _is_buffer_field(a)
+        else f"    _setattr(inst, '{a.name}', _v{i})"
+        for i, a in enumerate(attrs)
+    )
+    lines.extend(
+        f"    _setattr(inst, '{name}', {value!r})"
+        for name, value in _bookkeeping_defaults(cls).items()
+    )
+    lines.append("    return inst")
+
+    return _linecache_and_compile(
+        "\n".join(lines),
+        _generate_unique_filename(cls, "compact unpickle"),
+        {"_setattr": _OBJ_SETATTR, "_from_buffer": _from_buffer},
+    )["from_values"]
+
+
+def _get_compact_unpickler(cls):
+    """
+    Return the current pickle version of *cls* and the function that creates
+    instances from field values -- creating and caching it if necessary.
+    """
+    try:
+        return cls.__dict__["__attrs_compact_unpickler__"]
+    except KeyError:
+        rv = cls.__attrs_compact_unpickler__ = (
+            getattr(cls, "__attrs_pickle_version__", 0),
+            _make_compact_unpickler(cls),
+        )
+
+        return rv
+
+
+def _compact_unpickle(cls, version, *values):
+    """
+    Recreate an instance of *cls* that has been pickled using
+    *compact_pickle*.
+
+    If *version* isn't the current ``__attrs_pickle_version__`` of *cls*, the
+    values are passed through its ``__attrs_migrate_pickle__`` classmethod
+    first.
+    """
+    current, from_values = _get_compact_unpickler(cls)
+
+    if version != current:
+        migrate = getattr(cls, "__attrs_migrate_pickle__", None)
+        if migrate is None:
+            import pickle
+
+            msg = f"Can't unpickle version {version!r} of {cls!r} (current version: {current!r}) without an __attrs_migrate_pickle__ classmethod."
+            raise pickle.UnpicklingError(msg)
+
+        values = migrate(version, values)
+
+    return from_values(cls, *values)
+
+
+def _is_slot_attr(a_name, base_attr_map):
+    """
+    Check if the attribute name comes from a slot class.
+    """
+    cls = base_attr_map.get(a_name)
+    return cls and "__slots__" in cls.__dict__
+
+
+def _make_init_script(
+    cls,
+    attrs,
+    pre_init,
+    pre_init_has_args,
+    post_init,
+    frozen,
+    slots,
+    cache_hash,
+    base_attr_map,
+    is_exc,
+    cls_on_setattr,
+    attrs_init,
+    track_changes=False,
+    invariants=(),
+) -> tuple[str, dict, dict]:
+    has_cls_on_setattr = (
+        cls_on_setattr is not None and cls_on_setattr is not setters.NO_OP
+    )
+
+    if frozen and has_cls_on_setattr:
+        msg = "Frozen classes can't use on_setattr."
+        raise ValueError(msg)
+
+    needs_cached_setattr = cache_hash or frozen or track_changes
+    filtered_attrs = []
+    attr_dict = {}
+    for a in attrs:
+        if not a.init and a.default is NOTHING:
+            continue
+
+        filtered_attrs.append(a)
+        attr_dict[a.name] = a
+
+        if a.on_setattr is not None:
+            if frozen is True and a.on_setattr is not setters.NO_OP:
+                msg = "Frozen classes can't use on_setattr."
+                raise ValueError(msg)
+
+            needs_cached_setattr = True
+        elif has_cls_on_setattr and a.on_setattr is not setters.NO_OP:
+            needs_cached_setattr = True
+
+    script, globs, annotations = _attrs_to_init_script(
+        filtered_attrs,
+        frozen,
+        slots,
+        pre_init,
         pre_init_has_args,
         post_init,
         cache_hash,
@@ -2081,6 +3085,8 @@ def _make_init_script(
         needs_cached_setattr,
         has_cls_on_setattr,
         "__attrs_init__" if attrs_init else "__init__",
+        track_changes,
+        invariants,
     )
     if cls.__module__ in sys.modules:
         # This makes typing.get_type_hints(CLS.__init__) resolve string types.
@@ -2096,6 +3102,371 @@ def _make_init_script(
     return script, globs, annotations
 
 
+def _fmt_value(converter, attr_name, value_var):
+    """
+    Return the source code of *value_var*, passed through *converter* if it's
+    not None.
+    """
+    if converter is None:
+        return value_var
+
+    return converter._fmt_converter_call(attr_name, value_var)
+
+
+def _make_fast_replace(
+    cls,
+    attrs,
+    pre_init,
+    post_init,
+    cache_hash,
+    track_changes=False,
+    invariants=(),
+):
+    """
+    Create a ``__replace__`` for *cls* that copies unchanged fields from the
+    original instance and only converts and validates the changed ones.
+    """
+    attr_dict = {a.name: a for a in attrs}
+    globs = {
+        "_config": _config,
+        "_evolve": evolve,
+        "_cached_setattr_get": _OBJ_SETATTR.__get__,
+        "_aliases": frozenset(a.alias for a in attrs if a.init),
+        "attr_dict": attr_dict,
+    }
+    lines = [
+        "if inst.__class__ is not __class__:",
+        "    return _evolve(inst, **changes)",
+        "if not _aliases.issuperset(changes):",
+        "    arg = next(k for k in changes if k not in _aliases)",
+        "    msg = f'{__class__.__qualname__}.__init__() got an unexpected keyword argument {arg!r}'",
+        "    raise TypeError(msg)",
+        "self = __class__.__new__(__class__)",
+        "_setattr = _cached_setattr_get(self)",
+    ]
+    if track_changes:
+        lines.append(f"_setattr('{_CHANGES_FIELD}', 0)")
+    if pre_init:
+        lines.append("self.__attrs_pre_init__()")
+
+    validations = []
+    for a in attrs:
+        if not a.init and a.default is NOTHING:
+            continue
+
+        if a.converter is not None and not isinstance(a.converter, Converter):
+            converter = Converter(a.converter)
+        else:
+            converter = a.converter
+
+        if converter is not None:
+            globs[converter._get_global_name(a.name)] = converter.converter
+
+        if a.validator is not None:
+            val_name = "__attr_validator_" + a.name
+            attr_name = "__attr_" + a.name
+            globs[val_name] = _compile_validator(a.validator)
+            globs[attr_name] = a
+            validate = f"{val_name}(self, {attr_name}, self.{a.name})"
+            if a.init:
+                validations.extend(
+                    [f"    if '{a.alias}' in changes:", f"        {validate}"]
+                )
+            else:
+                validations.append(f"    {validate}")
+
+        if a.init:
+            lines.extend(
+                [
+                    f"if '{a.alias}' in changes:",
+                    f"    _setattr('{a.name}', {_fmt_value(converter, a.name, f'changes[{a.alias!r}]')})",
+                    "else:",
+                    f"    _setattr('{a.name}', inst.{a.name})",
+                ]
+            )
+        elif isinstance(a.default, Factory):
+            factory_name = _INIT_FACTORY_PAT % (a.name,)
+            globs[factory_name] = a.default.factory
+            maybe_self = "self" if a.default.takes_self else ""
+            lines.append(
+                f"_setattr('{a.name}', {_fmt_value(converter, a.name, f'{factory_name}({maybe_self})')})"
+            )
+        else:
+            lines.append(
+                f"_setattr('{a.name}', {_fmt_value(converter, a.name, f'attr_dict[{a.name!r}].default')})"
+            )
+
+    validations.extend(
+        f"    {line}" for line in _fmt_invariant_calls(invariants, globs)
+    )
+    if validations:
+        lines.append("if _config._run_validators is True:")
+        lines.extend(validations)
+
+    if post_init:
+        lines.append("self.__attrs_post_init__()")
+
+    if cache_hash:
+        lines.append(f"_setattr('{_HASH_CACHE_FIELD}', None)")
+
+    if track_changes and (pre_init or post_init):
+        lines.append(f"_setattr('{_CHANGES_FIELD}', 0)")
+
+    lines.append("return self")
+
+    (replace,) = _compile_methods(
+        cls,
+        [
+            "def __replace__(inst, /, **changes):",
+            *(f"    {line}" for line in lines),
+            "return __replace__,",
+        ],
+        _generate_unique_filename(cls, "replace"),
+        globs,
+    )
+
+    return replace
+
+
+def _make_copy_methods(
+    cls, attrs, is_slotted, cache_hash, base_attr_map, track_changes=False
+):
+    """
+    Create ``__copy__`` and ``__deepcopy__`` for *cls* that copy the fields
+    directly instead of going through ``__reduce_ex__``.
+
+    ``__deepcopy__`` shares values of atomic types and -- if the field is
+    annotated as such -- instances of frozen *attrs* classes.
+    """
+    from copy import deepcopy
+
+    # Fields whose values are shared if they're instances of a frozen attrs
+    # class that the field is annotated with.
+    frozen_types = {}
+    for a in attrs:
+        t = a.type
+        props = getattr(t, "__attrs_props__", None)
+        if isinstance(t, type) and props is not None and props.is_frozen:
+            frozen_types[a.name] = t
+
+    globs = {
+        "_cached_setattr_get": _OBJ_SETATTR.__get__,
+        "_copy_via_reduce": _copy_via_reduce,
+        "_deepcopy": deepcopy,
+        "_deepcopy_dict": _deepcopy_dict,
+        "_frozen_types": frozen_types,
+        "_ATOMIC_TYPES": _ATOMIC_TYPES,
+    }
+    head = [
+        "inst = __class__.__new__(__class__)",
+        "_setattr = _cached_setattr_get(inst)",
+    ]
+    copy_lines = []
+    deepcopy_lines = ["memo[id(self)] = inst"]
+    if not is_slotted:
+        # Copy the whole __dict__ because it can carry more than the fields.
+        copy_lines.append("inst.__dict__.update(self.__dict__)")
+        deepcopy_lines.append(
+            "_deepcopy_dict(self.__dict__, inst.__dict__, memo, _frozen_types)"
+        )
+
+    for a in attrs:
+        if a.name == "__weakref__" or not (
+            is_slotted or _is_slot_attr(a.name, base_attr_map)
+        ):
+            continue
+
+        copy_lines.append(f"_setattr('{a.name}', self.{a.name})")
+
+        if a.name in frozen_types:
+            type_name = f"__attr_type_{a.name}"
+            globs[type_name] = frozen_types[a.name]
+            shareable = (
+                f"_v.__class__ is {type_name} or _v.__class__ in _ATOMIC_TYPES"
+            )
+        else:
+            shareable = "_v.__class__ in _ATOMIC_TYPES"
+
+        deepcopy_lines.extend(
+            [
+                f"_v = self.{a.name}",
+                f"_setattr('{a.name}', _v if {shareable} else _deepcopy(_v, memo))",
+            ]
+        )
+
+    tail = []
+    if cache_hash:
+        tail.append(f"_setattr('{_HASH_CACHE_FIELD}', None)")
+    if track_changes:
+        tail.append(f"_setattr('{_CHANGES_FIELD}', self.{_CHANGES_FIELD})")
+    tail.append("return inst")
+
+    return _compile_methods(
+        cls,
+        [
+            "def __copy__(self):",
+            "    if self.__class__ is not __class__:",
+            "        return _copy_via_reduce(self, None)",
+            *(f"    {line}" for line in head + copy_lines + tail),
+            "def __deepcopy__(self, memo):",
+            "    if self.__class__ is not __class__:",
+            "        return _copy_via_reduce(self, memo)",
+            *(f"    {line}" for line in head + deepcopy_lines + tail),
+            "return __copy__, __deepcopy__",
+        ],
+        _generate_unique_filename(cls, "copy"),
+        globs,
+    )
+
+
+def _deepcopy_dict(src, dst, memo, frozen_types):
+    """
+    Deep-copy the items of the instance dictionary *src* into *dst*.
+
+    Values of atomic types and instances of the frozen attrs classes in
+    *frozen_types* -- by field name -- are shared.
+    """
+    from copy import deepcopy
+
+    for k, v in src.items():
+        dst[k] = (
+            v
+            if v.__class__ in _ATOMIC_TYPES
+            or v.__class__ is frozen_types.get(k)
+            else deepcopy(v, memo)
+        )
+
+
+def _copy_via_reduce(inst, memo):
+    """
+    Copy *inst* the way `copy` copies instances of classes that don't have
+    ``__copy__`` and ``__deepcopy__`` -- deeply if *memo* isn't None.
+
+    Used for subclasses that don't copy fast themselves, so it honors the
+    whole reduce value -- including the arguments and the items of list and
+    dict bases.
+    """
+    from copy import deepcopy
+
+    deep = memo is not None
+    func, args, state, listitems, dictitems, state_setter = (
+        *inst.__reduce_ex__(4),
+        None,
+        None,
+        None,
+        None,
+    )[:6]
+    if deep and args:
+        args = deepcopy(args, memo)
+    new = func(*args)
+    if deep:
+        memo[id(inst)] = new
+
+    if state is not None:
+        if deep:
+            state = deepcopy(state, memo)
+        if state_setter is not None:
+            state_setter(new, state)
+        elif hasattr(new, "__setstate__"):
+            new.__setstate__(state)
+        else:
+            if isinstance(state, tuple) and len(state) == 2:
+                state, slot_state = state
+            else:
+                slot_state = None
+            if state:
+                new.__dict__.update(state)
+            if slot_state:
+                for name, value in slot_state.items():
+                    _OBJ_SETATTR(new, name, value)
+
+    if listitems is not None:
+        for item in listitems:
+            new.append(deepcopy(item, memo) if deep else item)
+    if dictitems is not None:
+        for key, value in dictitems:
+            if deep:
+                new[deepcopy(key, memo)] = deepcopy(value, memo)
+            else:
+                new[key] = value
+
+    return new
+
+
+def _make_intern_methods(cls, attrs, table):
+    """
+    Create ``__new__`` and ``__reduce_ex__`` for *cls* that return canonical
+    instances from the intern *table*.
+
+    Instances are looked up by the values of their fields *and* their
+    classes, so that -- for example -- ``C(1)`` and ``C(1.0)`` stay distinct.
+
+    Instances of subclasses aren't interned.  Since interned classes only
+    have ``__attrs_init__``, it's called for subclasses without an
+    ``__init__`` of their own.
+    """
+    names = [a.name for a in attrs if a.name != "__weakref__"]
+    key = "".join(f"inst.{name}, inst.{name}.__class__, " for name in names)
+    values = "".join(f"self.{name}, " for name in names)
+    globs = {
+        "_object_init": object.__init__,
+        "_object_new": object.__new__,
+        "_reduce_uninterned": _reduce_uninterned,
+        "_unpickle_interned": _unpickle_interned,
+        "_setdefault": table.setdefault,
+    }
+
+    return _compile_methods(
+        cls,
+        [
+            "def __new__(cls, *args, **kwargs):",
+            "    inst = _object_new(cls)",
+            "    if cls is not __class__:",
+            "        if cls.__init__ is _object_init:",
+            "            inst.__attrs_init__(*args, **kwargs)",
+            "        return inst",
+            "    inst.__attrs_init__(*args, **kwargs)",
+            f"    return _setdefault(({key}), inst)",
+            "def __reduce_ex__(self, protocol):",
+            "    if self.__class__ is not __class__:",
+            "        return _reduce_uninterned(self, protocol)",
+            f"    return _unpickle_interned, (__class__, ({values}))",
+            "return __new__, __reduce_ex__",
+        ],
+        _generate_unique_filename(cls, "intern"),
+        globs,
+    )
+
+
+def _reduce_uninterned(inst, protocol):
+    """
+    Reduce *inst* -- an instance of a subclass of an interned class -- such
+    that it's recreated without calling the interning ``__new__``.
+    """
+    rv = object.__reduce_ex__(inst, protocol)
+    if rv[0] is copyreg.__newobj__:
+        return (object.__new__, *rv[1:])
+
+    return rv
+
+
+def _unpickle_interned(cls, values):
+    """
+    Return the canonical instance of the interned class *cls* whose fields
+    have *values* -- without calling ``__attrs_init__``.
+    """
+    inst = object.__new__(cls)
+    names = [a.name for a in fields(cls) if a.name != "__weakref__"]
+    for name, value in zip(names, values, strict=True):
+        _OBJ_SETATTR(inst, name, value)
+    for name, value in _bookkeeping_defaults(cls).items():
+        _OBJ_SETATTR(inst, name, value)
+
+    key = tuple(x for value in values for x in (value, value.__class__))
+
+    return cls.__attrs_intern_table__.setdefault(key, inst)
+
+
 def _setattr(attr_name: str, value_var: str, has_on_setattr: bool) -> str:
     """
     Use the cached object.setattr to set *attr_name* to *value_var*.
@@ -2197,6 +3568,8 @@ def _attrs_to_init_script(
     needs_cached_setattr: bool,
     has_cls_on_setattr: bool,
     method_name: str,
+    track_changes: bool = False,
+    invariants: tuple = (),
 ) -> tuple[str, dict, dict]:
     """
     Return a script of an initializer for *attrs*, a dict of globals, and
@@ -2234,8 +3607,12 @@ def _attrs_to_init_script(
             attrs_to_validate.append(a)
 
         attr_name = a.name
-        has_on_setattr = a.on_setattr is not None or (
-            a.on_setattr is not setters.NO_OP and has_cls_on_setattr
+        has_on_setattr = (
+            a.on_setattr is not None
+            or (a.on_setattr is not setters.NO_OP and has_cls_on_setattr)
+            # Don't invalidate the hash cache or record changes of mutable
+            # classes while initializing.
+            or ((does_cache_hash or track_changes) and not is_frozen)
         )
         # a.alias is set to maybe-mangled attr_name in _ClassBuilder if not
         # explicitly provided
@@ -2383,15 +3760,47 @@ def _attrs_to_init_script(
                 # Use the type from the converter if present.
                 annotations[arg_name] = converter._first_param_type
 
-    if attrs_to_validate:  # we can skip this if there are no validators.
+    # we can skip this if there are no validators.
+    if attrs_to_validate or invariants:
         names_for_globals["_config"] = _config
         lines.append("if _config._run_validators is True:")
+
+        def add_global(obj):
+            name = f"__attr_predicate_global_{len(predicate_globals)}"
+            predicate_globals.append(name)
+            names_for_globals[name] = obj
+
+            return name
+
+        predicate_globals = []
         for a in attrs_to_validate:
             val_name = "__attr_validator_" + a.name
             attr_name = "__attr_" + a.name
-            lines.append(f"    {val_name}(self, {attr_name}, self.{a.name})")
-            names_for_globals[val_name] = a.validator
             names_for_globals[attr_name] = a
+            names_for_globals[val_name] = _compile_validator(a.validator)
+            predicate = _validator_predicate(a.validator, add_global)
+            if predicate is None:
+                lines.append(
+                    f"    {val_name}(self, {attr_name}, self.{a.name})"
+                )
+                continue
+
+            # Inline the check; only call the validator to raise the error.
+            lines.extend(
+                [
+                    f"    value = self.{a.name}",
+                    "    try:",
+                    f"        ok = {predicate}",
+                    "    except Exception:",
+                    "        ok = False",
+                    "    if not ok:",
+                    f"        {val_name}(self, {attr_name}, value)",
+                ]
+            )
+        lines.extend(
+            f"    {line}"
+            for line in _fmt_invariant_calls(invariants, names_for_globals)
+        )
 
     if call_post_init:
         lines.append("self.__attrs_post_init__()")
@@ -2411,6 +3820,10 @@ def _attrs_to_init_script(
             init_hash_cache = f"self.{_HASH_CACHE_FIELD} = None"
         lines.append(init_hash_cache)
 
+    # Changes made by the hooks don't count.
+    if track_changes and (call_pre_init or call_post_init):
+        lines.append(f"_setattr('{_CHANGES_FIELD}', 0)")
+
     # For exceptions we rely on BaseException.__init__ for proper
     # initialization.
     if is_exc:
@@ -2437,6 +3850,10 @@ def _attrs_to_init_script(
         # If pre init method has arguments, pass the values given to __init__.
         lines[0] = f"self.__attrs_pre_init__({pre_init_args})"
 
+    if track_changes:
+        # Must come first because __setattr__ records changes to it.
+        lines.insert(0, f"_cached_setattr_get(self)('{_CHANGES_FIELD}', 0)")
+
     # Python <3.12 doesn't allow backslashes in f-strings.
     NL = "\n    "
     return (
@@ -2959,6 +4376,33 @@ class ClassProps:
             Whether the class has *attrs*-generated ``__getstate__`` and
             ``__setstate__`` methods for `pickle`.
 
+        added_compact_pickling (bool):
+            Whether the class has an *attrs*-generated ``__reduce_ex__`` method
+            that pickles instances as compact tuples.
+
+        added_fast_evolve (bool):
+            Whether the class has an *attrs*-generated ``__replace__`` method
+            that `attrs.evolve` uses to only process changed fields.
+
+        added_fast_copy (bool):
+            Whether the class has *attrs*-generated ``__copy__`` and
+            ``__deepcopy__`` methods.
+
+        added_interning (bool):
+            Whether the class has an *attrs*-generated ``__new__`` that returns
+            canonical instances.
+
+        added_change_tracking (bool):
+            Whether the class records which fields have been reassigned.
+
+        invariants (tuple[Callable[[Any], Any], ...]):
+            The class's invariants -- including inherited ones -- that are
+            checked after its fields have been validated.
+
+        added_type_checks (bool):
+            Whether validators that check the values of the class's own
+            fields against their annotations have been added.
+
         on_setattr_hook (Callable[[Any, Attribute[Any], Any], Any] | None):
             The class's ``__setattr__`` hook.
 
@@ -2966,6 +4410,13 @@ class ClassProps:
             The class's `field transformers <transform-fields>`.
 
     .. versionadded:: 25.4.0
+    .. versionadded:: 26.2.0 *added_compact_pickling*
+    .. versionadded:: 26.2.0 *added_fast_evolve*
+    .. versionadded:: 26.2.0 *added_fast_copy*
+    .. versionadded:: 26.2.0 *added_interning*
+    .. versionadded:: 26.2.0 *added_change_tracking*
+    .. versionadded:: 26.2.0 *invariants*
+    .. versionadded:: 26.2.0 *added_type_checks*
     """
 
     class Hashability(enum.Enum):
@@ -3015,6 +4466,13 @@ class ClassProps:
         "added_pickling",
         "on_setattr_hook",
         "field_transformer",
+        "added_compact_pickling",
+        "added_fast_evolve",
+        "added_fast_copy",
+        "added_interning",
+        "added_change_tracking",
+        "invariants",
+        "added_type_checks",
     )
 
     def __init__(
@@ -3035,6 +4493,13 @@ class ClassProps:
         added_pickling,
         on_setattr_hook,
         field_transformer,
+        added_compact_pickling=False,
+        added_fast_evolve=False,
+        added_fast_copy=False,
+        added_interning=False,
+        added_change_tracking=False,
+        invariants=(),
+        added_type_checks=False,
     ):
         self.is_exception = is_exception
         self.is_slotted = is_slotted
@@ -3052,6 +4517,13 @@ class ClassProps:
         self.added_pickling = added_pickling
         self.on_setattr_hook = on_setattr_hook
         self.field_transformer = field_transformer
+        self.added_compact_pickling = added_compact_pickling
+        self.added_fast_evolve = added_fast_evolve
+        self.added_fast_copy = added_fast_copy
+        self.added_interning = added_interning
+        self.added_change_tracking = added_change_tracking
+        self.invariants = invariants
+        self.added_type_checks = added_type_checks
 
     @property
     def is_hashable(self):
@@ -3259,7 +4731,12 @@ Converter = _add_hash(
 
 
 def make_class(
-    name, attrs, bases=(object,), class_body=None, **attributes_arguments
+    name,
+    attrs,
+    bases=(object,),
+    class_body=None,
+    pickle_by_spec=False,
+    **attributes_arguments,
 ):
     r"""
     A quick way to create a new class called *name* with *attrs*.
@@ -3295,6 +4772,22 @@ def make_class(
         class_body (dict):
             An optional dictionary of class attributes for the new class.
 
+        pickle_by_spec (bool):
+            Classes that are created dynamically can't be pickled by reference
+            because they can't be imported.  If True, instances are pickled
+            together with the arguments to this function -- the *spec* -- and
+            the unpickling process recreates the class from it.  A pickle
+            contains the spec only once, no matter how many instances it
+            contains.  The class is created only once per process, after which
+            it is looked up using the fingerprint of the spec.  This allows,
+            for example, to send instances to a
+            `concurrent.futures.ProcessPoolExecutor`.
+
+            All arguments -- including validators, converters, and defaults
+            -- must be picklable by reference.  Instances are pickled like
+            with *compact_pickle*, except that the class is replaced by the
+            spec.
+
         attributes_arguments: Passed unmodified to `attr.s`.
 
     Returns:
@@ -3304,6 +4797,7 @@ def make_class(
     .. versionchanged:: 18.1.0 If *attrs* is ordered, the order is retained.
     .. versionchanged:: 23.2.0 *class_body*
     .. versionchanged:: 25.2.0 Class names can now be unicode.
+    .. versionadded:: 26.2.0 *pickle_by_spec*
     """
     # Class identifiers are converted into the normal form NFKC while parsing
     name = unicodedata.normalize("NFKC", name)
@@ -3316,6 +4810,16 @@ def make_class(
         msg = "attrs argument must be a dict or a list."
         raise TypeError(msg)
 
+    if pickle_by_spec:
+        # Copy everything that is modified below.
+        spec = (
+            name,
+            dict(cls_dict),
+            bases,
+            class_body,
+            dict(attributes_arguments),
+        )
+
     pre_init = cls_dict.pop("__attrs_pre_init__", None)
     post_init = cls_dict.pop("__attrs_post_init__", None)
     user_init = cls_dict.pop("__init__", None)
@@ -3358,9 +4862,90 @@ def make_class(
     cls.__annotations__ = {
         k: v.type for k, v in cls_dict.items() if v.type is not None
     }
+
+    if pickle_by_spec:
+        _add_pickling_by_spec(cls, (*spec, cls.__module__))
+
+    return cls
+
+
+# Classes that have been created from a spec, by the spec's fingerprint.
+_CLASSES_BY_SPEC = weakref.WeakValueDictionary()
+
+
+def _add_pickling_by_spec(cls, spec, fingerprint=None):
+    """
+    Make instances of *cls* pickle together with *spec* from which the
+    unpickling process can recreate *cls*.
+    """
+    if fingerprint is None:
+        import hashlib
+        import pickle
+
+        try:
+            fingerprint = hashlib.sha256(pickle.dumps(spec, 4)).hexdigest()
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            msg = f"Can't pickle the spec of {cls!r}: {e}"
+            raise TypeError(msg) from e
+
+    cls.__reduce_ex__ = _add_method_dunders(
+        cls,
+        _make_compact_reduce(
+            cls,
+            cls.__attrs_attrs__,
+            _unpickle_by_spec,
+            "_by_spec",
+            {"_by_spec": _ClassBySpec(fingerprint, spec)},
+        ),
+    )
+    _CLASSES_BY_SPEC[fingerprint] = cls
+
+
+class _ClassBySpec:
+    """
+    Stand-in for a class that is pickled as its *spec* and unpickled as the
+    class.
+
+    All instances of the class share one stand-in, therefore pickle's memo
+    makes sure that a pickle contains the spec only once and that it's looked
+    up only once while unpickling -- no matter the number of instances.
+    """
+
+    __slots__ = ("fingerprint", "spec")
+
+    def __init__(self, fingerprint, spec):
+        self.fingerprint = fingerprint
+        self.spec = spec
+
+    def __reduce__(self):
+        return _class_by_spec, (self.fingerprint, self.spec)
+
+
+def _class_by_spec(fingerprint, spec):
+    """
+    Return the class with *fingerprint*, creating it from *spec* only if there
+    is none yet.
+    """
+    cls = _CLASSES_BY_SPEC.get(fingerprint)
+    if cls is None:
+        name, attrs, bases, class_body, attributes_arguments, module = spec
+        cls = make_class(
+            name, dict(attrs), bases, class_body, **attributes_arguments
+        )
+        cls.__module__ = module
+        _add_pickling_by_spec(cls, spec, fingerprint)
+
     return cls
 
 
+def _unpickle_by_spec(cls, *values):
+    """
+    Recreate an instance of a class that has been created using
+    ``make_class(..., pickle_by_spec=True)``.
+    """
+    return _get_compact_unpickler(cls)[1](cls, *values)
+
+
 # These are required by within this module so we define them here and merely
 # import into .validators / .converters.
 
@@ -3377,6 +4962,28 @@ class _AndValidator:
         for v in self._validators:
             v(inst, attr, value)
 
+    def _check_all(self, values):
+        """
+        Return whether all *values* pass all validators without calling them
+        per value.  See ``attr.validators._all_valid``.
+        """
+        checks = [getattr(v, "_check_all", None) for v in self._validators]
+
+        return None not in checks and all(check(values) for check in checks)
+
+    def _predicate(self, add_global):
+        """
+        Return an expression that is only true if ``value`` passes all
+        validators.  See ``_compile_validator``.
+        """
+        predicates = [
+            _validator_predicate(v, add_global) for v in self._validators
+        ]
+        if not predicates or None in predicates:
+            return None
+
+        return " and ".join(f"({p})" for p in predicates)
+
 
 def and_(*validators):
     """
@@ -3401,6 +5008,115 @@ def and_(*validators):
     return _AndValidator(tuple(vals))
 
 
+# Compiled validators by the id of the validator they've been compiled from.
+# Compiled validators keep their validators alive, so ids can't be reused
+# while their entries exist -- which is as long as anything, usually the
+# generated methods of a class, holds on to the compiled validator.
+_COMPILED_VALIDATORS = weakref.WeakValueDictionary()
+
+
+def _validator_predicate(validator, add_global):
+    """
+    Return a Python expression that is only true if *validator* passes for
+    the value in the variable ``value`` -- or None if it can't be expressed
+    as one.
+
+    Validators opt in by implementing ``_predicate(add_global)``.
+    *add_global* takes an object and returns the name under which it's
+    available to the expression.
+    """
+    predicate = getattr(validator, "_predicate", None)
+    if predicate is None:
+        return None
+
+    return predicate(add_global)
+
+
+def _compile_validator(validator):
+    """
+    Return a function that validates exactly like *validator*, but checks
+    built-in validators -- also if they're nested in `and_`, `or_`, or
+    `optional` -- in a single boolean expression without calling them.
+
+    Only if that expression is false or raises, the validators are called to
+    raise the proper exception.
+
+    Return *validator* itself if there's nothing to fuse.
+    """
+    compiled = _COMPILED_VALIDATORS.get(id(validator))
+    if compiled is not None:
+        return compiled
+
+    compiled = _make_compiled_validator(validator)
+    if compiled is not validator:
+        _COMPILED_VALIDATORS[id(validator)] = compiled
+
+    return compiled
+
+
+def _make_compiled_validator(validator):
+    if isinstance(validator, _AndValidator):
+        steps = validator._validators
+    elif getattr(validator, "_wraps_validators", False):
+        steps = (validator,)
+    else:
+        # Single validators can't be sped up by fusing.
+        return validator
+
+    globs = {}
+
+    def add_global(obj):
+        name = f"_v{len(globs)}"
+        globs[name] = obj
+
+        return name
+
+    lines = []
+    fused = []  # Names of consecutive validators with predicates.
+    predicates = []
+
+    def flush():
+        if not predicates:
+            return
+
+        lines.extend(
+            [
+                "    try:",
+                f"        ok = {' and '.join(f'({p})' for p in predicates)}",
+                "    except Exception:",
+                "        ok = False",
+                "    if not ok:",
+                *(f"        {name}(inst, attr, value)" for name in fused),
+            ]
+        )
+        fused.clear()
+        predicates.clear()
+
+    has_predicates = False
+    for v in steps:
+        predicate = _validator_predicate(v, add_global)
+        if predicate is None:
+            flush()
+            lines.append(f"    {add_global(v)}(inst, attr, value)")
+        else:
+            has_predicates = True
+            predicates.append(predicate)
+            fused.append(add_global(v))
+    flush()
+
+    if not has_predicates:
+        return validator
+
+    script = "def validate(inst, attr, value):\n" + "\n".join(lines)
+    compiled = _linecache_and_compile(
+        script, "<attrs generated validator>", globs
+    )["validate"]
+    # Pin the validator for as long as its compiled version exists.
+    globs["_compiled_from"] = validator
+
+    return compiled
+
+
 def pipe(*converters):
     """
     A converter that composes multiple converters into one.
@@ -44,6 +44,13 @@ def define(
     field_transformer=None,
     match_args=True,
     force_kw_only=False,
+    compact_pickle=False,
+    fast_evolve=False,
+    fast_copy=False,
+    intern=False,
+    track_changes=False,
+    invariants=(),
+    check_types=False,
 ):
     r"""
     A class decorator that adds :term:`dunder methods` according to
@@ -189,11 +196,12 @@ def define(
         cache_hash (bool):
             Ensure that the object's hash code is computed only once and stored
             on the object.  If this is set to True, hashing must be either
-            explicitly or implicitly enabled for this class.  If the hash code
-            is cached, avoid any reassignments of fields involved in hash code
-            computation or mutations of the objects those fields point to after
-            object creation.  If such changes occur, the behavior of the
-            object's hash code is undefined.
+            explicitly or implicitly enabled for this class.
+
+            Reassigning a field that is involved in hash code computation on a
+            mutable class clears the cached hash code.  Mutations of the
+            objects those fields point to are not detected though.  If such
+            changes occur, the behavior of the object's hash code is undefined.
 
         frozen (bool):
             Make instances immutable after initialization.  If someone attempts
@@ -268,6 +276,132 @@ def define(
             directly on the class (meaning: not inherited), it is set to False
             (this is usually what you want).
 
+        compact_pickle (bool):
+            If True, a ``__reduce_ex__`` is generated that pickles instances
+            as a flat tuple of a version tag and the values of all fields --
+            without the field names.  This makes pickles considerably smaller
+            and faster to load, which pays off when sending lots of instances
+            between processes.
+
+            Like with ``__setstate__``, ``__init__`` is **not** called when
+            unpickling.
+
+            The version tag is taken from the class attribute
+            ``__attrs_pickle_version__`` (default: 0).  If you change the
+            fields of a class, bump it and add a classmethod
+            ``__attrs_migrate_pickle__(cls, version, values)`` that receives
+            the version and the tuple of values of an old pickle and returns a
+            tuple of values for the current fields.  Without it, unpickling
+            old versions raises a `pickle.UnpicklingError`.
+
+            Instances of subclasses that don't use *compact_pickle* themselves
+            are pickled as usual.
+
+            Fields that are annotated as `bytes`, `bytearray`, or `memoryview`
+            are passed as `pickle.PickleBuffer` if the pickle protocol is 5
+            or higher.  If you pass a *buffer_callback* to `pickle.dumps`,
+            their contents are therefore transferred out-of-band without
+            copying and the fields are `memoryview`\ s of the buffers that
+            you pass to `pickle.loads`.
+
+        fast_evolve (bool):
+            If True, a ``__replace__`` method is generated that `attrs.evolve`
+            and `copy.replace` use.  Instead of calling ``__init__`` with the
+            values of all fields, it copies the unchanged fields from the
+            original instance and only runs converters and validators for the
+            changed ones.
+
+            ``__attrs_pre_init__`` and ``__attrs_post_init__`` are still
+            called, and fields with ``init=False`` are initialized like in
+            ``__init__``.
+
+            This is only correct if your validators and converters don't
+            depend on *other* fields than their own, therefore it's opt-in.
+            It can't be used with exception classes, custom ``__init__``
+            methods, and an ``__attrs_pre_init__`` that takes arguments.
+
+        fast_copy (bool):
+            If True, ``__copy__`` and ``__deepcopy__`` methods are generated
+            that `copy.copy` and `copy.deepcopy` use.  They copy the fields
+            directly instead of going through ``__reduce_ex__`` and
+            ``__getstate__`` / ``__setstate__``.
+
+            `copy.deepcopy` doesn't copy values of immutable built-in types
+            like `int` or `str`.  It also shares instances of *frozen*
+            *attrs* classes if the field is annotated with that class --
+            even if they contain mutable values.
+
+            Classes that subclass built-in types like `dict` or `list` can't
+            use it, because their items would be lost.
+
+        intern (bool):
+            If True, instances are *interned*: calling the class returns the
+            canonical instance with equal field values if one is still alive.
+            Thus, each distinct value is only held in memory -- and hashed --
+            once.  Canonical instances are kept in a per-class
+            `weakref.WeakValueDictionary` that is keyed by the values of the
+            fields and their classes.
+
+            The ``__init__`` is generated as ``__attrs_init__`` and called by
+            a generated ``__new__``.  Unpickling and copying return canonical
+            instances too.  Instances of subclasses are not interned.
+
+            Only frozen classes whose field values are hashable can be
+            interned.  It can't be used with exception classes, custom
+            ``__init__`` methods, slotted classes without a weakref slot, and
+            together with *compact_pickle*, *fast_evolve*, or *fast_copy*.
+
+        track_changes (bool):
+            If True, instances record which fields have been reassigned since
+            they have been initialized -- or since `attrs.clear_changes` has
+            been called on them.  Use `attrs.changed_fields` to get them.
+
+            The changes are kept as a bitmask in an extra slot -- or in the
+            instance dictionary of dict classes -- and recorded by the
+            generated ``__setattr__``.  Assignments in ``__init__``,
+            ``__attrs_pre_init__``, and ``__attrs_post_init__`` don't count.
+            Copies and unpickled instances keep the changes of the original,
+            unless they're created using *compact_pickle* or `attrs.codec`.
+
+            It can't be used with frozen classes and custom ``__setattr__``
+            methods.
+
+        invariants (~collections.abc.Sequence[~collections.abc.Callable]):
+            Callables that take the instance and raise an exception if it's
+            invalid as a whole.  Use them for rules that span several fields.
+
+            They're called once after all fields have been validated in
+            ``__init__`` -- but before ``__attrs_post_init__`` -- and by
+            `attrs.validate`.  If a field that is validated on assignment is
+            set, they're called afterwards and the old value is restored if
+            they fail.  Invariants of base classes are checked first.
+
+            They don't run if validators are disabled.
+
+        check_types (bool):
+            If True, validators are derived from the annotations of the
+            fields of the class -- after resolving them like
+            `attrs.resolve_types` -- and run before the fields' own
+            validators.
+
+            Classes become `isinstance` checks and unions of them checks
+            against tuples of classes.  `typing.Literal` values are compared
+            together with their classes, so ``True`` doesn't pass
+            ``Literal[1]``.  Of collections like ``list[int]`` or
+            ``dict[str, C]``, a random sample of up to 64 members is checked
+            -- unless `attrs.validators.set_exhaustive` is used.
+            `typing.Any`, type variables, and protocols that aren't
+            runtime-checkable aren't checked.  Annotations that can't be
+            resolved when the class is created -- like references to itself
+            -- are resolved when the first instance is validated.  If they
+            can't be resolved then either, a warning is emitted and they
+            aren't checked.  For classes that are defined in functions, that
+            is already known -- and warned about -- when the class is
+            created.
+
+            Use `attrs.validators.set_check_types` to turn them off globally,
+            for example in production.
+
         auto_attribs (bool | None):
             If True, look at type annotations to determine which attributes to
             use, like `dataclasses`. If False, it will only look for explicit
@@ -335,6 +469,15 @@ def define(
     .. versionchanged:: 26.2.0
        *on_setattr* hooks can now be generator functions that yield exactly
        once.
+    .. versionadded:: 26.2.0 *compact_pickle*
+    .. versionadded:: 26.2.0 *fast_evolve*
+    .. versionadded:: 26.2.0 *fast_copy*
+    .. versionadded:: 26.2.0 *intern*
+    .. versionadded:: 26.2.0 *track_changes*
+    .. versionadded:: 26.2.0 *invariants*
+    .. versionadded:: 26.2.0 *check_types*
+    .. versionchanged:: 26.2.0
+       Reassigning hashed fields of mutable classes clears the cached hash.
 
     .. note::
 
@@ -384,6 +527,13 @@ def define(
             field_transformer=field_transformer,
             match_args=match_args,
             force_kw_only=force_kw_only,
+            compact_pickle=compact_pickle,
+            fast_evolve=fast_evolve,
+            fast_copy=fast_copy,
+            intern=intern,
+            track_changes=track_changes,
+            invariants=invariants,
+            check_types=check_types,
         )
 
     def wrap(cls):
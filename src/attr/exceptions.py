@@ -93,3 +93,31 @@ class NotCallableError(TypeError):
 
     def __str__(self):
         return str(self.msg)
+
+
+class UnpicklableValidationError(Exception):
+    """
+    Stands in for an exception of a validator or an invariant that has been
+    raised in a worker process of `attrs.validate_many` but couldn't be
+    pickled to be sent back.
+
+    Attributes:
+        type_name (str): The qualified name of the class of the exception.
+
+        msg (str): The message of the exception.
+
+        field (str | None):
+            The name of the field whose validator raised the exception --
+            None for invariants.
+
+    .. versionadded:: 26.2.0
+    """
+
+    def __init__(self, type_name, msg, field):
+        super().__init__(type_name, msg, field)
+        self.type_name = type_name
+        self.msg = msg
+        self.field = field
+
+    def __str__(self):
+        return f"{self.type_name}: {self.msg}"
@@ -15,3 +15,11 @@ class NotCallableError(TypeError):
     msg: str = ...
     value: Any = ...
     def __init__(self, msg: str, value: Any) -> None: ...
+
+class UnpicklableValidationError(Exception):
+    type_name: str
+    msg: str
+    field: str | None
+    def __init__(
+        self, type_name: str, msg: str, field: str | None
+    ) -> None: ...
@@ -26,6 +26,9 @@ def pipe(*setters):
 
         return rv
 
+    # Allows attrs to inline the setters into generated __setattr__ methods.
+    wrapped_pipe.__attrs_setters__ = setters
+
     return wrapped_pipe
 
 
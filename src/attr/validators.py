@@ -4,14 +4,35 @@
 Commonly useful validators.
 """
 
+import array
+import collections.abc
+import math
 import operator
+import random
 import re
-
-from contextlib import contextmanager
+import threading
+import types
+import typing
+import warnings
+
+from collections import OrderedDict
+from contextlib import contextmanager, suppress
+from functools import lru_cache, partial
+from itertools import islice, repeat
 from re import Pattern
+from types import NoneType
 
+from . import _config
 from ._config import get_run_validators, set_run_validators
-from ._make import _AndValidator, and_, attrib, attrs
+from ._make import (
+    _AndValidator,
+    _compile_validator,
+    _user_stacklevel,
+    _validator_predicate,
+    and_,
+    attrib,
+    attrs,
+)
 from .converters import default_if_none
 from .exceptions import NotCallableError
 
@@ -21,8 +42,11 @@ __all__ = [
     "deep_iterable",
     "deep_mapping",
     "disabled",
+    "exhaustive",
     "ge",
+    "get_check_types",
     "get_disabled",
+    "get_exhaustive",
     "gt",
     "in_",
     "instance_of",
@@ -31,12 +55,15 @@ __all__ = [
     "lt",
     "matches_re",
     "max_len",
+    "memoize",
     "min_len",
     "ne",
     "not_",
     "optional",
     "or_",
+    "set_check_types",
     "set_disabled",
+    "set_exhaustive",
 ]
 
 
@@ -90,6 +117,91 @@ def disabled():
         set_run_validators(prev)
 
 
+def set_exhaustive(exhaustive):
+    """
+    Globally make deep validators validate all members, ignoring their
+    *sample* and *prefix* arguments -- for example while debugging or
+    testing.
+
+    By default, *sample* and *prefix* are honored.
+
+    Args:
+        exhaustive (bool): If `True`, validate all members.
+
+    .. warning::
+
+        This function is not thread-safe!
+
+    .. versionadded:: 26.2.0
+    """
+    _config._validate_exhaustively = exhaustive
+
+
+def get_exhaustive():
+    """
+    Return a bool indicating whether deep validators currently validate all
+    members.
+
+    Returns:
+        bool: `True` if *sample* and *prefix* are currently ignored.
+
+    .. versionadded:: 26.2.0
+    """
+    return _config._validate_exhaustively
+
+
+@contextmanager
+def exhaustive():
+    """
+    Context manager that makes deep validators validate all members within
+    its context.
+
+    .. warning::
+
+        This context manager is not thread-safe!
+
+    .. versionadded:: 26.2.0
+    """
+    prev = _config._validate_exhaustively
+    _config._validate_exhaustively = True
+    try:
+        yield
+    finally:
+        _config._validate_exhaustively = prev
+
+
+def set_check_types(check):
+    """
+    Globally enable or disable the validators that classes with
+    *check_types* derive from their annotations -- for example to skip them
+    in production.
+
+    By default, they are run.  Other validators are not affected.
+
+    Args:
+        check (bool): If `False`, disable running type checks.
+
+    .. warning::
+
+        This function is not thread-safe!
+
+    .. versionadded:: 26.2.0
+    """
+    _config._check_types = check
+
+
+def get_check_types():
+    """
+    Return a bool indicating whether derived type checks are currently run.
+
+    Returns:
+        bool: `True` if type checks are currently run.
+
+    .. versionadded:: 26.2.0
+    """
+    return _config._check_types
+
+
 @attrs(repr=False, slots=True, unsafe_hash=True)
 class _InstanceOfValidator:
     type = attrib()
@@ -107,6 +219,20 @@ class _InstanceOfValidator:
                 value,
             )
 
+    def _check_all(self, values):
+        t = self.type
+        if _has_plain_instancecheck(t) and (
+            values.__class__ in _HOMOGENEOUS_TYPES
+            or (_is_ndarray(values) and values.dtype.kind != "O")
+        ):
+            # All members have the same type; one of them is representative.
+            return len(values) == 0 or isinstance(values[0], t)
+
+        return all(map(isinstance, values, repeat(t)))
+
+    def _predicate(self, add_global):
+        return f"isinstance(value, {add_global(self.type)})"
+
     def __repr__(self):
         return f"<instance_of validator for type {self.type!r}>"
 
@@ -146,6 +272,9 @@ class _MatchesReValidator:
                 value,
             )
 
+    def _predicate(self, add_global):
+        return f"{add_global(self.match_func)}(value)"
+
     def __repr__(self):
         return f"<matches_re validator for pattern {self.pattern!r}>"
 
@@ -202,12 +331,36 @@ def matches_re(regex, flags=0, func=None):
 class _OptionalValidator:
     validator = attrib()
 
+    _wraps_validators = True
+
     def __call__(self, inst, attr, value):
         if value is None:
             return
 
         self.validator(inst, attr, value)
 
+    def _check_all(self, values):
+        check_all = getattr(self.validator, "_check_all", None)
+        if check_all is None:
+            return False
+
+        if values.__class__ not in _HOMOGENEOUS_TYPES and not _is_ndarray(
+            values
+        ):
+            values = list(filter(partial(operator.is_not, None), values))
+
+        return check_all(values)
+
+    def _predicate(self, add_global):
+        if isinstance(self.validator, _InstanceOfValidator):
+            return f"isinstance(value, {add_global((NoneType, self.validator.type))})"
+
+        predicate = _validator_predicate(self.validator, add_global)
+        if predicate is None:
+            return None
+
+        return f"value is None or ({predicate})"
+
     def __repr__(self):
         return f"<optional validator for {self.validator!r} or None>"
 
@@ -239,10 +392,15 @@ class _InValidator:
     _original_options = attrib(hash=False)
 
     def __call__(self, inst, attr, value):
+        options = self.options
         try:
-            in_options = value in self.options
+            in_options = value in options
         except TypeError:  # e.g. `1 in "abc"`
-            in_options = False
+            # Unhashable values can't be looked up in a set but may still
+            # compare equal to one of its members.
+            in_options = options.__class__ is frozenset and value in tuple(
+                options
+            )
 
         if not in_options:
             msg = f"'{attr.name}' must be in {self._original_options!r} (got {value!r})"
@@ -253,6 +411,12 @@ class _InValidator:
                 value,
             )
 
+    def _check_all(self, values):
+        return all(map(self.options.__contains__, values))
+
+    def _predicate(self, add_global):
+        return f"value in {add_global(self.options)}"
+
     def __repr__(self):
         return f"<in_ validator with options {self._original_options!r}>"
 
@@ -266,7 +430,9 @@ def in_(options):
     support that operation.
 
     To keep the validator hashable, dicts, lists, and sets are transparently
-    transformed into a `tuple`.
+    transformed into a `frozenset` -- or into a `tuple` if they contain
+    unhashable values.  Tuples are transformed into a `frozenset` too, such
+    that checks don't have to scan all *options*.
 
     Args:
         options: Allowed options.
@@ -284,16 +450,24 @@ def in_(options):
     .. versionchanged:: 24.1.0
        *options* that are a list, dict, or a set are now transformed into a
        tuple to keep the validator hashable.
+    .. versionchanged:: 26.2.0
+       *options* that are a list, dict, set, or tuple of hashable values are
+       now transformed into a frozenset to make checks O(1).
     """
     repr_options = options
-    if isinstance(options, (list, dict, set)):
+    if isinstance(options, (list, dict, set, tuple)):
         options = tuple(options)
+        with suppress(TypeError):  # unhashable options
+            options = frozenset(options)
 
     return _InValidator(options, repr_options)
 
 
 @attrs(repr=False, slots=False, unsafe_hash=True)
 class _IsCallableValidator:
+    def _predicate(self, add_global):
+        return "callable(value)"
+
     def __call__(self, inst, attr, value):
         """
         We use a callable class to be able to change the ``__repr__``.
@@ -330,12 +504,177 @@ def is_callable():
     return _IsCallableValidator()
 
 
+# Containers that can be iterated more than once, so deep validators can
+# check their members in bulk and fall back to calling the member validator
+# per member if that fails.
+_HOMOGENEOUS_TYPES = frozenset((array.array, memoryview, range))
+_BULK_TYPES = frozenset((list, tuple, set, frozenset)) | _HOMOGENEOUS_TYPES
+_INT_TYPECODES = frozenset("bBhHiIlLqQnN")
+
+
+def _all_valid(validator, values):
+    """
+    Return whether all *values* pass *validator*, using its ``_check_all``
+    method that checks them in bulk.
+
+    A return value of False means that *validator* must be called for each
+    value to find out which one fails and how, for instance because it
+    doesn't support bulk checks.
+    """
+    check_all = getattr(validator, "_check_all", None)
+    if check_all is None:
+        return False
+
+    try:
+        return check_all(values)
+    except Exception:  # noqa: BLE001 -- the per-value call raises it properly
+        return False
+
+
+def _is_ndarray(values):
+    """
+    Return whether *values* is a one-dimensional NumPy array -- without
+    importing NumPy.
+    """
+    cls = values.__class__
+
+    return (
+        cls.__name__ == "ndarray"
+        and cls.__module__ == "numpy"
+        and values.ndim == 1
+    )
+
+
+def _typecode(values):
+    """
+    Return the type code of the members of *values*, an instance of one of
+    ``_HOMOGENEOUS_TYPES``.
+    """
+    if values.__class__ is range:
+        return "n"
+    if values.__class__ is memoryview:
+        return values.format if values.ndim == 1 else None
+
+    return values.typecode
+
+
+def _has_plain_instancecheck(t):
+    """
+    Return whether ``isinstance(value, t)`` only depends on the type of
+    *value*.
+    """
+    if isinstance(t, tuple):
+        return all(map(_has_plain_instancecheck, t))
+
+    return type(t).__instancecheck__ is type.__instancecheck__
+
+
+_SEQUENCE_TYPES = frozenset((list, tuple)) | _HOMOGENEOUS_TYPES
+
+
+@attrs(repr=False, slots=True, unsafe_hash=True)
+class _Subset:
+    """
+    Selects the members of a container that deep validators validate.
+    """
+
+    sample = attrib()
+    prefix = attrib()
+    _random = attrib(eq=False)
+
+    def select(self, members):
+        """
+        Return the selected members of the iterable *members*.
+        """
+        is_sequence = members.__class__ in _SEQUENCE_TYPES or _is_ndarray(
+            members
+        )
+        if self.prefix is not None:
+            if is_sequence:
+                return members[: self.prefix]
+
+            return list(islice(members, self.prefix))
+
+        if not (is_sequence or isinstance(members, collections.abc.Sized)):
+            members = list(members)
+            is_sequence = True
+
+        n = len(members)
+        k = (
+            self.sample
+            if isinstance(self.sample, int)
+            else math.ceil(self.sample * n)
+        )
+        if k >= n:
+            return members
+
+        indexes = sorted(self._random.sample(range(n), k))
+        if is_sequence:
+            return [members[i] for i in indexes]
+
+        # Skip to the picked members without copying the others.
+        it = iter(members)
+        rv = []
+        previous = -1
+        for i in indexes:
+            rv.append(next(islice(it, i - previous - 1, None)))
+            previous = i
+
+        return rv
+
+    def __repr__(self):
+        if self.prefix is not None:
+            return f"the first {self.prefix} members"
+
+        if isinstance(self.sample, int):
+            return f"a sample of {self.sample} members"
+
+        return f"a sample of {self.sample:.0%} of the members"
+
+
+def _subset(sample, prefix, seed):
+    """
+    Check the subset arguments of deep validators and return a `_Subset` or
+    None if all members are validated.
+    """
+    if sample is not None and prefix is not None:
+        msg = "sample and prefix are mutually exclusive."
+        raise ValueError(msg)
+
+    if prefix is not None:
+        if not isinstance(prefix, int) or isinstance(prefix, bool):
+            msg = f"prefix must be an int (got {prefix!r})."
+            raise TypeError(msg)
+        if prefix < 0:
+            msg = f"prefix must be >= 0 (got {prefix!r})."
+            raise ValueError(msg)
+
+        return _Subset(None, prefix, None)
+
+    if sample is None:
+        return None
+
+    if isinstance(sample, bool) or not isinstance(sample, (int, float)):
+        msg = f"sample must be an int or a float (got {sample!r})."
+        raise TypeError(msg)
+    if isinstance(sample, int) and sample < 1:
+        msg = f"sample must be >= 1 if it's a count (got {sample!r})."
+        raise ValueError(msg)
+    if isinstance(sample, float) and not 0.0 < sample <= 1.0:
+        msg = f"sample must be in (0, 1] if it's a fraction (got {sample!r})."
+        raise ValueError(msg)
+
+    # The sample only saves validation time; it isn't security-relevant.
+    return _Subset(sample, None, random.Random(seed))  # noqa: S311
+
+
 @attrs(repr=False, slots=True, unsafe_hash=True)
 class _DeepIterable:
     member_validator = attrib(validator=is_callable())
     iterable_validator = attrib(
         default=None, validator=optional(is_callable())
     )
+    subset = attrib(default=None)
 
     def __call__(self, inst, attr, value):
         """
@@ -344,6 +683,14 @@ class _DeepIterable:
         if self.iterable_validator is not None:
             self.iterable_validator(inst, attr, value)
 
+        if self.subset is not None and not _config._validate_exhaustively:
+            value = self.subset.select(value)
+
+        if (
+            value.__class__ in _BULK_TYPES or _is_ndarray(value)
+        ) and _all_valid(self.member_validator, value):
+            return
+
         for member in value:
             self.member_validator(inst, attr, member)
 
@@ -353,22 +700,51 @@ class _DeepIterable:
             if self.iterable_validator is None
             else f" {self.iterable_validator!r}"
         )
+        subset_identifier = (
+            "" if self.subset is None else f", validating {self.subset!r}"
+        )
         return (
             f"<deep_iterable validator for{iterable_identifier}"
-            f" iterables of {self.member_validator!r}>"
+            f" iterables of {self.member_validator!r}{subset_identifier}>"
         )
 
 
-def deep_iterable(member_validator, iterable_validator=None):
+def deep_iterable(
+    member_validator,
+    iterable_validator=None,
+    *,
+    sample=None,
+    prefix=None,
+    seed=None,
+):
     """
     A validator that performs deep validation of an iterable.
 
+    For very large iterables, the validation can be limited to a random
+    sample or to a prefix of the members.  Use `set_exhaustive` or
+    `exhaustive` to validate all members anyway, for example in tests.
+
     Args:
         member_validator: Validator(s) to apply to iterable members.
 
         iterable_validator:
             Validator(s) to apply to iterable itself (optional).
 
+        sample (int | float | None):
+            Only validate a random sample of this many members if it's an
+            `int` or of this fraction of the members if it's a `float`.
+            Sampling is constant-time for sequences like lists, tuples, and
+            arrays.  Other collections like sets are iterated over once
+            without being copied, iterables without a length are copied into a
+            list first.
+
+        prefix (int | None):
+            Only validate the first *prefix* members.  Mutually exclusive
+            with *sample*.
+
+        seed:
+            Seed for the random number generator that picks the *sample*.
+
     Raises:
         TypeError: if any sub-validators fail.
 
@@ -377,12 +753,18 @@ def deep_iterable(member_validator, iterable_validator=None):
     .. versionchanged:: 25.4.0
        *member_validator* and *iterable_validator* can now be a list or tuple
        of validators.
+    .. versionchanged:: 26.2.0
+       Built-in member validators check the members of lists, tuples, sets,
+       ranges, arrays, and memoryviews in bulk.
+    .. versionadded:: 26.2.0 *sample*, *prefix*, and *seed*
     """
     if isinstance(member_validator, (list, tuple)):
         member_validator = and_(*member_validator)
     if isinstance(iterable_validator, (list, tuple)):
         iterable_validator = and_(*iterable_validator)
-    return _DeepIterable(member_validator, iterable_validator)
+    return _DeepIterable(
+        member_validator, iterable_validator, _subset(sample, prefix, seed)
+    )
 
 
 @attrs(repr=False, slots=True, unsafe_hash=True)
@@ -390,6 +772,7 @@ class _DeepMapping:
     key_validator = attrib(validator=optional(is_callable()))
     value_validator = attrib(validator=optional(is_callable()))
     mapping_validator = attrib(validator=optional(is_callable()))
+    subset = attrib(default=None)
 
     def __call__(self, inst, attr, value):
         """
@@ -398,18 +781,56 @@ class _DeepMapping:
         if self.mapping_validator is not None:
             self.mapping_validator(inst, attr, value)
 
-        for key in value:
-            if self.key_validator is not None:
-                self.key_validator(inst, attr, key)
-            if self.value_validator is not None:
-                self.value_validator(inst, attr, value[key])
+        key_validator = self.key_validator
+        value_validator = self.value_validator
+        if self.subset is not None and not _config._validate_exhaustively:
+            for key, member in self.subset.select(value.items()):
+                if key_validator is not None:
+                    key_validator(inst, attr, key)
+                if value_validator is not None:
+                    value_validator(inst, attr, member)
+
+            return
+
+        if (
+            value.__class__ is dict
+            and (
+                key_validator is None
+                or _all_valid(key_validator, value.keys())
+            )
+            and (
+                value_validator is None
+                or _all_valid(value_validator, value.values())
+            )
+        ):
+            return
+
+        if value_validator is None:
+            for key in value:
+                key_validator(inst, attr, key)
+        elif key_validator is None:
+            for key in value:
+                value_validator(inst, attr, value[key])
+        else:
+            for key in value:
+                key_validator(inst, attr, key)
+                value_validator(inst, attr, value[key])
 
     def __repr__(self):
-        return f"<deep_mapping validator for objects mapping {self.key_validator!r} to {self.value_validator!r}>"
+        subset_identifier = (
+            "" if self.subset is None else f", validating {self.subset!r}"
+        )
+        return f"<deep_mapping validator for objects mapping {self.key_validator!r} to {self.value_validator!r}{subset_identifier}>"
 
 
 def deep_mapping(
-    key_validator=None, value_validator=None, mapping_validator=None
+    key_validator=None,
+    value_validator=None,
+    mapping_validator=None,
+    *,
+    sample=None,
+    prefix=None,
+    seed=None,
 ):
     """
     A validator that performs deep validation of a dictionary.
@@ -417,6 +838,9 @@ def deep_mapping(
     All validators are optional, but at least one of *key_validator* or
     *value_validator* must be provided.
 
+    Like with `deep_iterable`, the validation of the items can be limited to
+    a random sample or to a prefix.
+
     Args:
         key_validator: Validator(s) to apply to dictionary keys.
 
@@ -425,6 +849,18 @@ def deep_mapping(
         mapping_validator:
             Validator(s) to apply to top-level mapping attribute.
 
+        sample (int | float | None):
+            Only validate a random sample of this many items if it's an `int`
+            or of this fraction of the items if it's a `float`.  The items
+            are iterated over once to pick the sample, without being copied.
+
+        prefix (int | None):
+            Only validate the first *prefix* items.  Mutually exclusive with
+            *sample*.
+
+        seed:
+            Seed for the random number generator that picks the *sample*.
+
     .. versionadded:: 19.1.0
 
     .. versionchanged:: 25.4.0
@@ -435,6 +871,12 @@ def deep_mapping(
        *key_validator*, *value_validator*, and *mapping_validator* can now be a
        list or tuple of validators.
 
+    .. versionchanged:: 26.2.0
+       Built-in key and value validators check the keys and values of dicts in
+       bulk.
+
+    .. versionadded:: 26.2.0 *sample*, *prefix*, and *seed*
+
     Raises:
         TypeError: If any sub-validator fails on validation.
 
@@ -455,7 +897,12 @@ def deep_mapping(
     if isinstance(mapping_validator, (list, tuple)):
         mapping_validator = and_(*mapping_validator)
 
-    return _DeepMapping(key_validator, value_validator, mapping_validator)
+    return _DeepMapping(
+        key_validator,
+        value_validator,
+        mapping_validator,
+        _subset(sample, prefix, seed),
+    )
 
 
 @attrs(repr=False, frozen=True, slots=True)
@@ -472,6 +919,34 @@ class _NumberValidator:
             msg = f"'{attr.name}' must be {self.compare_op} {self.bound}: {value}"
             raise ValueError(msg)
 
+    def _check_all(self, values):
+        bound = self.bound
+        if _is_ndarray(values):
+            if values.dtype.kind not in "iuf":
+                return False
+
+            return bool(self.compare_func(values, bound).all())
+
+        if values.__class__ in _HOMOGENEOUS_TYPES and _typecode(values) in (
+            _INT_TYPECODES
+        ):
+            # Integers are totally ordered, so the extremes are enough.
+            if not values:
+                return True
+            op = self.compare_op
+            if op == "!=":
+                return bound not in values
+            if values.__class__ is range:
+                lo, hi = sorted((values[0], values[-1]))
+            else:
+                lo, hi = min(values), max(values)
+            return self.compare_func(hi if op in ("<", "<=") else lo, bound)
+
+        return all(map(self.compare_func, values, repeat(bound)))
+
+    def _predicate(self, add_global):
+        return f"value {self.compare_op} {add_global(self.bound)}"
+
     def __repr__(self):
         return f"<Validator for x {self.compare_op} {self.bound}>"
 
@@ -563,6 +1038,9 @@ class _MaxLengthValidator:
             msg = f"Length of '{attr.name}' must be <= {self.max_length}: {len(value)}"
             raise ValueError(msg)
 
+    def _predicate(self, add_global):
+        return f"len(value) <= {add_global(self.max_length)}"
+
     def __repr__(self):
         return f"<max_len validator for {self.max_length}>"
 
@@ -592,6 +1070,9 @@ class _MinLengthValidator:
             msg = f"Length of '{attr.name}' must be >= {self.min_length}: {len(value)}"
             raise ValueError(msg)
 
+    def _predicate(self, add_global):
+        return f"len(value) >= {add_global(self.min_length)}"
+
     def __repr__(self):
         return f"<min_len validator for {self.min_length}>"
 
@@ -724,6 +1205,8 @@ def not_(validator, *, msg=None, exc_types=(ValueError, TypeError)):
 class _OrValidator:
     validators = attrib()
 
+    _wraps_validators = True
+
     def __call__(self, inst, attr, value):
         for v in self.validators:
             try:
@@ -736,6 +1219,15 @@ class _OrValidator:
         msg = f"None of {self.validators!r} satisfied for value {value!r}"
         raise ValueError(msg)
 
+    def _predicate(self, add_global):
+        predicates = [
+            _validator_predicate(v, add_global) for v in self.validators
+        ]
+        if not predicates or None in predicates:
+            return None
+
+        return " or ".join(f"({p})" for p in predicates)
+
     def __repr__(self):
         return f"<or validator wrapping {self.validators!r}>"
 
@@ -764,3 +1256,372 @@ def or_(*validators):
         vals.extend(v.validators if isinstance(v, _OrValidator) else [v])
 
     return _OrValidator(tuple(vals))
+
+
+@attrs(repr=False, slots=True, unsafe_hash=True)
+class _MemoizeValidator:
+    validator = attrib()
+    maxsize = attrib()
+    _passed = attrib(init=False, factory=OrderedDict, eq=False)
+    _lock = attrib(init=False, factory=threading.Lock, eq=False)
+
+    def __call__(self, inst, attr, value):
+        """
+        We use a callable class to be able to change the ``__repr__``.
+        """
+        key = _memo_key(value)
+        if key is None:
+            self.validator(inst, attr, value)
+            return
+
+        passed = self._passed
+        with self._lock:
+            if key in passed:
+                passed.move_to_end(key)
+                return
+
+        self.validator(inst, attr, value)
+
+        if self.maxsize == 0:
+            return
+
+        with self._lock:
+            passed[key] = None
+            if self.maxsize is not None and len(passed) > self.maxsize:
+                passed.popitem(last=False)
+
+    def __repr__(self):
+        return f"<memoizing validator for {self.validator!r}>"
+
+
+# Classes whose equal instances no pure validator can tell apart -- except
+# for the sign of zero floats, which _memo_key adds to their keys.
+_MEMOIZABLE_TYPES = frozenset((bool, bytes, float, int, str, NoneType))
+
+
+def _memo_key(value):
+    """
+    Return a key under which `memoize` remembers *value* -- or None if it
+    can't be remembered.
+
+    Keys include the classes of the value and -- for tuples and frozensets --
+    of all of its members, such that, for example, ``(1,)`` and ``(1.0,)``
+    are distinct.  Keys of floats include their signs, such that ``0.0`` and
+    ``-0.0`` are distinct, too.
+    """
+    cls = value.__class__
+    if cls is float:
+        return cls, value, math.copysign(1.0, value)
+    if cls in _MEMOIZABLE_TYPES:
+        return cls, value
+
+    if cls is tuple or cls is frozenset:
+        keys = [_memo_key(member) for member in value]
+        if any(key is None for key in keys):
+            return None
+
+        return cls, cls(keys)
+
+    return None
+
+
+def memoize(validator, maxsize=128):
+    """
+    A validator that remembers the values that *validator* accepted and
+    doesn't call it again for them.
+
+    Useful for expensive validators -- like `matches_re` with complex
+    patterns or validators that parse their values -- that see the same
+    values over and over.
+
+    *validator* must be *pure*: whether it accepts a value may only depend on
+    the value -- not on the instance, the attribute, or any outside state.
+    Only values of the classes `int`, `float`, `str`, `bytes`, `bool`, and
+    `None` -- as well as tuples and frozensets of them -- are remembered;
+    other values are always validated.  They are remembered together with
+    their classes and the classes of their members, so ``1`` and ``1.0`` as
+    well as ``(1,)`` and ``(1.0,)`` are distinct.  So are ``0.0`` and
+    ``-0.0``.
+
+    The memoizing validator is thread-safe.
+
+    Args:
+        validator
+            (typing.Callable | tuple[typing.Callable] | list[typing.Callable]):
+            The validator (or validators) to memoize.
+
+        maxsize (int | None):
+            The maximum number of accepted values to remember.  If more
+            values are accepted, the least recently validated ones are
+            forgotten.  `None` remembers all.
+
+    .. versionadded:: 26.2.0
+    """
+    if isinstance(validator, (list, tuple)):
+        validator = and_(*validator)
+
+    return _MemoizeValidator(validator, maxsize)
+
+
+# How many members of collections derived type checks validate.
+_TYPE_CHECK_SAMPLE = 64
+
+
+@attrs(repr=False, frozen=True, slots=True)
+class _TypeCheckValidator:
+    type = attrib()
+    validator = attrib()
+
+    _wraps_validators = True
+
+    def __call__(self, inst, attr, value):
+        if _config._check_types:
+            self.validator(inst, attr, value)
+
+    def _predicate(self, add_global):
+        predicate = _validator_predicate(self.validator, add_global)
+        if predicate is None:
+            return None
+
+        return f"{add_global(_config)}._check_types is False or ({predicate})"
+
+    def __repr__(self):
+        return f"<type check validator for {self.type!r}>"
+
+
+@attrs(repr=False, slots=True, unsafe_hash=True)
+class _LiteralValidator:
+    values = attrib()
+    _keys = attrib(init=False, eq=False)
+
+    def __attrs_post_init__(self):
+        # Include the classes such that 1, 1.0, and True are distinct.
+        self._keys = frozenset((v.__class__, v) for v in self.values)
+
+    def __call__(self, inst, attr, value):
+        try:
+            ok = (value.__class__, value) in self._keys
+        except TypeError:  # unhashable
+            ok = False
+
+        if not ok:
+            msg = f"'{attr.name}' must be one of {self.values!r} (got {value!r} that is a {value.__class__!r})."
+            raise ValueError(msg, attr, self.values, value)
+
+    def _predicate(self, add_global):
+        return f"(value.__class__, value) in {add_global(self._keys)}"
+
+    def __repr__(self):
+        return f"<literal validator for {self.values!r}>"
+
+
+@attrs(repr=False, slots=True, unsafe_hash=True)
+class _LazyTypeCheckValidator:
+    name = attrib()
+    warn = attrib(default=True, eq=False)
+    _resolved = attrib(default=False, init=False, eq=False)
+    _validator = attrib(default=None, init=False, eq=False)
+
+    def __call__(self, inst, attr, value):
+        if not _config._check_types:
+            return
+
+        v = self._validator
+        if not self._resolved:
+            try:
+                t = _resolve_type_hints(inst.__class__)[self.name]
+            except Exception as e:  # noqa: BLE001
+                if self.warn:
+                    warnings.warn(
+                        f"Can't resolve the annotation of {self.name!r} of {inst.__class__!r}, so it isn't type-checked: {e}",
+                        stacklevel=_user_stacklevel(),
+                    )
+                v = None
+            else:
+                v = _type_check(t)
+                if v is not None:
+                    v = _compile_validator(v)
+
+            self._validator = v
+            self._resolved = True
+
+        if v is not None:
+            v(inst, attr, value)
+
+    def __repr__(self):
+        return f"<lazy type check validator for {self.name!r}>"
+
+
+def _resolve_type_hints(cls):
+    """
+    Resolve the annotations of *cls* like `typing.get_type_hints` -- falling
+    back to looking up the classes of its MRO by name, such that classes that
+    are defined in functions can reference themselves.
+    """
+    try:
+        return typing.get_type_hints(cls)
+    except NameError:
+        return typing.get_type_hints(
+            cls, localns={c.__name__: c for c in reversed(cls.__mro__)}
+        )
+
+
+def _lazy_type_check(name, warn=True):
+    """
+    Return a validator that resolves the annotation of the field *name* when
+    it's called for the first time -- and warns if that fails and *warn* is
+    True.
+    """
+    return _LazyTypeCheckValidator(name, warn)
+
+
+def _type_check(t):
+    """
+    Return a validator that checks values against the resolved annotation
+    *t* -- or None if it can't be checked.
+    """
+    try:
+        hash(t)
+    except TypeError:  # unhashable
+        return _make_type_check(t)
+
+    return _cached_type_check(t)
+
+
+def _make_type_check(t):
+    """
+    Return a new validator that checks values against *t* -- or None.
+    """
+    v = _derive_type_check(t)
+
+    return None if v is None else _TypeCheckValidator(t, v)
+
+
+# Derived type checks, keyed by annotation -- such that fields with the same
+# annotation share a validator that is compiled only once.
+_cached_type_check = lru_cache(maxsize=4096)(_make_type_check)
+
+
+def _derive_type_check(t):
+    """
+    Derive the validator for `_type_check`, without wrapping and caching it.
+
+    Classes become `instance_of`, unions of them `instance_of` with a tuple of
+    types, and collections `deep_iterable` or `deep_mapping` that check a
+    sample of their members.  Type variables, `typing.Any`, unresolved
+    forward references, and protocols that aren't runtime-checkable aren't
+    checked.
+    """
+    if t is None or t is NoneType:
+        return instance_of(NoneType)
+
+    if (
+        t is typing.Any
+        or t is object
+        or isinstance(t, (str, typing.ForwardRef, typing.TypeVar))
+    ):
+        return None
+
+    supertype = getattr(t, "__supertype__", None)  # NewType
+    if supertype is not None:
+        return _derive_type_check(supertype)
+
+    origin = typing.get_origin(t)
+    if origin is None:
+        return _derive_class_check(t)
+
+    derive = _DERIVE_BY_ORIGIN.get(origin, _derive_generic_check)
+
+    return derive(origin, typing.get_args(t))
+
+
+# int is acceptable where float is expected -- see PEP 484.
+_NUMERIC_TOWER = {float: (float, int), complex: (complex, float, int)}
+
+
+def _derive_class_check(t):
+    if not isinstance(t, type) or (
+        getattr(t, "_is_protocol", False)
+        and not getattr(t, "_is_runtime_protocol", False)
+    ):
+        return None
+
+    return instance_of(_NUMERIC_TOWER.get(t, t))
+
+
+def _derive_wrapped_check(origin, args):
+    return _derive_type_check(args[0])
+
+
+def _derive_union_check(origin, args):
+    vs = [_derive_type_check(arg) for arg in args]
+    if None in vs:
+        return None
+
+    if any(v.__class__ is not _InstanceOfValidator for v in vs):
+        return or_(*vs)
+
+    ts = []
+    for v in vs:
+        ts.extend(v.type if isinstance(v.type, tuple) else (v.type,))
+
+    return instance_of(tuple(ts))
+
+
+def _derive_literal_check(origin, args):
+    return _LiteralValidator(args)
+
+
+def _derive_callable_check(origin, args):
+    return is_callable()
+
+
+def _derive_generic_check(origin, args):
+    if not isinstance(origin, type):
+        return None
+
+    check = instance_of(origin)
+    if not args or not issubclass(origin, collections.abc.Collection):
+        # Don't consume iterators and generators.
+        return check
+
+    if issubclass(origin, collections.abc.Mapping):
+        return _derive_mapping_check(check, args)
+
+    if issubclass(origin, tuple) and not (
+        len(args) == 2 and args[1] is Ellipsis
+    ):
+        # Members of fixed-size tuples have different types.
+        return check
+
+    member_check = _derive_type_check(args[0])
+    if member_check is None:
+        return check
+
+    return deep_iterable(member_check, check, sample=_TYPE_CHECK_SAMPLE)
+
+
+def _derive_mapping_check(check, args):
+    if len(args) != 2:
+        return check
+
+    key_check, value_check = map(_derive_type_check, args)
+    if key_check is None and value_check is None:
+        return check
+
+    return deep_mapping(
+        key_check, value_check, check, sample=_TYPE_CHECK_SAMPLE
+    )
+
+
+# How to derive type checks from generic annotations, by their origin.
+# Other origins are treated as generic classes.
+_DERIVE_BY_ORIGIN = {
+    typing.Annotated: _derive_wrapped_check,
+    typing.ClassVar: _derive_wrapped_check,
+    typing.Final: _derive_wrapped_check,
+    typing.Union: _derive_union_check,
+    types.UnionType: _derive_union_check,
+    typing.Literal: _derive_literal_check,
+    collections.abc.Callable: _derive_callable_check,
+}
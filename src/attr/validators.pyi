@@ -31,6 +31,11 @@ _M = TypeVar("_M", bound=Mapping)
 def set_disabled(run: bool) -> None: ...
 def get_disabled() -> bool: ...
 def disabled() -> ContextManager[None]: ...
+def set_exhaustive(exhaustive: bool) -> None: ...
+def get_exhaustive() -> bool: ...
+def exhaustive() -> ContextManager[None]: ...
+def set_check_types(check: bool) -> None: ...
+def get_check_types() -> bool: ...
 
 # To be more precise on instance_of use some overloads.
 # If there are more than 3 items in the tuple then we fall back to Any
@@ -67,19 +72,34 @@ def matches_re(
 def deep_iterable(
     member_validator: _ValidatorArgType[_T],
     iterable_validator: _ValidatorArgType[_I] | None = ...,
+    *,
+    sample: int | float | None = ...,
+    prefix: int | None = ...,
+    seed: Any = ...,
 ) -> _ValidatorType[_I]: ...
 @overload
 def deep_mapping(
     key_validator: _ValidatorArgType[_K],
     value_validator: _ValidatorArgType[_V] | None = ...,
     mapping_validator: _ValidatorArgType[_M] | None = ...,
+    *,
+    sample: int | float | None = ...,
+    prefix: int | None = ...,
+    seed: Any = ...,
 ) -> _ValidatorType[_M]: ...
 @overload
 def deep_mapping(
     key_validator: _ValidatorArgType[_K] | None = ...,
     value_validator: _ValidatorArgType[_V] = ...,
     mapping_validator: _ValidatorArgType[_M] | None = ...,
+    *,
+    sample: int | float | None = ...,
+    prefix: int | None = ...,
+    seed: Any = ...,
 ) -> _ValidatorType[_M]: ...
+def memoize(
+    validator: _ValidatorArgType[_T], maxsize: int | None = ...
+) -> _ValidatorType[_T]: ...
 def is_callable() -> _ValidatorType[_T]: ...
 def lt(val: _T) -> _ValidatorType[_T]: ...
 def le(val: _T) -> _ValidatorType[_T]: ...
@@ -22,7 +22,18 @@ from attr import (
     resolve_types,
     validate,
 )
-from attr._make import ClassProps
+from attr._codec import Codec, MappedArray, codec
+from attr._funcs import (
+    assign,
+    batch_update,
+    changed_fields,
+    clear_changes,
+    diff,
+    evolve_in,
+    evolve_in_many,
+    walk,
+)
+from attr._make import ClassProps, validate_many
 from attr._next_gen import asdict, astuple, inspect
 
 from . import exceptions, filters, setters
@@ -33,8 +44,10 @@ __all__ = [
     "Attribute",
     "AttrsInstance",
     "ClassProps",
+    "Codec",
     "Converter",
     "Factory",
+    "MappedArray",
     "NothingType",
     "__author__",
     "__copyright__",
@@ -47,12 +60,20 @@ __all__ = [
     "__version__",
     "__version_info__",
     "asdict",
+    "assign",
     "assoc",
     "astuple",
+    "batch_update",
+    "changed_fields",
+    "clear_changes",
     "cmp_using",
+    "codec",
     "converters",
     "define",
+    "diff",
     "evolve",
+    "evolve_in",
+    "evolve_in_many",
     "exceptions",
     "field",
     "fields",
@@ -66,7 +87,9 @@ __all__ = [
     "resolve_types",
     "setters",
     "validate",
+    "validate_many",
     "validators",
+    "walk",
 ]
 
 __getattr__ = _make_getattr(__name__)
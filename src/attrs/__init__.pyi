@@ -1,8 +1,15 @@
 import sys
 
+from concurrent.futures import Executor
+from os import PathLike
 from typing import (
     Any,
     Callable,
+    ContextManager,
+    Generic,
+    Iterable,
+    Iterator,
+    Literal,
     Mapping,
     Sequence,
     overload,
@@ -62,6 +69,7 @@ _OnSetAttrType = (
     | Callable[[Any, "Attribute[Any]", Any], Generator[Any]]
 )
 _OnSetAttrArgType = _OnSetAttrType | list[_OnSetAttrType] | setters._NoOpType
+_FilterType = Callable[["Attribute[_T]", _T], bool]
 _FieldTransformer = Callable[
     [type, list["Attribute[Any]"]], list["Attribute[Any]"]
 ]
@@ -183,6 +191,13 @@ def define(
     on_setattr: _OnSetAttrArgType | None = ...,
     field_transformer: _FieldTransformer | None = ...,
     match_args: bool = ...,
+    compact_pickle: bool = ...,
+    fast_evolve: bool = ...,
+    fast_copy: bool = ...,
+    intern: bool = ...,
+    track_changes: bool = ...,
+    invariants: Sequence[Callable[[Any], Any]] = ...,
+    check_types: bool = ...,
 ) -> _C: ...
 @overload
 @dataclass_transform(field_specifiers=(attrib, field))
@@ -209,6 +224,13 @@ def define(
     on_setattr: _OnSetAttrArgType | None = ...,
     field_transformer: _FieldTransformer | None = ...,
     match_args: bool = ...,
+    compact_pickle: bool = ...,
+    fast_evolve: bool = ...,
+    fast_copy: bool = ...,
+    intern: bool = ...,
+    track_changes: bool = ...,
+    invariants: Sequence[Callable[[Any], Any]] = ...,
+    check_types: bool = ...,
 ) -> Callable[[_C], _C]: ...
 
 mutable = define
@@ -238,6 +260,13 @@ def frozen(
     on_setattr: _OnSetAttrArgType | None = ...,
     field_transformer: _FieldTransformer | None = ...,
     match_args: bool = ...,
+    compact_pickle: bool = ...,
+    fast_evolve: bool = ...,
+    fast_copy: bool = ...,
+    intern: bool = ...,
+    track_changes: bool = ...,
+    invariants: Sequence[Callable[[Any], Any]] = ...,
+    check_types: bool = ...,
 ) -> _C: ...
 @overload
 @dataclass_transform(frozen_default=True, field_specifiers=(attrib, field))
@@ -264,6 +293,13 @@ def frozen(
     on_setattr: _OnSetAttrArgType | None = ...,
     field_transformer: _FieldTransformer | None = ...,
     match_args: bool = ...,
+    compact_pickle: bool = ...,
+    fast_evolve: bool = ...,
+    fast_copy: bool = ...,
+    intern: bool = ...,
+    track_changes: bool = ...,
+    invariants: Sequence[Callable[[Any], Any]] = ...,
+    check_types: bool = ...,
 ) -> Callable[[_C], _C]: ...
 
 class ClassProps:
@@ -290,6 +326,13 @@ class ClassProps:
     added_pickling: bool
     on_setattr_hook: _OnSetAttrType | None
     field_transformer: Callable[[Attribute[Any]], Attribute[Any]] | None
+    added_compact_pickling: bool
+    added_fast_evolve: bool
+    added_fast_copy: bool
+    added_interning: bool
+    added_change_tracking: bool
+    invariants: tuple[Callable[[Any], Any], ...]
+    added_type_checks: bool
 
     def __init__(
         self,
@@ -311,8 +354,66 @@ class ClassProps:
         added_pickling: bool,
         on_setattr_hook: _OnSetAttrType,
         field_transformer: Callable[[Attribute[Any]], Attribute[Any]],
+        added_compact_pickling: bool = ...,
+        added_fast_evolve: bool = ...,
+        added_fast_copy: bool = ...,
+        added_interning: bool = ...,
+        added_change_tracking: bool = ...,
+        invariants: tuple[Callable[[Any], Any], ...] = ...,
+        added_type_checks: bool = ...,
     ) -> None: ...
     @property
     def is_hashable(self) -> bool: ...
 
 def inspect(cls: type) -> ClassProps: ...
+def evolve_in(inst: _T, path: Sequence[str], value: Any) -> _T: ...
+def evolve_in_many(inst: _T, changes: Mapping[tuple[str, ...], Any]) -> _T: ...
+def changed_fields(inst: AttrsInstance) -> tuple[str, ...]: ...
+def clear_changes(inst: AttrsInstance) -> None: ...
+def assign(inst: AttrsInstance, **changes: Any) -> None: ...
+def validate_many(
+    instances: Iterable[AttrsInstance],
+    *,
+    executor: Executor | None = ...,
+    chunksize: int = ...,
+) -> list[tuple[int, str | None, Exception]]: ...
+def batch_update(inst: _T) -> ContextManager[_T]: ...
+def diff(
+    a: AttrsInstance,
+    b: AttrsInstance,
+    *,
+    recurse: bool = ...,
+    filter: _FilterType[Any] | None = ...,
+) -> list[tuple[str, ...]]: ...
+def walk(
+    inst: AttrsInstance,
+    *,
+    order: Literal["pre", "post"] = ...,
+    filter: _FilterType[Any] | None = ...,
+) -> Iterator[tuple[tuple[Any, ...], Attribute[Any], Any]]: ...
+
+class Codec(Generic[_T]):
+    cls: type[_T]
+    format: str
+    size: int
+
+    def pack(self, inst: _T) -> bytes: ...
+    def pack_into(self, buffer: Any, offset: int, inst: _T) -> None: ...
+    def unpack(self, buffer: Any) -> _T: ...
+    def unpack_from(self, buffer: Any, offset: int = ...) -> _T: ...
+    def iter_unpack(self, buffer: Any) -> Iterator[_T]: ...
+
+def codec(cls: type[_T]) -> Codec[_T]: ...
+
+class MappedArray(Sequence[_T]):
+    cls: type[_T]
+
+    def __init__(self, cls: type[_T], path: str | PathLike[str]) -> None: ...
+    @overload
+    def __getitem__(self, index: int) -> _T: ...
+    @overload
+    def __getitem__(self, index: slice) -> MappedArray[_T]: ...
+    def __len__(self) -> int: ...
+    def __enter__(self) -> MappedArray[_T]: ...
+    def __exit__(self, *args: object) -> None: ...
+    def close(self) -> None: ...
@@ -0,0 +1,377 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Tests for `attrs.codec`.
+"""
+
+import bisect
+import mmap
+import pickle
+import struct
+
+from typing import Annotated
+
+import pytest
+
+import attrs
+
+
+@attrs.frozen
+class Point:
+    x: int
+    y: float
+
+
+@attrs.define
+class Record:
+    a: Point
+    b: Point
+    tag: Annotated[bytes, 4]
+    flag: bool
+    small: Annotated[int, "h"] = 0
+
+
+class TestCodec:
+    def test_round_trip(self):
+        """
+        Packed instances unpack to equal instances, including nested classes.
+        """
+        c = attrs.codec(Record)
+        r = Record(Point(1, 2.5), Point(-3, 4.0), b"abcd", True, 7)
+
+        packed = c.pack(r)
+
+        assert isinstance(packed, bytes)
+        assert c.size == len(packed)
+        assert r == c.unpack(packed)
+
+    def test_format(self):
+        """
+        The format is derived from the annotations and standardized.
+        """
+        c = attrs.codec(Record)
+
+        assert "<qdqd4s?h" == c.format
+        assert 8 + 8 + 8 + 8 + 4 + 1 + 2 == c.size
+
+    def test_cached(self):
+        """
+        The codec is created once per class.
+        """
+        assert attrs.codec(Point) is attrs.codec(Point)
+        assert attrs.codec(Point) is not attrs.codec(Record)
+
+    def test_bytes_are_padded(self):
+        """
+        Fixed-length bytes are padded with null bytes.
+        """
+        c = attrs.codec(Record)
+
+        r = c.unpack(c.pack(Record(Point(1, 2), Point(3, 4), b"ab", False)))
+
+        assert b"ab\x00\x00" == r.tag
+
+    def test_unpack_buffers(self):
+        """
+        unpack and unpack_from accept any buffer without copying.
+        """
+        c = attrs.codec(Point)
+        buf = bytearray(c.pack(Point(1, 2.0)) + c.pack(Point(3, 4.0)))
+        view = memoryview(buf)
+
+        assert Point(1, 2.0) == c.unpack(view[: c.size])
+        assert Point(3, 4.0) == c.unpack_from(view, c.size)
+
+    def test_pack_into(self):
+        """
+        pack_into writes into a writable buffer at an offset.
+        """
+        c = attrs.codec(Point)
+        buf = bytearray(2 * c.size)
+
+        c.pack_into(buf, c.size, Point(5, 6.0))
+
+        assert Point(5, 6.0) == c.unpack_from(buf, c.size)
+        assert Point(0, 0.0) == c.unpack_from(buf)
+
+    def test_iter_unpack_mmap(self, tmp_path):
+        """
+        iter_unpack streams records from a memory-mapped file.
+        """
+        c = attrs.codec(Point)
+        points = [Point(i, i / 2) for i in range(10)]
+        path = tmp_path / "points.bin"
+        path.write_bytes(b"".join(c.pack(p) for p in points))
+
+        with (
+            path.open("rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m,
+        ):
+            assert points == list(c.iter_unpack(m))
+
+    def test_no_init(self):
+        """
+        Unpacking bypasses __init__ and thus validators.
+        """
+
+        @attrs.define
+        class C:
+            x: int = attrs.field(validator=attrs.validators.gt(0))
+
+        c = attrs.codec(C)
+
+        with pytest.raises(ValueError):
+            C(-1)
+
+        assert -1 == c.unpack(struct.pack("<q", -1)).x
+
+    def test_cache_hash(self):
+        """
+        Instances of hash-caching classes get a fresh hash cache.
+        """
+
+        @attrs.frozen(cache_hash=True)
+        class C:
+            x: int
+
+        c = attrs.codec(C)
+        i = c.unpack(c.pack(C(42)))
+
+        assert hash(C(42)) == hash(i)
+
+    def test_string_annotations(self):
+        """
+        String annotations are resolved.
+        """
+
+        @attrs.define
+        class C:
+            x: "int"
+            y: "bool"
+
+        assert "<q?" == attrs.codec(C).format
+
+    def test_variable_width(self):
+        """
+        Fields without a fixed-width representation raise a TypeError.
+        """
+
+        @attrs.define
+        class C:
+            x: str
+
+        with pytest.raises(
+            TypeError, match=r"Field 'x' of .* has no fixed-width"
+        ):
+            attrs.codec(C)
+
+    def test_bytes_without_length(self):
+        """
+        bytes fields need a length.
+        """
+
+        @attrs.define
+        class C:
+            x: bytes
+
+        with pytest.raises(TypeError, match="no fixed-width"):
+            attrs.codec(C)
+
+    @pytest.mark.parametrize(
+        ("t", "fmt"),
+        [
+            (int, "!!"),
+            (int, "3i"),
+            (int, "x"),
+            (int, "<i"),
+            (int, "d"),
+            (float, "s"),
+            (float, "q"),
+            (bool, "b"),
+        ],
+    )
+    def test_invalid_format(self, t, fmt):
+        """
+        Format strings that aren't a single format character that fits the
+        type raise a TypeError.
+        """
+        C = attrs.make_class("C", {"x": attrs.field(type=Annotated[t, fmt])})
+
+        with pytest.raises(TypeError, match="is not a valid struct format"):
+            attrs.codec(C)
+
+    def test_bytes_padding_and_truncation(self):
+        """
+        Shorter bytes values are padded with null bytes that are kept when
+        unpacking, longer ones are truncated.
+        """
+
+        @attrs.define
+        class C:
+            x: Annotated[bytes, 4]
+
+        c = attrs.codec(C)
+
+        assert b"ab\x00\x00" == c.unpack(c.pack(C(b"ab"))).x
+        assert b"abcd" == c.unpack(c.pack(C(b"abcdef"))).x
+
+    def test_recursive(self):
+        """
+        Recursive classes raise a TypeError.
+        """
+
+        @attrs.define
+        class C:
+            x: "C"
+
+        attrs.resolve_types(C, localns={"C": C})
+
+        with pytest.raises(TypeError, match="is recursive"):
+            attrs.codec(C)
+
+    def test_not_an_attrs_class(self):
+        """
+        Passing a class that is not an attrs class raises
+        NotAnAttrsClassError.
+        """
+        with pytest.raises(attrs.exceptions.NotAnAttrsClassError):
+            attrs.codec(object)
+
+    def test_smaller_than_pickle(self):
+        """
+        The whole point.
+        """
+        p = Point(1, 2.0)
+
+        assert len(attrs.codec(Point).pack(p)) < len(pickle.dumps(p))
+
+
+@pytest.fixture(name="points_path")
+def _points_path(tmp_path):
+    c = attrs.codec(Point)
+    path = tmp_path / "points.bin"
+    path.write_bytes(b"".join(c.pack(Point(i, i / 2)) for i in range(100)))
+
+    return path
+
+
+class TestMappedArray:
+    def test_sequence(self, points_path):
+        """
+        MappedArray behaves like a read-only sequence of instances.
+        """
+        with attrs.MappedArray(Point, points_path) as a:
+            assert 100 == len(a)
+            assert Point(0, 0.0) == a[0]
+            assert Point(99, 49.5) == a[-1]
+            assert Point(7, 3.5) in a
+            assert 7 == a.index(Point(7, 3.5))
+            assert [Point(i, i / 2) for i in range(100)] == list(a)
+
+            with pytest.raises(IndexError):
+                a[100]
+
+    def test_slicing(self, points_path):
+        """
+        Slices are lazy MappedArrays that share the mapping.
+        """
+        with attrs.MappedArray(Point, points_path) as a:
+            s = a[10:20]
+
+            assert isinstance(s, attrs.MappedArray)
+            assert 10 == len(s)
+            assert Point(10, 5.0) == s[0]
+            assert [Point(i, i / 2) for i in range(10, 20)] == list(s)
+            assert [Point(i, i / 2) for i in range(90, 100, 4)] == list(
+                a[90::4]
+            )
+            assert Point(99, 49.5) == a[::-1][0]
+            assert [Point(12, 6.0)] == list(s[2:3])
+
+    def test_bisect(self, points_path):
+        """
+        MappedArrays can be binary-searched.
+        """
+        with attrs.MappedArray(Point, points_path) as a:
+            assert 42 == bisect.bisect_left(a, 42, key=lambda p: p.x)
+
+    def test_empty(self, tmp_path):
+        """
+        Empty files are empty sequences.
+        """
+        path = tmp_path / "empty.bin"
+        path.write_bytes(b"")
+
+        with attrs.MappedArray(Point, path) as a:
+            assert 0 == len(a)
+            assert [] == list(a)
+
+    def test_wrong_size(self, tmp_path):
+        """
+        Files whose size isn't a multiple of the record size are rejected.
+        """
+        path = tmp_path / "broken.bin"
+        path.write_bytes(b"x" * 17)
+
+        with pytest.raises(
+            ValueError, match=r"\(17 bytes\) is not a multiple"
+        ):
+            attrs.MappedArray(Point, path)
+
+    def test_close(self, points_path):
+        """
+        Closing invalidates the array and its slices.
+        """
+        a = attrs.MappedArray(Point, points_path)
+        s = a[:10]
+
+        a.close()
+
+        with pytest.raises(ValueError):
+            s[0]
+
+        a.close()
+
+    def test_close_with_live_iterator(self, points_path):
+        """
+        Closing while iterators are in use raises a BufferError and leaves the
+        array open.  Once the iterators are gone, closing works.
+        """
+        a = attrs.MappedArray(Point, points_path)
+        it = iter(a[5:])
+        next(it)
+
+        with pytest.raises(BufferError, match="iterators over it are in use"):
+            a.close()
+
+        with attrs.MappedArray(Point, points_path) as other:
+            assert other[0] == a[0]
+        assert 94 == len(list(it))
+
+        list(iter(a))  # exhausted iterators don't count
+        a.close()
+
+        with pytest.raises(ValueError):
+            a[0]
+
+    def test_no_fields(self, tmp_path):
+        """
+        Classes without fields are rejected.
+        """
+
+        @attrs.define
+        class Empty:
+            pass
+
+        path = tmp_path / "empty.bin"
+        path.write_bytes(b"")
+
+        with pytest.raises(ValueError, match="because they're empty"):
+            attrs.MappedArray(Empty, path)
+
+    def test_repr(self, points_path):
+        """
+        The repr contains the length and the class name.
+        """
+        with attrs.MappedArray(Point, points_path) as a:
+            assert "<MappedArray of 100 Point records>" == repr(a)
@@ -0,0 +1,204 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Tests for generated `__copy__` and `__deepcopy__` methods.
+"""
+
+import copy
+
+import pytest
+
+import attr
+import attrs
+
+
+@attrs.frozen(eq=False)
+class Frozen:
+    items: list
+
+
+@attrs.define(fast_copy=True)
+class Slotted:
+    x: int
+    items: list
+    frozen: Frozen = None
+
+
+@attrs.define(fast_copy=True, slots=False)
+class Dict:
+    x: int
+    items: list
+    frozen: Frozen = None
+
+
+@attrs.frozen(fast_copy=True, cache_hash=True)
+class Cached:
+    x: int
+
+
+@attrs.define
+class Sub(Slotted):
+    y: int = 0
+
+
+@attrs.define(slots=False)
+class DictSub(Dict):
+    y: int = 0
+
+
+@attrs.define(fast_copy=True, slots=False)
+class Plain:
+    x: int
+
+
+class DictItemsSub(Plain, dict):
+    pass
+
+
+class ListItemsSub(Plain, list):
+    pass
+
+
+class TestFastCopy:
+    @pytest.mark.parametrize("cls", [Slotted, Dict])
+    def test_copy(self, cls):
+        """
+        copy.copy creates a shallow copy.
+        """
+        inst = cls(1, [1, 2])
+
+        c = copy.copy(inst)
+
+        assert inst == c
+        assert inst is not c
+        assert inst.items is c.items
+
+    @pytest.mark.parametrize("cls", [Slotted, Dict])
+    def test_deepcopy(self, cls):
+        """
+        copy.deepcopy creates a deep copy.
+        """
+        inst = cls(1, [[1], [2]])
+
+        c = copy.deepcopy(inst)
+
+        assert inst == c
+        assert inst.items is not c.items
+        assert inst.items[0] is not c.items[0]
+
+    @pytest.mark.parametrize("cls", [Slotted, Dict])
+    def test_deepcopy_shares_frozen(self, cls):
+        """
+        Instances of frozen attrs classes are shared if the field is
+        annotated with their class.
+        """
+        inst = cls(1, [], Frozen([1]))
+
+        assert inst.frozen is copy.deepcopy(inst).frozen
+
+    def test_deepcopy_shares_frozen_only_in_field(self):
+        """
+        Items in __dict__ that aren't fields are deep-copied even if they're
+        instances of frozen attrs classes.
+        """
+        inst = Dict(1, [])
+        inst.extra = Frozen([1])
+
+        c = copy.deepcopy(inst)
+
+        assert inst.extra is not c.extra
+        assert inst.extra.items is not c.extra.items
+
+    def test_deepcopy_cycles(self):
+        """
+        Reference cycles are preserved.
+        """
+        inst = Slotted(1, [])
+        inst.items.append(inst)
+
+        c = copy.deepcopy(inst)
+
+        assert c.items[0] is c
+
+    def test_extra_dict_items(self):
+        """
+        Instances of dict classes keep items in __dict__ that aren't fields.
+        """
+        inst = Dict(1, [])
+        inst.extra = [42]
+
+        c = copy.deepcopy(inst)
+
+        assert [42] == c.extra
+        assert inst.extra is not c.extra
+        assert inst.extra is copy.copy(inst).extra
+
+    def test_cache_hash(self):
+        """
+        The hash cache is reset.
+        """
+        inst = Cached(42)
+        hash(inst)
+
+        for c in (copy.copy(inst), copy.deepcopy(inst)):
+            assert None is object.__getattribute__(
+                c, attr._make._HASH_CACHE_FIELD
+            )
+            assert hash(inst) == hash(c)
+
+    @pytest.mark.parametrize("cls", [Sub, DictSub])
+    def test_subclass(self, cls):
+        """
+        Subclasses without fast copying keep all their fields.
+        """
+        inst = cls(1, [[2]], y=3)
+
+        c = copy.copy(inst)
+        dc = copy.deepcopy(inst)
+
+        assert cls is type(c) is type(dc)
+        assert inst == c
+        assert inst.items is c.items
+        assert inst == dc
+        assert inst.items[0] is not dc.items[0]
+
+    def test_subclass_container_items(self):
+        """
+        Subclasses that add dict or list bases keep their items.
+        """
+        d = DictItemsSub(1)
+        d["a"] = [1]
+        li = ListItemsSub(1)
+        li.append([2])
+
+        for copier in (copy.copy, copy.deepcopy):
+            cd = copier(d)
+            cl = copier(li)
+
+            assert 1 == cd.x == cl.x
+            assert {"a": [1]} == dict(cd)
+            assert [[2]] == list(cl)
+            assert (copier is copy.copy) is (d["a"] is cd["a"])
+            assert (copier is copy.copy) is (li[0] is cl[0])
+
+    @pytest.mark.parametrize("base", [dict, list, ValueError])
+    def test_builtin_base(self, base):
+        """
+        Classes with built-in bases whose state would be lost can't copy
+        fast.
+        """
+        with pytest.raises(
+            ValueError,
+            match="fast_copy can't be used with subclasses of built-in types",
+        ):
+
+            @attrs.define(fast_copy=True, slots=False)
+            class C(base):
+                x: int
+
+    def test_props(self):
+        """
+        ClassProps reflect fast copying.
+        """
+        assert attrs.inspect(Slotted).added_fast_copy
+        assert not attrs.inspect(Sub).added_fast_copy
@@ -196,6 +196,72 @@ class TestEqOrder:
         assert cls(1, 2) != NotEqC()
         assert not (cls(1, 2) == NotEqC())
 
+    @pytest.mark.parametrize("cls", [EqC, EqCSlots])
+    def test_identity(self, cls):
+        """
+        Instances are equal to themselves without comparing their fields.
+        """
+        nan = float("nan")
+        i = cls(nan, 1)
+
+        assert i == i
+        assert not (i != i)
+        assert i != cls(nan, 1)
+
+    @pytest.mark.parametrize("slots", [True, False])
+    def test_cached_hashes_differ(self, slots):
+        """
+        If both cached hashes differ, the fields aren't compared.
+        """
+        cls = simple_class(
+            eq=True,
+            unsafe_hash=None,
+            frozen=True,
+            cache_hash=True,
+            slots=slots,
+        )
+
+        class Unequal:
+            def __hash__(self):
+                return 42
+
+            def __eq__(self, other):
+                raise AssertionError
+
+        i, j = cls(Unequal(), 1), cls(Unequal(), 2)
+
+        # Without cached hashes, the fields are compared.
+        with pytest.raises(AssertionError):
+            i == j
+
+        hash(i)
+        hash(j)
+
+        assert i != j
+        assert not (i == j)
+
+    @pytest.mark.parametrize("slots", [True, False])
+    def test_cached_hashes_partial(self, slots):
+        """
+        Fields are compared if only one or none of the hashes is cached.
+        """
+        cls = simple_class(
+            eq=True,
+            unsafe_hash=None,
+            frozen=True,
+            cache_hash=True,
+            slots=slots,
+        )
+        i, j = cls(1, 2), cls(1, 2)
+
+        assert i == j
+
+        hash(i)
+
+        assert i == j
+        assert j == i
+        assert i != cls(1, 3)
+
     @pytest.mark.parametrize("cls", [OrderC, OrderCSlots])
     def test_lt(self, cls):
         """
@@ -677,6 +743,40 @@ class TestAddHash:
         assert 2 == uncached_instance.hash_counter.times_hash_called
         assert 1 == cached_instance.hash_counter.times_hash_called
 
+    def test_cache_invalidated_on_setattr(self, slots):
+        """
+        Reassigning a hashed field of a mutable class clears the hash cache,
+        reassigning other fields doesn't.
+        """
+
+        @attr.s(unsafe_hash=True, cache_hash=True, slots=slots)
+        class C:
+            x = attr.ib()
+            y = attr.ib(hash=False)
+            z = attr.ib(on_setattr=lambda _, __, v: v * 2)
+
+        i = C(1, 2, 3)
+        h = hash(i)
+
+        assert 3 == i.z
+        assert h == object.__getattribute__(i, "_attrs_cached_hash")
+
+        i.y = 42
+
+        assert h == object.__getattribute__(i, "_attrs_cached_hash")
+
+        i.x = 2
+
+        assert None is object.__getattribute__(i, "_attrs_cached_hash")
+        assert hash(C(2, 0, 3)) == hash(i)
+
+        hash(i)
+        i.z = 4
+
+        assert 8 == i.z
+        assert None is object.__getattribute__(i, "_attrs_cached_hash")
+        assert hash(C(2, 0, 8)) == hash(i)
+
     @pytest.mark.parametrize("cache_hash", [True, False])
     def test_copy_hash_cleared(self, cache_hash, frozen, slots):
         """
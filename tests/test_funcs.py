@@ -4,7 +4,10 @@
 Tests for `attr._funcs`.
 """
 
+import copy
+import pickle
 import re
+import sys
 
 from collections import OrderedDict
 from typing import Generic, NamedTuple, TypeVar
@@ -15,6 +18,7 @@ from hypothesis import assume, given
 from hypothesis import strategies as st
 
 import attr
+import attrs
 
 from attr import asdict, assoc, astuple, evolve, fields, has
 from attr._compat import Mapping, Sequence
@@ -22,6 +26,7 @@ from attr.exceptions import AttrsAttributeNotFoundError
 from attr.validators import instance_of
 
 from .strategies import nested_classes, simple_classes
+from .utils import ordered
 
 
 MAPPING_TYPES = (dict, OrderedDict)
@@ -848,3 +853,987 @@ class TestEvolve:
             inst: int
 
         assert C(42) == evolve(C(23), inst=42)
+
+
+class TestFastEvolve:
+    """
+    Tests for `evolve` with classes that use *fast_evolve*.
+    """
+
+    @pytest.mark.parametrize("slots", [True, False])
+    @pytest.mark.parametrize("frozen", [True, False])
+    def test_change(self, slots, frozen):
+        """
+        Changed fields are changed, the others are copied.
+        """
+
+        @attr.define(slots=slots, frozen=frozen, fast_evolve=True)
+        class C:
+            x: int
+            _y: list = attr.field(factory=list)
+
+        i1 = C(1)
+        i2 = evolve(i1, x=2)
+
+        assert C(2, i1._y) == i2
+        assert i1._y is i2._y
+        assert C(1, [1]) == evolve(i1, y=[1])
+        assert i1 == evolve(i1)
+        assert i1 is not evolve(i1)
+
+    def test_only_changed_are_processed(self):
+        """
+        Converters and validators only run for changed fields.
+        """
+        calls = []
+
+        def conv(v):
+            calls.append(("conv", v))
+            return v
+
+        def val(_, a, v):
+            calls.append(("val", a.name, v))
+
+        @attr.frozen(fast_evolve=True)
+        class C:
+            x: int = attr.field(converter=conv, validator=val)
+            y: int = attr.field(converter=conv, validator=val)
+
+        i = C(1, 2)
+        calls.clear()
+        i2 = evolve(i, y=3)
+
+        assert [("conv", 3), ("val", "y", 3)] == calls
+        assert (1, 3) == (i2.x, i2.y)
+
+    def test_validator_failure(self):
+        """
+        Failing validators raise.
+        """
+
+        @attr.define(fast_evolve=True)
+        class C:
+            a: int = attr.field(validator=instance_of(int))
+
+        with pytest.raises(TypeError, match="'a' must be <class 'int'>"):
+            evolve(C(1), a="some string")
+
+        with attr.validators.disabled():
+            assert "x" == evolve(C(1), a="x").a
+
+    def test_unknown(self):
+        """
+        Unknown fields raise a TypeError like __init__ does.
+        """
+
+        @attr.define(fast_evolve=True)
+        class C:
+            _a: int
+
+        with pytest.raises(
+            TypeError,
+            match=r"C.__init__\(\) got an unexpected keyword argument '_a'",
+        ):
+            evolve(C(1), _a=2)
+
+    def test_hooks_and_non_init(self):
+        """
+        Fields with init=False are initialized like in __init__ and the
+        pre- and post-init hooks are called.
+        """
+
+        @attr.define(fast_evolve=True)
+        class C:
+            x: int
+            counter: list = attr.field(init=False, factory=list)
+            double: int = attr.field(init=False)
+            default: int = attr.field(init=False, default=42)
+
+            def __attrs_pre_init__(self):
+                assert not hasattr(self, "x")
+
+            def __attrs_post_init__(self):
+                self.double = self.x * 2
+                self.counter.append("post")
+
+        i = C(1)
+        i.default = 23
+        i2 = evolve(i, x=5)
+
+        assert (10, ["post"], 42) == (i2.double, i2.counter, i2.default)
+        assert i.counter is not i2.counter
+
+    def test_cache_hash(self):
+        """
+        The hash cache is reset.
+        """
+
+        @attr.frozen(cache_hash=True, fast_evolve=True)
+        class C:
+            x: int
+
+        i = C(1)
+        hash(i)
+
+        assert hash(C(2)) == hash(evolve(i, x=2))
+
+    def test_subclass(self):
+        """
+        Instances of subclasses that don't use fast_evolve take the full path.
+        """
+
+        @attr.define(fast_evolve=True)
+        class Base:
+            x: int
+
+        @attr.define
+        class Sub(Base):
+            y: int = attr.field(converter=int)
+
+        assert not Sub.__attrs_props__.added_fast_evolve
+        assert Sub(2, 3) == evolve(Sub(1, 3), x=2)
+        assert Sub(2, 3) == Base.__replace__(Sub(1, 3), x=2)
+
+    def test_replace(self):
+        """
+        The generated method is the class's __replace__.
+        """
+
+        @attr.frozen(fast_evolve=True)
+        class C:
+            x: int
+
+        assert C.__attrs_props__.added_fast_evolve
+        assert C(2) == C(1).__replace__(x=2)
+
+    def test_can_change_inst(self):
+        """
+        Fields can be called inst and changes.
+        """
+
+        @attr.define(fast_evolve=True)
+        class C:
+            inst: int
+            changes: int
+
+        assert C(4, 5) == evolve(C(1, 2), inst=4, changes=5)
+
+    @pytest.mark.parametrize(
+        ("kw", "body", "match"),
+        [
+            ({"auto_exc": True}, (Exception,), "Exception classes"),
+            ({"init": False}, (), "custom __init__"),
+        ],
+    )
+    def test_unsupported(self, kw, body, match):
+        """
+        Exception classes and classes without a generated __init__ are
+        rejected.
+        """
+        with pytest.raises(ValueError, match=match):
+
+            @attr.s(fast_evolve=True, **kw)
+            class C(*body):
+                x = attr.ib()
+
+    def test_pre_init_with_args(self):
+        """
+        Pre-init hooks that take arguments are rejected.
+        """
+        with pytest.raises(ValueError, match="__attrs_pre_init__ that takes"):
+
+            @attr.define(fast_evolve=True)
+            class C:
+                x: int
+
+                def __attrs_pre_init__(self, x):
+                    pass
+
+
+@attr.frozen
+class Leaf:
+    x: int
+    y: int = 0
+
+
+@attr.frozen(fast_evolve=True)
+class Branch:
+    leaf: Leaf
+    other: Leaf = Leaf(-1)
+    _private: int = 0
+
+
+@attr.frozen
+class Tree:
+    left: Branch
+    right: Branch
+
+
+class TestEvolveIn:
+    """
+    Tests for `evolve_in` and `evolve_in_many`.
+    """
+
+    @pytest.mark.parametrize("name", ["count", "index"])
+    def test_tuple_method_names(self, name):
+        """
+        Names of tuple methods that aren't fields are rejected like any
+        other unknown name.
+        """
+        with pytest.raises(AttrsAttributeNotFoundError):
+            attrs.evolve_in(Leaf(1), (name,), 1)
+
+    def test_structural_sharing(self):
+        """
+        Only the spine of the path is recreated, the rest is shared.
+        """
+        t1 = Tree(Branch(Leaf(1)), Branch(Leaf(2)))
+
+        t2 = attrs.evolve_in(t1, ["left", "leaf", "x"], 42)
+
+        assert Tree(Branch(Leaf(42)), Branch(Leaf(2))) == t2
+        assert t1.right is t2.right
+        assert t1.left.other is t2.left.other
+        assert t1.left.leaf is not t2.left.leaf
+
+    def test_once_per_node(self, monkeypatch):
+        """
+        Every touched node is evolved once, even if hit by several paths.
+        """
+        t = Tree(Branch(Leaf(1)), Branch(Leaf(2)))
+        calls = []
+
+        def recording_evolve(inst, **changes):
+            calls.append((inst.__class__.__name__, sorted(changes)))
+            return evolve(inst, **changes)
+
+        monkeypatch.setattr(attr._funcs, "evolve", recording_evolve)
+
+        t2 = attrs.evolve_in_many(
+            t,
+            {
+                ("left", "leaf", "x"): 3,
+                ("left", "leaf", "y"): 4,
+                ("left", "_private"): 5,
+                ("right", "other"): Leaf(6),
+            },
+        )
+
+        assert (
+            Tree(Branch(Leaf(3, 4), private=5), Branch(Leaf(2), Leaf(6))) == t2
+        )
+        assert [
+            ("Leaf", ["x", "y"]),
+            ("Branch", ["leaf", "private"]),
+            ("Branch", ["other"]),
+            ("Tree", ["left", "right"]),
+        ] == calls
+
+    def test_private_names(self):
+        """
+        Paths use field names, not __init__ argument names.
+        """
+        b = Branch(Leaf(1))
+
+        assert 1 == attrs.evolve_in(b, ("_private",), 1)._private
+
+        with pytest.raises(AttrsAttributeNotFoundError):
+            attrs.evolve_in(b, ("private",), 1)
+
+    @pytest.mark.parametrize(
+        "changes",
+        [
+            {(): 1},
+            {("left",): 1, ("left", "leaf"): 2},
+            {("left", "leaf"): 2, ("left",): 1},
+        ],
+    )
+    def test_invalid_paths(self, changes):
+        """
+        Empty and overlapping paths are rejected.
+        """
+        t = Tree(Branch(Leaf(1)), Branch(Leaf(2)))
+
+        with pytest.raises(ValueError, match=r"(must not be empty|overlaps)"):
+            attrs.evolve_in_many(t, changes)
+
+    def test_not_attrs(self):
+        """
+        Paths through non-attrs instances raise NotAnAttrsClassError.
+        """
+        with pytest.raises(attr.exceptions.NotAnAttrsClassError):
+            attrs.evolve_in(Leaf(1), ("x", "real"), 1)
+
+
+@attrs.define(track_changes=True)
+class Tracked:
+    x: int = attrs.field(validator=attrs.validators.instance_of(int))
+    y: str = attrs.field(default="y", converter=str)
+    z: list = attrs.Factory(list)
+
+    def __attrs_post_init__(self):
+        self.z = [*self.z, "post-init"]
+
+
+@attrs.define(track_changes=True, slots=False)
+class TrackedDict:
+    x: int
+    y: int = 0
+
+
+@attrs.define(
+    track_changes=True, fast_evolve=True, fast_copy=True, compact_pickle=True
+)
+class TrackedFast:
+    x: int
+    y: int = 0
+
+
+class TestTrackChanges:
+    @pytest.mark.parametrize("cls", [Tracked, TrackedDict])
+    def test_changes(self, cls):
+        """
+        Reassigned fields are reported in definition order, regardless of
+        their hooks.
+        """
+        inst = cls(1)
+
+        assert () == attrs.changed_fields(inst)
+
+        inst.y = 2
+        inst.x = 3
+
+        assert ("x", "y") == attrs.changed_fields(inst)
+
+    def test_hooks_still_run(self):
+        """
+        Validators and converters run on tracked fields, failed assignments
+        don't count.
+        """
+        inst = Tracked(1)
+        inst.y = 42
+
+        assert "42" == inst.y
+
+        with pytest.raises(TypeError):
+            inst.x = "nope"
+
+        assert ("y",) == attrs.changed_fields(inst)
+
+    def test_init_does_not_count(self):
+        """
+        Assignments in __init__ and __attrs_post_init__ aren't changes.
+        """
+        inst = Tracked(1)
+
+        assert ["post-init"] == inst.z
+        assert () == attrs.changed_fields(inst)
+
+    @pytest.mark.parametrize("cls", [Tracked, TrackedDict])
+    def test_clear_changes(self, cls):
+        """
+        clear_changes forgets about all changes.
+        """
+        inst = cls(1)
+        inst.x = 2
+
+        attrs.clear_changes(inst)
+
+        assert () == attrs.changed_fields(inst)
+
+        inst.y = 3
+
+        assert ("y",) == attrs.changed_fields(inst)
+
+    def test_slot(self):
+        """
+        Slotted classes keep the changes in a slot.
+        """
+        assert "_attrs_changes" in Tracked.__slots__
+        assert not hasattr(Tracked(1), "__dict__")
+
+    @pytest.mark.parametrize("cls", [Tracked, TrackedDict])
+    def test_copy_and_pickle(self, cls):
+        """
+        Copies and unpickled instances keep the changes.
+        """
+        inst = cls(1)
+        inst.y = 2
+
+        for c in (
+            copy.copy(inst),
+            copy.deepcopy(inst),
+            pickle.loads(pickle.dumps(inst)),
+        ):
+            assert ("y",) == attrs.changed_fields(c)
+
+    def test_evolve(self):
+        """
+        Evolved instances start without changes.
+        """
+        inst = Tracked(1)
+        inst.x = 2
+
+        assert () == attrs.changed_fields(attrs.evolve(inst, y="z"))
+
+    def test_fast_paths(self):
+        """
+        Instances that are created without __init__ start without changes,
+        fast copies keep them.
+        """
+        inst = TrackedFast(1)
+        inst.x = 2
+
+        assert ("x",) == attrs.changed_fields(copy.copy(inst))
+
+        for c in (
+            attrs.evolve(inst, y=1),
+            pickle.loads(pickle.dumps(inst)),
+        ):
+            assert () == attrs.changed_fields(c)
+
+            c.y = 3
+
+            assert ("y",) == attrs.changed_fields(c)
+
+    def test_subclass(self):
+        """
+        Subclasses track their own fields as well as inherited ones.
+        """
+
+        @attrs.define(track_changes=True)
+        class Sub(Tracked):
+            w: int = 0
+
+        inst = Sub(1)
+        inst.w = 1
+        inst.x = 2
+
+        assert ("x", "w") == attrs.changed_fields(inst)
+
+    def test_not_tracking(self):
+        """
+        Instances of classes that don't track changes raise a TypeError.
+        """
+
+        @attrs.define
+        class C:
+            x: int
+
+        with pytest.raises(TypeError, match="doesn't track changes"):
+            attrs.changed_fields(C(1))
+
+        with pytest.raises(TypeError, match="doesn't track changes"):
+            attrs.clear_changes(C(1))
+
+    def test_invalid(self):
+        """
+        Frozen classes and custom __setattr__ methods can't track changes.
+        """
+        with pytest.raises(ValueError, match="frozen"):
+
+            @attrs.frozen(track_changes=True)
+            class C:
+                x: int
+
+        with pytest.raises(ValueError, match="custom __setattr__"):
+
+            @attrs.define(track_changes=True)
+            class D:
+                x: int
+
+                def __setattr__(self, name, value):
+                    pass
+
+
+@attrs.define(invariants=[ordered])
+class Range:
+    lo: int = attrs.field(converter=int, validator=instance_of(int))
+    hi: int = attrs.field(converter=int, validator=instance_of(int))
+    label: str = attrs.field(default="", on_setattr=attrs.setters.NO_OP)
+
+
+class TestAssign:
+    def test_deferred(self):
+        """
+        Converters run first, then validators and invariants once, on the
+        updated instance -- so intermediate states don't matter.
+        """
+        r = Range(1, 2)
+
+        with pytest.raises(ValueError, match="5 > 2"):
+            r.lo = 5
+
+        attrs.assign(r, lo="5", hi="10")
+
+        assert Range(5, 10) == r
+
+    def test_runs_once(self):
+        """
+        Validators and invariants run exactly once per call.
+        """
+        calls = []
+
+        def validator(inst, a, value):
+            calls.append(a.name)
+
+        @attrs.define(invariants=[lambda inst: calls.append("invariant")])
+        class C:
+            x: int = attrs.field(validator=validator)
+            y: int = attrs.field(validator=validator)
+
+        i = C(1, 2)
+        calls.clear()
+
+        attrs.assign(i, y=3, x=4)
+
+        assert ["y", "x", "invariant"] == calls
+
+    @pytest.mark.parametrize(
+        ("changes", "exc"),
+        [
+            ({"lo": 3, "hi": 0}, ValueError),
+            ({"lo": 3, "label": 42.0}, ValueError),
+            ({"hi": 5, "lo": "x"}, ValueError),
+        ],
+    )
+    def test_rollback(self, changes, exc):
+        """
+        If validation fails, all old values are restored.
+        """
+        r = Range(1, 2, "old")
+
+        with pytest.raises(exc):
+            attrs.assign(r, **changes)
+
+        assert Range(1, 2, "old") == r
+
+    def test_not_validated(self):
+        """
+        Fields that aren't validated on assignment are just set.
+        """
+        r = Range(1, 2)
+
+        attrs.assign(r, label=42)
+
+        assert 42 == r.label
+
+    def test_disabled(self):
+        """
+        Nothing is validated if validators are disabled.
+        """
+        r = Range(1, 2)
+
+        with attrs.validators.disabled():
+            attrs.assign(r, lo=3)
+
+        assert 3 == r.lo
+
+    @pytest.mark.parametrize("name", ["nope", "count", "index"])
+    def test_unknown(self, name):
+        """
+        Unknown names raise AttrsAttributeNotFoundError and change nothing --
+        even if they're names of tuple methods.
+        """
+        r = Range(1, 2)
+
+        with pytest.raises(
+            AttrsAttributeNotFoundError,
+            match=f"{name} is not an attrs attribute on ",
+        ):
+            attrs.assign(r, lo=0, **{name: 1})
+
+        assert 1 == r.lo
+
+    def test_frozen(self):
+        """
+        Frozen instances can't be assigned to.
+        """
+
+        @attrs.frozen
+        class C:
+            x: int
+
+        with pytest.raises(attr.exceptions.FrozenInstanceError):
+            attrs.assign(C(1), x=2)
+
+    def test_frozen_field(self):
+        """
+        Frozen fields can't be assigned to.
+        """
+
+        @attrs.define
+        class C:
+            x: int = attrs.field(on_setattr=attrs.setters.frozen)
+
+        with pytest.raises(attr.exceptions.FrozenAttributeError):
+            attrs.assign(C(1), x=2)
+
+    def test_changes_and_hash(self):
+        """
+        Changes are tracked and the hash cache is cleared.
+        """
+
+        @attrs.define(track_changes=True, unsafe_hash=True, cache_hash=True)
+        class C:
+            x: int
+            y: int = 0
+
+        i = C(1)
+        h = hash(i)
+
+        attrs.assign(i, y=1)
+
+        assert ("y",) == attrs.changed_fields(i)
+        assert h != hash(i)
+        assert hash(C(1, 1)) == hash(i)
+
+    def test_generator_hook(self):
+        """
+        Generator hooks are resumed after everything has been validated.
+        """
+        log = []
+
+        def hook(inst, a, value):
+            log.append(("before", value))
+            yield value * 2
+            log.append(("after", inst.x, inst.y))
+
+        @attrs.define
+        class C:
+            x: int = attrs.field(on_setattr=hook)
+            y: int = 0
+
+        i = C(1)
+
+        attrs.assign(i, x=2, y=3)
+
+        assert [("before", 2), ("after", 4, 3)] == log
+
+
+class TestBatchUpdate:
+    def test_batch(self):
+        """
+        Assignments are collected and applied at once when the block is left.
+        Reading from the proxy returns pending values.
+        """
+        r = Range(1, 2)
+
+        with attrs.batch_update(r) as b:
+            b.hi = 20
+            b.lo = b.hi - 5
+
+            assert 15 == b.lo
+            assert 1 == r.lo
+            assert "" == b.label
+
+        assert Range(15, 20) == r
+
+    def test_exception(self):
+        """
+        If the block raises, nothing is applied.
+        """
+        r = Range(1, 2)
+
+        with pytest.raises(ZeroDivisionError), attrs.batch_update(r) as b:
+            b.lo = 0
+            1 / 0
+
+        assert 1 == r.lo
+
+    def test_invalid(self):
+        """
+        Invalid batches are rolled back as a whole.
+        """
+        r = Range(1, 2)
+
+        with (
+            pytest.raises(ValueError, match="30 > 20"),
+            attrs.batch_update(r) as b,
+        ):
+            b.lo = 30
+            b.hi = 20
+
+        assert Range(1, 2) == r
+
+    @pytest.mark.parametrize("name", ["nope", "count", "index"])
+    def test_unknown(self, name):
+        """
+        Setting unknown names raises right away -- even if they're names of
+        tuple methods.
+        """
+        with (
+            pytest.raises(AttrsAttributeNotFoundError),
+            attrs.batch_update(Range(1, 2)) as b,
+        ):
+            setattr(b, name, 1)
+
+    def test_private_names(self):
+        """
+        Fields with the names of private attributes aren't shadowed by the
+        proxy.
+        """
+
+        @attrs.define
+        class C:
+            _inst: int
+            _changes: int
+            _fields: int
+
+        c = C(1, 2, 3)
+
+        with attrs.batch_update(c) as b:
+            assert (1, 2, 3) == (b._inst, b._changes, b._fields)
+
+            b._inst = 4
+
+            assert 4 == b._inst
+
+        assert C(4, 2, 3) == c
+
+
+class TestDiff:
+    def test_equal(self):
+        """
+        Equal instances have no differences.
+        """
+        t = Tree(Branch(Leaf(1)), Branch(Leaf(2)))
+
+        assert [] == attrs.diff(t, Tree(Branch(Leaf(1)), Branch(Leaf(2))))
+
+    def test_recurse(self):
+        """
+        Nested attrs instances are diffed recursively by default and compared
+        as a whole otherwise.
+        """
+        t1 = Tree(Branch(Leaf(1)), Branch(Leaf(2)))
+        t2 = attrs.evolve_in_many(
+            t1, {("left", "leaf", "x"): 3, ("right", "_private"): 1}
+        )
+
+        assert [("left", "leaf", "x"), ("right", "_private")] == attrs.diff(
+            t1, t2
+        )
+        assert [("left",), ("right",)] == attrs.diff(t1, t2, recurse=False)
+
+    def test_eq_and_eq_key(self):
+        """
+        Fields with eq=False are ignored and eq keys are honored.
+        """
+
+        @attrs.define
+        class C:
+            x: str = attrs.field(eq=str.lower)
+            y: int = attrs.field(eq=False)
+            z: int = 0
+
+        assert [] == attrs.diff(C("A", 1), C("a", 2))
+        assert [("x",), ("z",)] == attrs.diff(C("A", 1), C("b", 1, 1))
+
+    def test_filter(self):
+        """
+        Filtered fields are ignored.
+        """
+        t1 = Tree(Branch(Leaf(1)), Branch(Leaf(2)))
+        t2 = Tree(Branch(Leaf(3)), Branch(Leaf(4)))
+
+        assert [("right", "leaf", "x")] == attrs.diff(
+            t1, t2, filter=attrs.filters.exclude("left")
+        )
+
+    def test_different_nested_classes(self):
+        """
+        Values of different classes and of classes without generated __eq__
+        are compared as a whole.
+        """
+
+        @attrs.define(eq=False)
+        class Opaque:
+            x: int
+
+        @attrs.define
+        class C:
+            x: object
+
+        assert [("x",)] == attrs.diff(C(Leaf(1)), C(Branch(Leaf(1))))
+        assert [("x",)] == attrs.diff(C(Opaque(1)), C(Opaque(1)))
+
+    def test_deep(self):
+        """
+        Graphs that are deeper than the recursion limit can be diffed.
+        """
+        depth = sys.getrecursionlimit() * 2
+        c1 = Chain(0)
+        c2 = Chain(1)
+        for i in range(1, depth):
+            c1 = Chain(i, c1)
+            c2 = Chain(i, c2)
+
+        assert [("next",) * (depth - 1) + ("value",)] == attrs.diff(c1, c2)
+
+    def test_cached(self):
+        """
+        The diff function is generated once per class.
+        """
+        attrs.diff(Leaf(1), Leaf(2))
+        d = Leaf.__attrs_differ__
+
+        attrs.diff(Leaf(1), Leaf(2))
+
+        assert d is Leaf.__attrs_differ__
+
+    def test_different_classes(self):
+        """
+        Instances of different classes can't be diffed.
+        """
+        with pytest.raises(TypeError, match="different classes"):
+            attrs.diff(Leaf(1), Branch(Leaf(1)))
+
+    def test_not_attrs(self):
+        """
+        Non-attrs instances raise NotAnAttrsClassError.
+        """
+        with pytest.raises(attr.exceptions.NotAnAttrsClassError):
+            attrs.diff(object(), object())
+
+
+@attrs.define
+class Node:
+    name: str
+    children: "list[Node]" = attrs.Factory(list)
+    meta: dict[str, int] = attrs.Factory(dict)
+
+
+@attrs.define
+class Chain:
+    value: int
+    next: "Chain | None" = None
+
+
+class TestWalk:
+    def test_pre_order(self):
+        """
+        Fields are yielded before the fields of the instances they contain,
+        which are found in lists, tuples, and dict values too.
+        """
+        t = Tree(Branch(Leaf(1)), Branch(Leaf(2), (Leaf(3),)))
+
+        assert [
+            (("left",), t.left),
+            (("left", "leaf"), t.left.leaf),
+            (("left", "leaf", "x"), 1),
+            (("left", "leaf", "y"), 0),
+            (("left", "other"), Leaf(-1)),
+            (("left", "other", "x"), -1),
+            (("left", "other", "y"), 0),
+            (("left", "_private"), 0),
+            (("right",), t.right),
+            (("right", "leaf"), t.right.leaf),
+            (("right", "leaf", "x"), 2),
+            (("right", "leaf", "y"), 0),
+            (("right", "other"), (Leaf(3),)),
+            (("right", "other", 0, "x"), 3),
+            (("right", "other", 0, "y"), 0),
+            (("right", "_private"), 0),
+        ] == [(path, value) for path, _, value in attrs.walk(t)]
+
+    def test_post_order(self):
+        """
+        With order="post", fields are yielded after the fields of the
+        instances they contain.
+        """
+        n = Node("root", [Node("a"), Node("b", meta={"k": 1})])
+
+        assert [
+            ("name",),
+            ("children", 0, "name"),
+            ("children", 0, "children"),
+            ("children", 0, "meta"),
+            ("children", 1, "name"),
+            ("children", 1, "children"),
+            ("children", 1, "meta"),
+            ("children",),
+            ("meta",),
+        ] == [path for path, _, _ in attrs.walk(n, order="post")]
+
+    def test_attributes(self):
+        """
+        The yielded attributes are the fields of the containing instance.
+        """
+        n = Node("root", [Node("a")])
+
+        assert [
+            fields(Node).name,
+            fields(Node).children,
+            fields(Node).name,
+            fields(Node).children,
+            fields(Node).meta,
+            fields(Node).meta,
+        ] == [a for _, a, _ in attrs.walk(n)]
+
+    def test_dict_values(self):
+        """
+        Dictionary values are looked into, using their keys as path items.
+        """
+
+        @attrs.define
+        class C:
+            x: dict
+
+        assert [(("x",), {"k": Leaf(1)}), (("x", "k", "x"), 1)] == [
+            (path, value)
+            for path, _, value in attrs.walk(
+                C({"k": Leaf(1)}), filter=lambda a, v: a.name != "y"
+            )
+        ]
+
+    def test_filter(self):
+        """
+        Filtered fields are neither yielded nor looked into.
+        """
+        t = Tree(Branch(Leaf(1)), Branch(Leaf(2)))
+
+        assert [("right",), ("right", "_private")] == [
+            path
+            for path, _, _ in attrs.walk(
+                t, filter=attrs.filters.exclude("left", "leaf", "other")
+            )
+        ]
+
+    def test_leaf_types(self):
+        """
+        Fields whose types can't contain attrs instances are not looked into,
+        even if -- against their declaration -- they do.
+        """
+        n = Node("root", meta={"k": Leaf(1)})
+
+        assert [("name",), ("children",), ("meta",)] == [
+            path for path, _, _ in attrs.walk(n)
+        ]
+        assert [False, True, False] == [
+            maybe for _, _, maybe in reversed(Node.__attrs_walk_spec__)
+        ]
+
+    def test_deep(self):
+        """
+        Graphs that are deeper than the recursion limit can be walked.
+        """
+        c = None
+        for i in range(sys.getrecursionlimit() * 2):
+            c = Chain(i, c)
+
+        assert sys.getrecursionlimit() * 4 == sum(1 for _ in attrs.walk(c))
+
+    def test_invalid_order(self):
+        """
+        Invalid orders raise a ValueError right away.
+        """
+        with pytest.raises(ValueError, match="order must be 'pre' or 'post'"):
+            attrs.walk(Leaf(1), order="in")
+
+    def test_not_attrs(self):
+        """
+        Non-attrs instances raise NotAnAttrsClassError right away.
+        """
+        with pytest.raises(attr.exceptions.NotAnAttrsClassError):
+            attrs.walk(object())
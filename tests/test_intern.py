@@ -0,0 +1,166 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Tests for interned classes.
+"""
+
+import copy
+import gc
+import pickle
+
+import pytest
+
+import attr
+import attrs
+
+
+@attrs.frozen(intern=True, cache_hash=True)
+class Currency:
+    code: str
+    digits: int = attrs.field(default=2, converter=int)
+
+
+@attrs.frozen(intern=True, slots=False)
+class Dict:
+    x: int
+
+
+@attrs.frozen
+class Sub(Currency):
+    name: str = ""
+
+
+class PlainSub(Currency):
+    pass
+
+
+class TestIntern:
+    def test_canonical(self):
+        """
+        Equal instances are identical, regardless of how the arguments are
+        passed.
+        """
+        eur = Currency("EUR")
+
+        assert eur is Currency("EUR")
+        assert eur is Currency(code="EUR", digits="2")
+        assert eur is not Currency("EUR", 3)
+        assert Dict(1) is Dict(1)
+
+    def test_classes_are_part_of_the_key(self):
+        """
+        Equal values of different classes aren't conflated.
+        """
+        assert Dict(1) is not Dict(1.0)
+        assert int is type(Dict(1).x)
+
+    def test_weak(self):
+        """
+        Canonical instances are released once they're not used anymore.
+        """
+        Currency("XYZ")
+        gc.collect()
+
+        assert ("XYZ", str, 2, int) not in Currency.__attrs_intern_table__
+
+    def test_hash_cached_once(self):
+        """
+        The hash of a value is cached on the canonical instance.
+        """
+        inst = Currency("USD")
+        hash(inst)
+
+        assert None is not object.__getattribute__(
+            Currency("USD"), attr._make._HASH_CACHE_FIELD
+        )
+
+    @pytest.mark.parametrize("cls", [Currency, Dict])
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle(self, cls, protocol):
+        """
+        Unpickled instances are canonical.
+        """
+        inst = cls("GBP")
+
+        assert inst is pickle.loads(pickle.dumps(inst, protocol))
+
+    def test_copy_and_evolve(self):
+        """
+        Copies and unchanged evolutions are canonical.
+        """
+        inst = Currency("JPY", 0)
+
+        assert inst is copy.copy(inst)
+        assert inst is copy.deepcopy(inst)
+        assert inst is attrs.evolve(inst, digits=0)
+        assert Currency("JPY") is attrs.evolve(inst, digits=2)
+
+    def test_subclass(self):
+        """
+        Instances of subclasses are not interned but work.
+        """
+        inst = Sub("CHF", name="Franc")
+
+        assert inst is not Sub("CHF", name="Franc")
+        assert inst == Sub("CHF", name="Franc")
+        assert inst == pickle.loads(pickle.dumps(inst))
+
+    def test_plain_subclass(self):
+        """
+        Instances of subclasses without their own __init__ are initialized
+        but not interned.
+        """
+        inst = PlainSub("CHF", digits="0")
+
+        assert "CHF" == inst.code
+        assert 0 == inst.digits
+        assert inst is not PlainSub("CHF", digits=0)
+        assert inst == pickle.loads(pickle.dumps(inst))
+        assert inst == copy.copy(inst)
+
+    def test_unhashable(self):
+        """
+        Unhashable field values raise a TypeError.
+        """
+        with pytest.raises(TypeError, match="unhashable"):
+            Dict([])
+
+    def test_props(self):
+        """
+        ClassProps reflect interning.
+        """
+        assert attrs.inspect(Currency).added_interning
+        assert not attrs.inspect(Sub).added_interning
+
+    @pytest.mark.parametrize(
+        ("kw", "msg"),
+        [
+            ({"frozen": False}, "intern can only be used with frozen"),
+            ({"slots": True, "weakref_slot": False}, "without a weakref slot"),
+            ({"fast_copy": True}, "can't be combined with"),
+        ],
+    )
+    def test_invalid(self, kw, msg):
+        """
+        Unsupported combinations raise a ValueError.
+        """
+        kw = {"frozen": True, **kw}
+
+        with pytest.raises(ValueError, match=msg):
+
+            @attr.s(intern=True, **kw)
+            class C:
+                x = attr.ib()
+
+    def test_custom_init(self):
+        """
+        Classes with custom __init__ methods can't be interned.
+        """
+        with pytest.raises(ValueError, match="custom __init__"):
+
+            @attrs.frozen(intern=True)
+            class C:
+                x: int
+
+                def __init__(self, x):
+                    pass
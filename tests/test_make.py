@@ -37,14 +37,21 @@ from attr._make import (
     _determine_attrib_eq_order,
     _determine_attrs_eq_order,
     _determine_whether_to_implement,
+    _pack_chunk,
     _transform_attrs,
+    _validate_packed_chunk,
     and_,
     fields,
     fields_dict,
     make_class,
     validate,
+    validate_many,
+)
+from attr.exceptions import (
+    DefaultAlreadySetError,
+    NotAnAttrsClassError,
+    UnpicklableValidationError,
 )
-from attr.exceptions import DefaultAlreadySetError, NotAnAttrsClassError
 
 from .strategies import (
     gen_attr_names,
@@ -55,7 +62,7 @@ from .strategies import (
     simple_attrs_without_metadata,
     simple_classes,
 )
-from .utils import simple_attr
+from .utils import ordered, simple_attr
 
 
 attrs_st = simple_attrs.map(
@@ -1938,6 +1945,438 @@ class TestValidate:
         assert inspect.getsource(C1.__init__) == inspect.getsource(C2.__init__)
 
 
+@attrs.define(on_setattr=attrs.setters.NO_OP)
+class Validated:
+    x: int = attrs.field(
+        validator=[attrs.validators.instance_of(int), attrs.validators.ge(0)]
+    )
+
+
+class TwoArgError(Exception):
+    def __init__(self, a, b):
+        super().__init__(f"{a} isn't {b}")
+
+
+def _raise_two_arg_error(inst, attr, value):
+    if value < 0:
+        raise TwoArgError(value, "positive")
+
+
+@attrs.define(on_setattr=attrs.setters.NO_OP)
+class Unpicklable:
+    x: int = attrs.field(validator=_raise_two_arg_error)
+
+
+class TestValidateMany:
+    """
+    Tests for `validate_many` and the generated validation functions.
+    """
+
+    def test_generated_once(self):
+        """
+        The validation function is generated once per class, only calls the
+        validators of fields that have one, and is used by `validate`.
+        """
+        C = make_class(
+            "C",
+            {"x": attr.ib(validator=attr.validators.gt(0)), "y": attr.ib()},
+        )
+
+        assert "__attrs_validate__" not in C.__dict__
+
+        validate(C(1, 2))
+        v = C.__dict__["__attrs_validate__"]
+        src = inspect.getsource(v)
+
+        assert "self.x" in src
+        assert "self.y" not in src
+
+        validate_many([C(1, 2), C(2, 3)])
+
+        assert v is C.__dict__["__attrs_validate__"]
+
+    def test_no_validators(self):
+        """
+        Classes without validators get a no-op function.
+        """
+        C = make_class("C", ["x"])
+
+        validate_many([C(1)])
+
+        assert None is C.__dict__["__attrs_validate__"](C(1))
+
+    def test_many(self):
+        """
+        Instances of different classes are validated with their respective
+        functions and all failures are collected.
+        """
+        C = make_class("C", {"x": attr.ib(validator=attr.validators.gt(0))})
+        D = make_class(
+            "D", {"x": attr.ib(validator=attr.validators.instance_of(str))}
+        )
+        d = D("a")
+        d.x = 42
+        c = C(1)
+        c.x = 0
+
+        assert [] == validate_many([C(1), C(2), D("a"), C(3)])
+
+        (f1, f2) = validate_many(iter([C(1), D("b"), d, C(4), c]))
+
+        assert (2, "x") == f1[:2]
+        assert isinstance(f1[2], TypeError)
+        assert (4, "x") == f2[:2]
+        assert isinstance(f2[2], ValueError)
+
+    def test_all_failures_of_instance(self):
+        """
+        All failing validators and invariants of an instance are reported.
+        """
+
+        def fail(inst):
+            raise FloatingPointError
+
+        @attrs.define(invariants=[fail], on_setattr=attrs.setters.NO_OP)
+        class C:
+            x: int = attrs.field(validator=attrs.validators.gt(0))
+            y: int = attrs.field(validator=attrs.validators.gt(0))
+            z: int = attrs.field(validator=attrs.validators.gt(0))
+
+        with attrs.validators.disabled():
+            c = C(0, 1, 0)
+
+        assert [(0, "x"), (0, "z"), (0, None)] == [
+            f[:2] for f in validate_many([c])
+        ]
+
+    def test_fast_path_only_fails(self):
+        """
+        If only the generated function fails, its exception is reported.
+        """
+        e = FloatingPointError()
+
+        @attrs.define
+        class C:
+            x: int
+
+        def raiser(inst):
+            raise e
+
+        C.__attrs_validate__ = raiser
+
+        assert [(0, None, e)] == validate_many([C(1)])
+
+    @pytest.mark.parametrize("chunksize", [1, 2, 1024])
+    def test_thread_pool(self, chunksize):
+        """
+        Chunks are validated by thread pools and the failures are sorted by
+        index.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        insts = [Validated(i % 3) for i in range(1, 50)]
+        for i in (40, 7, 3):
+            insts[i].x = -i
+
+        with ThreadPoolExecutor(4) as ex:
+            failures = validate_many(insts, executor=ex, chunksize=chunksize)
+
+        assert [(3, "x"), (7, "x"), (40, "x")] == [f[:2] for f in failures]
+
+    def test_process_pool(self):
+        """
+        Chunks for process pools are packed and the instances recreated in
+        the workers.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        insts = [Validated(i) for i in range(10)]
+        insts[5].x = -5
+        insts[9].x = "nope"
+
+        with ProcessPoolExecutor(2) as ex:
+            failures = validate_many(insts, executor=ex, chunksize=3)
+
+        assert [(5, "x"), (9, "x")] == [f[:2] for f in failures]
+        assert isinstance(failures[0][2], ValueError)
+        assert isinstance(failures[1][2], TypeError)
+
+    def test_process_pool_unpicklable(self):
+        """
+        Exceptions that can't be sent back from the workers are replaced by
+        UnpicklableValidationError with their class, message, and field.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        insts = [Unpicklable(i) for i in range(4)]
+        insts[2].x = -2
+
+        with ProcessPoolExecutor(2) as ex:
+            failures = validate_many(insts, executor=ex, chunksize=3)
+
+        ((i, name, e),) = failures
+
+        assert (2, "x") == (i, name)
+        assert isinstance(e, UnpicklableValidationError)
+        assert (f"{__name__}.TwoArgError", "-2 isn't positive", "x") == (
+            e.type_name,
+            e.msg,
+            e.field,
+        )
+        assert f"{__name__}.TwoArgError: -2 isn't positive" == str(e)
+
+    def test_pack_chunk(self):
+        """
+        Chunks are packed as classes and rows of field values.  Instances
+        with missing fields are passed as is.
+        """
+        a, b = Validated(1), Validated(2)
+        object.__delattr__(b, "x")
+
+        classes, rows = _pack_chunk([a, b, Validated(3)])
+
+        assert (Validated,) == classes
+        assert [(0, 1), (-1, b), (0, 3)] == rows
+        assert [] == _validate_packed_chunk(0, classes, [rows[0], rows[2]])
+
+    def test_chunksize(self):
+        """
+        chunksize must be positive.
+        """
+        with pytest.raises(ValueError, match="chunksize must be at least 1"):
+            validate_many([], chunksize=0)
+
+    def test_subclass(self):
+        """
+        Subclasses -- even if they're not attrs classes -- get their own
+        function.
+        """
+
+        def raiser(_, __, value):
+            if value == 42:
+                raise FloatingPointError
+
+        C = make_class("C", {"x": attr.ib(validator=raiser)})
+
+        @attr.s
+        class D(C):
+            y = attr.ib(validator=raiser)
+
+        class E(D):
+            pass
+
+        assert [] == validate_many([C(1), D(1, 2), E(1, 2)])
+
+        with pytest.raises(FloatingPointError):
+            validate(E(1, 42))
+
+        assert (
+            C.__dict__["__attrs_validate__"]
+            is not D.__dict__["__attrs_validate__"]
+        )
+        assert "__attrs_validate__" in E.__dict__
+
+    def test_invariants(self):
+        """
+        The generated function checks the invariants too.
+        """
+        calls = []
+
+        @attrs.define(invariants=[calls.append])
+        class C:
+            x: int
+
+        c = C(1)
+        calls.clear()
+
+        validate_many([c, c])
+
+        assert [c, c] == calls
+
+    def test_run_validators(self):
+        """
+        Nothing runs if validators are disabled.
+        """
+        C = make_class("C", {"x": attr.ib(validator=attr.validators.gt(0))})
+
+        with attr.validators.disabled():
+            assert [] == validate_many([C(0)])
+
+        assert "__attrs_validate__" not in C.__dict__
+
+    def test_not_attrs(self):
+        """
+        Non-attrs instances raise NotAnAttrsClassError.
+        """
+        with pytest.raises(NotAnAttrsClassError):
+            validate_many([object()])
+
+
+class TestInvariants:
+    """
+    Tests for class-level invariants.
+    """
+
+    def _make(self, **kw):
+        @attrs.define(invariants=[ordered], **kw)
+        class Range:
+            lo: int = attrs.field(validator=attrs.validators.instance_of(int))
+            hi: int = 0
+
+        return Range
+
+    def test_init(self):
+        """
+        Invariants are checked once in __init__, after all field validators
+        and before __attrs_post_init__.
+        """
+        calls = []
+
+        def invariant(inst):
+            calls.append(("invariant", inst.x))
+
+        def validator(inst, a, value):
+            calls.append(("validator", a.name))
+
+        @attrs.define(invariants=[invariant])
+        class C:
+            x: int = attrs.field(validator=validator)
+            y: int = attrs.field(validator=validator)
+
+            def __attrs_post_init__(self):
+                calls.append(("post_init", None))
+
+        C(1, 2)
+
+        assert [
+            ("validator", "x"),
+            ("validator", "y"),
+            ("invariant", 1),
+            ("post_init", None),
+        ] == calls
+
+    def test_init_fails(self):
+        """
+        Exceptions of invariants are handed through.
+        """
+        Range = self._make()
+
+        assert Range(1, 2) == Range(1, 2)
+
+        with pytest.raises(ValueError, match="3 > 2"):
+            Range(3, 2)
+
+    def test_setattr(self):
+        """
+        Invariants are checked after assigning to validated fields and the
+        old value is restored if they fail.
+        """
+        r = self._make()(1, 2)
+
+        with pytest.raises(ValueError, match="5 > 2"):
+            r.lo = 5
+
+        assert 1 == r.lo
+
+        with pytest.raises(ValueError, match="1 > 0"):
+            r.hi = 0
+
+        assert 2 == r.hi
+
+        r.hi = 10
+
+        assert 10 == r.hi
+
+    def test_setattr_not_validated(self):
+        """
+        Fields that aren't validated on assignment don't check invariants.
+        """
+        r = self._make(on_setattr=attrs.setters.NO_OP)(1, 2)
+
+        r.lo = 5
+
+        assert 5 == r.lo
+
+    @pytest.mark.parametrize("fast_evolve", [True, False])
+    def test_evolve(self, fast_evolve):
+        """
+        Evolved instances are checked too.
+        """
+        r = self._make(fast_evolve=fast_evolve)(1, 2)
+
+        assert 2 == attrs.evolve(r, lo=2).lo
+
+        with pytest.raises(ValueError, match="3 > 2"):
+            attrs.evolve(r, lo=3)
+
+    def test_validate(self):
+        """
+        attrs.validate checks invariants.
+        """
+        r = self._make()(1, 2)
+        object.__setattr__(r, "lo", 3)
+
+        with pytest.raises(ValueError, match="3 > 2"):
+            validate(r)
+
+    def test_disabled(self):
+        """
+        Invariants don't run if validators are disabled.
+        """
+        Range = self._make()
+
+        with attrs.validators.disabled():
+            r = Range(3, 2)
+            r.lo = 4
+            validate(r)
+
+        assert (4, 2) == (r.lo, r.hi)
+
+    def test_inherited(self):
+        """
+        Invariants of base classes are checked first and only once.
+        """
+        calls = []
+
+        def base(inst):
+            calls.append("base")
+
+        def sub(inst):
+            calls.append("sub")
+
+        @attrs.define(invariants=[base])
+        class Base:
+            x: int
+
+        @attrs.define(invariants=[sub, base])
+        class Sub(Base):
+            pass
+
+        Sub(1)
+
+        assert ["base", "sub"] == calls
+        assert (base, sub) == attrs.inspect(Sub).invariants
+
+    def test_props(self):
+        """
+        ClassProps contain the invariants.
+        """
+        assert (ordered,) == attrs.inspect(self._make()).invariants
+        assert () == attrs.inspect(attrs.make_class("C", ["x"])).invariants
+
+    def test_not_callable(self):
+        """
+        Invariants must be callable.
+        """
+        with pytest.raises(
+            TypeError, match=r"Invariants must be callable \(got 42\)\."
+        ):
+
+            @attrs.define(invariants=[42])
+            class C:
+                x: int
+
+
 # Hypothesis seems to cache values, so the lists of attributes come out
 # unsorted.
 sorted_lists_of_attrs = list_of_attrs.map(
@@ -0,0 +1,372 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Tests for compact pickling.
+"""
+
+import copy
+import pickle
+
+from typing import Annotated
+
+import pytest
+
+import attr
+import attrs
+
+from attr._make import _CLASSES_BY_SPEC
+
+
+@attrs.define(compact_pickle=True)
+class Compact:
+    x: int
+    y: str = "y"
+
+
+@attrs.define
+class Regular:
+    x: int
+    y: str = "y"
+
+
+@attrs.define
+class CompactSub(Compact):
+    z: int = 42
+
+
+@attrs.frozen(compact_pickle=True, cache_hash=True)
+class CompactCached:
+    x: int
+
+
+@attrs.define(slots=False, compact_pickle=True)
+class CompactDict:
+    x: int
+
+
+@attr.s(compact_pickle=True)
+class CompactClassic:
+    x = attr.ib()
+
+
+@attrs.define(compact_pickle=True)
+class Versioned:
+    __attrs_pickle_version__ = 1
+
+    x: int
+    y: int = 0
+
+
+@attrs.define(compact_pickle=True)
+class Migrated:
+    __attrs_pickle_version__ = 1
+
+    x: int
+    y: int = 0
+
+    @classmethod
+    def __attrs_migrate_pickle__(cls, version, values):
+        assert 0 == version
+
+        return (*values, -1)
+
+
+@attrs.define(compact_pickle=True)
+class Buffers:
+    name: str
+    data: bytes
+    mutable: bytearray
+    view: Annotated[memoryview, "annotated"]
+    maybe: "bytes" = None
+
+
+class TestCompactPickle:
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    @pytest.mark.parametrize(
+        "inst",
+        [
+            Compact(1, "a"),
+            CompactCached(2),
+            CompactDict(3),
+            CompactClassic(4),
+        ],
+    )
+    def test_round_trip(self, inst, protocol):
+        """
+        Instances survive a round trip with all protocols.
+        """
+        assert inst == pickle.loads(pickle.dumps(inst, protocol))
+
+    def test_smaller(self):
+        """
+        Field names are not part of the pickle.
+        """
+        compact = pickle.dumps([Compact(i) for i in range(100)])
+        regular = pickle.dumps([Regular(i) for i in range(100)])
+
+        assert b"'x'" not in compact
+        assert len(compact) < len(regular)
+
+    def test_no_init(self):
+        """
+        Unpickling doesn't run __init__ and thus no validators.
+        """
+        inst = Compact(1)
+        object.__setattr__(inst, "x", "not validated")
+
+        assert "not validated" == pickle.loads(pickle.dumps(inst)).x
+
+    def test_cache_hash(self):
+        """
+        The hash cache is reset when unpickling.
+        """
+        inst = CompactCached(42)
+        hash(inst)
+
+        unpickled = pickle.loads(pickle.dumps(inst))
+
+        assert None is object.__getattribute__(
+            unpickled, attr._make._HASH_CACHE_FIELD
+        )
+        assert hash(inst) == hash(unpickled)
+
+    def test_subclass(self):
+        """
+        Instances of subclasses without compact pickling are pickled as
+        usual and keep all their fields.
+        """
+        inst = CompactSub(1, "a", 2)
+
+        assert inst == pickle.loads(pickle.dumps(inst))
+
+    def test_copy(self):
+        """
+        The copy module uses compact pickling too.
+        """
+        inst = Compact(1, "a")
+
+        assert inst == copy.copy(inst)
+        assert inst == copy.deepcopy(inst)
+
+    def test_props(self):
+        """
+        ClassProps reflect compact pickling.
+        """
+        assert attrs.inspect(Compact).added_compact_pickling
+        assert not attrs.inspect(Regular).added_compact_pickling
+
+    def test_version_mismatch(self):
+        """
+        Unpickling an old version without a migration hook raises an
+        UnpicklingError.
+        """
+        assert Versioned(1, 2) == pickle.loads(pickle.dumps(Versioned(1, 2)))
+
+        with pytest.raises(
+            pickle.UnpicklingError, match="Can't unpickle version 0 of"
+        ):
+            attr._make._compact_unpickle(Versioned, 0, 1, 2)
+
+    def test_migrate(self):
+        """
+        Old versions are passed through __attrs_migrate_pickle__.
+        """
+        _, (cls, version, *_) = Migrated(1, 2).__reduce_ex__(5)
+
+        assert 1 == version
+        assert Migrated(1, 2) == pickle.loads(pickle.dumps(Migrated(1, 2)))
+        assert Migrated(5, -1) == attr._make._compact_unpickle(cls, 0, 5)
+
+
+class TestOutOfBandBuffers:
+    def _make(self):
+        return Buffers(
+            "name", b"x" * 100, bytearray(b"y" * 100), memoryview(b"z" * 100)
+        )
+
+    def test_out_of_band(self):
+        """
+        With protocol 5, buffer fields are transferred out-of-band and arrive
+        as memoryviews of the passed buffers.
+        """
+        inst = self._make()
+        buffers = []
+
+        pickled = pickle.dumps(inst, 5, buffer_callback=buffers.append)
+        unpickled = pickle.loads(pickled, buffers=buffers)
+
+        assert 3 == len(buffers)
+        assert b"x" * 100 not in pickled
+        assert "name" == unpickled.name
+        assert None is unpickled.maybe
+        assert isinstance(unpickled.data, memoryview)
+        assert inst.data == unpickled.data
+        assert inst.mutable == unpickled.mutable
+        assert inst.view == unpickled.view
+
+    def test_out_of_band_zero_copy(self):
+        """
+        Writable buffers are shared, not copied.
+        """
+        inst = self._make()
+        buffers = []
+
+        unpickled = pickle.loads(
+            pickle.dumps(inst, 5, buffer_callback=buffers.append),
+            buffers=buffers,
+        )
+        unpickled.mutable[0] = ord("!")
+
+        assert ord("!") == inst.mutable[0]
+
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_in_band(self, protocol):
+        """
+        Without a buffer callback or with older protocols, bytes and
+        bytearrays keep their types and memoryviews become bytes.
+        """
+        inst = self._make()
+
+        unpickled = pickle.loads(pickle.dumps(inst, protocol))
+
+        assert inst.data == unpickled.data
+        assert isinstance(unpickled.data, bytes)
+        assert isinstance(unpickled.mutable, bytearray)
+        assert inst.mutable == unpickled.mutable
+        assert b"z" * 100 == unpickled.view
+
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_not_a_buffer(self, protocol):
+        """
+        Values of buffer fields that aren't buffers -- annotations aren't
+        enforced -- are pickled in-band and round-trip unchanged.
+        """
+        inst = Buffers("name", "not bytes", None, 42, maybe=["x"])
+        buffers = []
+
+        unpickled = pickle.loads(
+            pickle.dumps(inst, protocol, buffer_callback=buffers.append)
+            if protocol >= 5
+            else pickle.dumps(inst, protocol),
+            buffers=buffers,
+        )
+
+        assert [] == buffers
+        assert "not bytes" == unpickled.data
+        assert None is unpickled.mutable
+        assert 42 == unpickled.view
+        assert ["x"] == unpickled.maybe
+
+    def test_non_contiguous(self):
+        """
+        Non-contiguous memoryviews are copied in-band.
+        """
+        inst = self._make()
+        inst.view = memoryview(b"abcdef")[::2]
+
+        buffers = []
+
+        unpickled = pickle.loads(
+            pickle.dumps(inst, 5, buffer_callback=buffers.append),
+            buffers=buffers,
+        )
+
+        assert 2 == len(buffers)
+        assert b"ace" == unpickled.view
+
+
+def _post_init(self):
+    object.__setattr__(self, "y", self.x * 2)
+
+
+def _make_dynamic(**kw):
+    return attrs.make_class(
+        "Dynamic",
+        {
+            "x": attrs.field(validator=attrs.validators.instance_of(int)),
+            "y": attrs.field(init=False),
+            "__attrs_post_init__": _post_init,
+        },
+        pickle_by_spec=True,
+        **kw,
+    )
+
+
+class TestPickleBySpec:
+    @pytest.mark.parametrize("slots", [True, False])
+    def test_same_process(self, slots):
+        """
+        Within the creating process, instances unpickle to the same class.
+        """
+        C = _make_dynamic(slots=slots)
+        inst = C(21)
+
+        unpickled = pickle.loads(pickle.dumps(inst))
+
+        assert C is type(unpickled)
+        assert inst == unpickled
+
+    def test_recreated(self):
+        """
+        If the class is unknown, it's recreated from the spec -- once.
+        """
+        C = _make_dynamic(frozen=True, cache_hash=True)
+        pickled = pickle.dumps([C(1), C(2)])
+        _CLASSES_BY_SPEC.clear()
+
+        one, two = pickle.loads(pickled)
+        C2 = type(one)
+
+        assert C is not C2
+        assert C2 is type(two)
+        assert "Dynamic" == C2.__name__
+        assert __name__ == C2.__module__
+        assert (1, 2) == (one.x, one.y)
+        assert (2, 4) == (two.x, two.y)
+        assert hash(C2(1)) == hash(one)
+        assert C2 is type(pickle.loads(pickled)[0])
+
+        # The recreated class is shippable too and keeps its post-init.
+        assert C2(3) == pickle.loads(pickle.dumps(C2(3)))
+        assert 8 == C2(4).y
+
+    def test_spec_once_per_pickle(self):
+        """
+        The spec is part of a pickle only once, no matter how many instances
+        it contains.
+        """
+        C = _make_dynamic()
+        one = len(pickle.dumps([C(1)]))
+        many = len(pickle.dumps([C(i) for i in range(1, 11)]))
+
+        assert many - one < 9 * 20
+
+    def test_reduce_ex_dunders(self):
+        """
+        The generated __reduce_ex__ has the module and qualname of a method of
+        the class.
+        """
+        C = _make_dynamic()
+
+        assert C.__module__ == C.__reduce_ex__.__module__
+        assert "Dynamic.__reduce_ex__" == C.__reduce_ex__.__qualname__
+
+    def test_unpicklable_spec(self):
+        """
+        Specs that can't be pickled are rejected when the class is created.
+        """
+        with pytest.raises(TypeError, match="Can't pickle the spec of"):
+            attrs.make_class(
+                "C",
+                {"x": attrs.field(converter=lambda v: v)},
+                pickle_by_spec=True,
+            )
+
+    def test_by_reference_by_default(self):
+        """
+        Without pickle_by_spec, nothing changes.
+        """
+        C = attrs.make_class("C", ["x"])
+
+        with pytest.raises((pickle.PicklingError, AttributeError)):
+            pickle.dumps(C(1))
@@ -645,3 +645,96 @@ class TestSetAttr:
         c.x = "2"
 
         assert 2 == c.x
+
+    def test_nested_pipes(self):
+        """
+        Nested pipes run their hooks in order.
+        """
+        calls = []
+
+        def record(tag):
+            def hook(_, __, val):
+                calls.append((tag, val))
+
+                return f"{val}{tag}"
+
+            return hook
+
+        @attr.s
+        class C:
+            x = attr.ib(
+                converter=str.upper,
+                on_setattr=setters.pipe(
+                    record("a"),
+                    setters.pipe(setters.convert, record("b")),
+                    record("c"),
+                ),
+            )
+
+        c = C("x")
+        c.x = "y"
+
+        assert [("a", "y"), ("b", "YA"), ("c", "YAb")] == calls
+        assert "YAbc" == c.x
+
+    def test_no_op_hooks_are_skipped(self):
+        """
+        If all hooks of all fields do nothing, no __setattr__ is written.
+        """
+
+        @attr.define
+        class C:
+            x: int
+            y: int = attr.field(on_setattr=setters.NO_OP)
+
+        assert C.__setattr__ is object.__setattr__
+
+        c = C(1, 2)
+        c.x = "not validated"
+
+        assert "not validated" == c.x
+
+    def test_unhooked_fields(self):
+        """
+        Fields without hooks and non-fields are set directly.
+        """
+
+        @attr.define(slots=False)
+        class C:
+            x: int = attr.field(validator=instance_of(int))
+            y: int = 0
+
+        c = C(1)
+        c.y = "y"
+        c.z = "z"
+
+        assert ("y", "z") == (c.y, c.z)
+
+        with pytest.raises(TypeError):
+            c.x = "x"
+
+    def test_wide_class(self):
+        """
+        Each field of a wide class is dispatched to its own hooks.
+        """
+        C = attr.make_class(
+            "C",
+            {
+                f"f{i}": attr.field(
+                    default=i, converter=int, validator=instance_of(int)
+                )
+                for i in range(60)
+            },
+            on_setattr=setters.pipe(setters.convert, setters.validate),
+        )
+        c = C()
+
+        for i in range(60):
+            setattr(c, f"f{i}", str(i + 1))
+
+        assert list(range(1, 61)) == list(attr.astuple(c))
+
+        with pytest.raises(ValueError, match="invalid literal"):
+            c.f59 = "x"
+
+        assert 60 == c.f59
@@ -4,17 +4,31 @@
 Tests for `attr.validators`.
 """
 
+import array
+import concurrent.futures
+import contextlib
+import gc
+import inspect
+import math
 import re
 import sys
+import typing
+import warnings
+
+from collections import OrderedDict
 
 import pytest
 
 import attr
+import attrs
 
 from attr import _config, fields, has
 from attr import validators as validator_module
+from attr._make import _COMPILED_VALIDATORS, _compile_validator
 from attr.validators import (
+    _all_valid,
     _subclass_of,
+    _type_check,
     and_,
     deep_iterable,
     deep_mapping,
@@ -27,6 +41,7 @@ from attr.validators import (
     lt,
     matches_re,
     max_len,
+    memoize,
     min_len,
     ne,
     not_,
@@ -116,6 +131,48 @@ class TestDisableValidators:
         assert _config._run_validators is True
 
 
+class TestExhaustive:
+    @pytest.fixture(autouse=True)
+    def _reset_default(self):
+        """
+        Make sure sampling is honored after a test.
+        """
+        yield
+        _config._validate_exhaustively = False
+
+    def test_default(self):
+        """
+        Samples and prefixes are honored by default.
+        """
+        assert validator_module.get_exhaustive() is False
+
+    @pytest.mark.parametrize("value", [True, False])
+    def test_set_exhaustive(self, value):
+        """
+        Sets `_validate_exhaustively`.
+        """
+        validator_module.set_exhaustive(value)
+
+        assert validator_module.get_exhaustive() is value
+
+    def test_exhaustive_ctx(self):
+        """
+        The `exhaustive` context manager only makes deep validators validate
+        all members within its context, even if an error is raised.
+        """
+        v = deep_iterable(instance_of(int), prefix=1)
+        a = simple_attr("test")
+
+        with pytest.raises(TypeError), validator_module.exhaustive():
+            assert validator_module.get_exhaustive() is True
+
+            v(None, a, [1, "2"])
+
+        assert validator_module.get_exhaustive() is False
+
+        v(None, a, [1, "2"])
+
+
 class TestInstanceOf:
     """
     Tests for `instance_of`.
@@ -447,6 +504,58 @@ class TestIn_:
             None,
         ) == e.value.args
 
+    @pytest.mark.parametrize(
+        "options", [[1, 2, 3], (1, 2, 3), {1, 2, 3}, dict.fromkeys((1, 2, 3))]
+    )
+    def test_set_backed(self, options):
+        """
+        Hashable options are looked up in a frozenset.
+        """
+        v = in_(options)
+        a = simple_attr("test")
+
+        v(None, a, 3)
+
+        assert frozenset((1, 2, 3)) == v.options
+
+        with pytest.raises(ValueError):
+            v(None, a, 4)
+
+    def test_unhashable_options(self):
+        """
+        Unhashable options are scanned.
+        """
+        v = in_([[1], [2]])
+        a = simple_attr("test")
+
+        v(None, a, [2])
+
+        assert ([1], [2]) == v.options
+
+        with pytest.raises(ValueError):
+            v(None, a, [3])
+
+    def test_unhashable_value(self):
+        """
+        Unhashable values are compared to all hashable options.
+        """
+
+        class EqualToOne:
+            __hash__ = None
+
+            def __eq__(self, other):
+                return other == 1
+
+        v = in_([1, 2])
+        a = simple_attr("test")
+
+        v(None, a, EqualToOne())
+
+        with pytest.raises(ValueError) as e:
+            v(None, a, [1])
+
+        assert "'test' must be in [1, 2] (got [1])" == e.value.args[0]
+
     def test_repr(self):
         """
         Returned validator has a useful `__repr__`.
@@ -655,6 +764,220 @@ class TestDeepIterable:
         assert and_(*member_validator) == v.member_validator
         assert and_(*iterable_validator) == v.iterable_validator
 
+    @pytest.mark.parametrize(
+        "members",
+        [
+            [1, 2, 3],
+            (1, 2, 3),
+            {1, 2, 3},
+            frozenset((1, 2, 3)),
+            range(1, 4),
+            array.array("q", (1, 2, 3)),
+            memoryview(bytes((1, 2, 3))),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "member_validator",
+        [
+            instance_of(int),
+            [instance_of(int), ge(1), lt(4), ne(0)],
+            optional([in_([1, 2, 3]), gt(0), le(3)]),
+        ],
+    )
+    def test_bulk(self, members, member_validator):
+        """
+        Built-in member validators check containers without calls per member.
+        """
+        v = deep_iterable(member_validator)
+
+        assert _all_valid(v.member_validator, members)
+
+        v(None, simple_attr("test"), members)
+
+    @pytest.mark.parametrize(
+        "members",
+        [
+            [1, -2, 3, "4"],
+            (1, -2, 3, "4"),
+            range(1, -3, -3),
+            array.array("q", (1, -2, 3)),
+        ],
+    )
+    def test_bulk_fail(self, members):
+        """
+        If a bulk check fails, the error is the same as if each member was
+        validated individually.
+        """
+        v = deep_iterable([instance_of(int), ge(0)])
+
+        assert not _all_valid(v.member_validator, members)
+
+        with pytest.raises(ValueError, match=r"'test' must be >= 0: -2"):
+            v(None, simple_attr("test"), members)
+
+    def test_bulk_optional(self):
+        """
+        Optional members are skipped in bulk checks.
+        """
+        v = deep_iterable(optional(instance_of(int)))
+
+        v(None, simple_attr("test"), [1, None, 2])
+
+        with pytest.raises(TypeError):
+            v(None, simple_attr("test"), [1, None, "2"])
+
+    def test_no_bulk_for_custom_validators(self):
+        """
+        Validators without bulk checks are called for each member, as are
+        validators on one-shot iterators.
+        """
+        calls = []
+
+        def validator(inst, attr, value):
+            calls.append(value)
+
+        deep_iterable(validator)(None, simple_attr("test"), [1, 2])
+        deep_iterable(instance_of(int))(
+            None, simple_attr("test"), iter([1, 2])
+        )
+
+        assert [1, 2] == calls
+        assert not _all_valid(and_(instance_of(int), validator), [1, 2])
+
+    @pytest.mark.parametrize(
+        "members", [[1, 2, "3"], (1, 2, "3"), iter([1, 2, "3"]), {1: 1, 2: 2}]
+    )
+    def test_prefix(self, members):
+        """
+        With prefix, only the first members are validated.
+        """
+        v = deep_iterable(instance_of(int), prefix=2)
+
+        v(None, simple_attr("test"), members)
+
+        with pytest.raises(TypeError):
+            deep_iterable(instance_of(int), prefix=3)(
+                None, simple_attr("test"), [1, 2, "3"]
+            )
+
+    @pytest.mark.parametrize(
+        ("sample", "expected"), [(10, 10), (0.25, 25), (1.0, 100), (200, 100)]
+    )
+    def test_sample(self, sample, expected):
+        """
+        With sample, a random sample of a count or a fraction of the members
+        is validated -- in their original order.
+        """
+        seen = []
+        v = deep_iterable(
+            lambda inst, attr, value: seen.append(value), sample=sample
+        )
+
+        v(None, simple_attr("test"), list(range(100)))
+
+        assert expected == len(seen)
+        assert sorted(set(seen)) == seen
+
+    def test_sample_sized(self):
+        """
+        Members of sized collections that aren't sequences are sampled in
+        their iteration order.
+        """
+        members = {str(i) for i in range(100)}
+        order = list(members)
+        seen = []
+
+        deep_iterable(lambda inst, attr, value: seen.append(value), sample=10)(
+            None, simple_attr("test"), members
+        )
+
+        assert 10 == len(seen)
+        assert sorted(seen, key=order.index) == seen
+
+    @pytest.mark.parametrize("members", [list(range(100)), set(range(100))])
+    def test_sample_seed(self, members):
+        """
+        Samples are reproducible with a seed.
+        """
+
+        def picks():
+            seen = []
+            deep_iterable(
+                lambda inst, attr, value: seen.append(value),
+                sample=5,
+                seed=42,
+            )(None, simple_attr("test"), members)
+
+            return seen
+
+        assert picks() == picks()
+
+    @pytest.mark.parametrize(
+        ("kw", "exc", "match"),
+        [
+            ({"sample": 1, "prefix": 1}, ValueError, "mutually exclusive"),
+            ({"sample": 0}, ValueError, "sample must be >= 1"),
+            ({"sample": 1.5}, ValueError, r"sample must be in \(0, 1\]"),
+            ({"sample": True}, TypeError, "sample must be an int or a float"),
+            ({"prefix": -1}, ValueError, "prefix must be >= 0"),
+            ({"prefix": 1.0}, TypeError, "prefix must be an int"),
+        ],
+    )
+    def test_invalid_subset(self, kw, exc, match):
+        """
+        Invalid samples and prefixes are rejected.
+        """
+        with pytest.raises(exc, match=match):
+            deep_iterable(instance_of(int), **kw)
+
+    @pytest.mark.parametrize(
+        ("kw", "subset_repr"),
+        [
+            ({"prefix": 10}, "the first 10 members"),
+            ({"sample": 10}, "a sample of 10 members"),
+            ({"sample": 0.1}, "a sample of 10% of the members"),
+        ],
+    )
+    def test_repr_subset(self, kw, subset_repr):
+        """
+        The repr contains the subset that's validated.
+        """
+        assert (
+            "<deep_iterable validator for iterables of <instance_of validator"
+            f" for type <class 'int'>>, validating {subset_repr}>"
+        ) == repr(deep_iterable(instance_of(int), **kw))
+
+    def test_numpy(self):
+        """
+        Numeric bounds are checked vectorized on NumPy arrays.
+        """
+        np = pytest.importorskip("numpy")
+
+        v = deep_iterable([ge(0), lt(10)])
+        a = simple_attr("test")
+
+        assert _all_valid(v.member_validator, np.arange(10))
+
+        v(None, a, np.arange(10))
+
+        with pytest.raises(ValueError, match="must be < 10: 10"):
+            v(None, a, np.arange(11))
+
+    def test_numpy_instance_of(self):
+        """
+        instance_of is checked once per NumPy array unless its dtype holds
+        arbitrary objects.
+        """
+        np = pytest.importorskip("numpy")
+
+        v = instance_of(np.integer)
+
+        assert _all_valid(v, np.arange(10))
+        assert _all_valid(v, np.arange(0))
+        assert not _all_valid(v, np.arange(10.0))
+        assert not _all_valid(v, np.array([1, "a"], dtype=object))
+        assert _all_valid(instance_of(int), np.array([1, 2], dtype=object))
+
 
 class TestDeepMapping:
     """
@@ -808,6 +1131,76 @@ class TestDeepMapping:
         assert and_(*value_validator) == v.value_validator
         assert and_(*mapping_validator) == v.mapping_validator
 
+    def test_bulk(self):
+        """
+        Keys and values of dicts are checked in bulk; failures raise the same
+        errors as individual checks.
+        """
+        v = deep_mapping(instance_of(str), [instance_of(int), ge(0)])
+        a = simple_attr("test")
+
+        assert _all_valid(v.key_validator, {"a": 1}.keys())
+        assert _all_valid(v.value_validator, {"a": 1}.values())
+
+        v(None, a, {"a": 1, "b": 2})
+
+        with pytest.raises(ValueError, match="'test' must be >= 0: -1"):
+            v(None, a, {"a": 1, "b": -1})
+
+        with pytest.raises(TypeError, match="got 1 that is a"):
+            v(None, a, {"a": 1, 1: 2})
+
+    def test_subset(self):
+        """
+        Samples and prefixes select the items to validate.
+        """
+        a = simple_attr("test")
+        m = {"a": 1, "b": 2, "c": "3"}
+
+        deep_mapping(value_validator=instance_of(int), prefix=2)(None, a, m)
+        deep_mapping(instance_of(str), sample=3)(None, a, m)
+
+        with pytest.raises(TypeError):
+            deep_mapping(value_validator=instance_of(int), sample=1.0)(
+                None, a, m
+            )
+
+        big = {i: str(i) for i in range(100)}
+        keys = []
+        values = []
+        deep_mapping(
+            lambda inst, attr, value: keys.append(value),
+            lambda inst, attr, value: values.append(value),
+            sample=10,
+        )(None, a, big)
+
+        assert 10 == len(keys)
+        assert sorted(keys) == keys
+        assert [big[k] for k in keys] == values
+
+        assert (
+            "<deep_mapping validator for objects mapping None to"
+            " <instance_of validator for type <class 'int'>>, validating the"
+            " first 2 members>"
+        ) == repr(deep_mapping(value_validator=instance_of(int), prefix=2))
+
+    @pytest.mark.parametrize(
+        ("key_validator", "value_validator", "mapping"),
+        [
+            (instance_of(str), None, {"a": 1}),
+            (None, instance_of(int), {"a": 1}),
+            (instance_of(str), instance_of(int), OrderedDict(a=1)),
+        ],
+    )
+    def test_partial(self, key_validator, value_validator, mapping):
+        """
+        Either validator can be missing and mappings that aren't dicts are
+        validated per item.
+        """
+        deep_mapping(key_validator, value_validator)(
+            None, simple_attr("test"), mapping
+        )
+
 
 class TestIsCallable:
     """
@@ -1402,3 +1795,610 @@ class TestOr:
             "<or validator wrapping (<instance_of validator for type "
             "<class 'int'>>, <instance_of validator for type <class 'str'>>)>"
         ) == repr(v)
+
+
+class TestCompileValidator:
+    """
+    Tests for `attr._make._compile_validator`.
+    """
+
+    def test_single(self):
+        """
+        Single validators are returned as they are, composed ones are
+        compiled -- once.
+        """
+        leaf = instance_of(int)
+        v = optional(instance_of(int))
+
+        assert leaf is _compile_validator(leaf)
+        assert v is not _compile_validator(v)
+        assert _compile_validator(v) is _compile_validator(v)
+
+    def test_cache_lifetime(self):
+        """
+        Compiled validators are cached as long as they are in use and keep
+        their validators alive, so the ids of cached validators can't be
+        reused.
+        """
+        v = optional(instance_of(int))
+        key = id(v)
+        compiled = _compile_validator(v)
+        del v
+        gc.collect()
+
+        assert compiled is _COMPILED_VALIDATORS[key]
+
+        del compiled
+        gc.collect()
+
+        assert key not in _COMPILED_VALIDATORS
+
+    def test_opaque(self):
+        """
+        Validators without predicates are returned as they are, also if
+        they're composed.
+        """
+        v = and_(always_pass, always_pass)
+
+        assert v is _compile_validator(v)
+        assert v is _compile_validator(v)
+
+    @pytest.mark.parametrize(
+        ("v", "value", "exc", "match"),
+        [
+            (optional(instance_of(int)), "1", TypeError, "must be <class"),
+            (optional([instance_of(int), gt(0)]), 0, ValueError, "> 0: 0"),
+            (and_(instance_of(int), ge(0), lt(5)), 5, ValueError, "< 5: 5"),
+            (or_(in_([1, 2]), matches_re("a")), "b", ValueError, "None of"),
+            (and_(min_len(1), max_len(2)), "", ValueError, "Length of"),
+            (and_(is_callable(), is_callable()), 1, TypeError, "callable"),
+            (and_(ne(1), le(3)), 1, ValueError, "!= 1: 1"),
+        ],
+    )
+    def test_errors(self, v, value, exc, match):
+        """
+        Compiled validators raise the same errors as the original ones.
+        """
+        a = simple_attr("test")
+
+        with pytest.raises(exc, match=match):
+            v(None, a, value)
+
+        with pytest.raises(exc, match=match):
+            _compile_validator(v)(None, a, value)
+
+    @pytest.mark.parametrize(
+        ("v", "value"),
+        [
+            (optional(instance_of(int)), None),
+            (optional([instance_of(int), gt(0)]), None),
+            (optional([instance_of(int), gt(0)]), 1),
+            (or_(instance_of(int), instance_of(str)), "x"),
+            (or_(lt(5), instance_of(str)), "x"),
+            (and_(in_([[1]]), max_len(1)), [1]),
+        ],
+    )
+    def test_passes(self, v, value):
+        """
+        Compiled validators pass if the original ones do, even if their
+        predicates raise.
+        """
+        _compile_validator(v)(None, simple_attr("test"), value)
+
+    def test_opaque_in_order(self):
+        """
+        Validators without predicates are called once and in order.
+        """
+        calls = []
+
+        def record(inst, attr, value):
+            calls.append(value)
+
+        v = _compile_validator(and_(instance_of(int), record, gt(0)))
+        a = simple_attr("test")
+
+        v(None, a, 1)
+
+        with pytest.raises(TypeError):
+            v(None, a, "1")
+
+        with pytest.raises(ValueError):
+            v(None, a, -1)
+
+        assert [1, -1] == calls
+
+    def test_used(self, monkeypatch):
+        """
+        The generated __init__ inlines the fused check, and the generated
+        __setattr__ and attrs.validate use compiled validators.
+        """
+
+        @attr.define
+        class C:
+            x: int = attr.field(validator=optional(instance_of(int)))
+
+        v = fields(C).x.validator
+        compiled = _compile_validator(v)
+
+        assert compiled is C.__init__.__globals__["__attr_validator_x"]
+        assert "isinstance(value, " in inspect.getsource(C.__init__)
+        assert compiled is C.__setattr__.__globals__["__attr_validator_x"]
+
+        calls = []
+
+        def record(inst, attr, value):
+            calls.append(value)
+
+        monkeypatch.setitem(_COMPILED_VALIDATORS, id(v), record)
+        c = C(1)
+
+        attr.validate(c)
+
+        assert [1] == calls
+
+
+class TestMemoize:
+    """
+    Tests for `memoize`.
+    """
+
+    @pytest.fixture(name="calls")
+    def _calls(self):
+        return []
+
+    @pytest.fixture(name="record")
+    def _record(self, calls):
+        def record(inst, attr, value):
+            calls.append(value)
+            if value == "bad":
+                raise ValueError(value)
+
+        return record
+
+    def test_in_all(self):
+        """
+        Verify that this validator is in ``__all__``.
+        """
+        assert memoize.__name__ in validator_module.__all__
+
+    def test_hits(self, record, calls):
+        """
+        Accepted values aren't validated again, rejected ones are.
+        """
+        v = memoize(record)
+        a = simple_attr("test")
+
+        for value in ("a", "b", "a", "bad", "b", "a"):
+            with contextlib.suppress(ValueError):
+                v(None, a, value)
+
+        with pytest.raises(ValueError, match="bad"):
+            v(None, a, "bad")
+
+        assert ["a", "b", "bad", "bad"] == calls
+
+    def test_classes(self, record, calls):
+        """
+        Equal values of different classes are distinct.
+        """
+        v = memoize(record)
+        a = simple_attr("test")
+
+        for value in (1, 1.0, True, 1):
+            v(None, a, value)
+
+        assert [1, 1.0, True] == calls
+        assert [int, float, bool] == [type(c) for c in calls]
+
+    def test_signed_zeros(self):
+        """
+        0.0 and -0.0 are distinct -- also as members.
+        """
+
+        def positive_sign(inst, attr, value):
+            for x in value if isinstance(value, tuple) else (value,):
+                if math.copysign(1.0, x) < 0:
+                    raise ValueError(x)
+
+        v = memoize(positive_sign)
+        a = simple_attr("test")
+
+        v(None, a, 0.0)
+        v(None, a, (0.0,))
+
+        with pytest.raises(ValueError):
+            v(None, a, -0.0)
+
+        with pytest.raises(ValueError):
+            v(None, a, (-0.0,))
+
+    def test_member_classes(self):
+        """
+        Equal containers with members of different classes are distinct.
+        """
+        v = memoize(deep_iterable(instance_of(int)))
+        a = simple_attr("test")
+
+        v(None, a, (1,))
+
+        with pytest.raises(TypeError):
+            v(None, a, (1.0,))
+
+        with pytest.raises(TypeError):
+            v(None, a, frozenset([1.0]))
+
+    def test_other_classes(self, record, calls):
+        """
+        Values of other classes are always validated -- their equality could
+        hide differences, like the classes of their fields.
+        """
+
+        @attr.frozen
+        class C:
+            x: object
+
+        v = memoize(record)
+        a = simple_attr("test")
+
+        for value in (C(1), C(1.0), (C(1),), (C(1),)):
+            v(None, a, value)
+
+        assert 4 == len(calls)
+
+    def test_unhashable(self, record, calls):
+        """
+        Unhashable values are always validated.
+        """
+        v = memoize(record)
+        a = simple_attr("test")
+
+        v(None, a, [1])
+        v(None, a, [1])
+
+        assert [[1], [1]] == calls
+
+    @pytest.mark.parametrize(
+        ("maxsize", "expected"),
+        [
+            (2, ["a", "b", "c", "a"]),
+            (0, ["a", "b", "c", "b", "a"]),
+            (None, ["a", "b", "c"]),
+        ],
+    )
+    def test_maxsize(self, record, calls, maxsize, expected):
+        """
+        At most maxsize values are remembered; the least recently validated
+        ones are forgotten first.
+        """
+        v = memoize(record, maxsize=maxsize)
+        a = simple_attr("test")
+
+        for value in ("a", "b", "c", "b", "a"):
+            v(None, a, value)
+
+        assert expected == calls
+
+    def test_validators_iterables(self):
+        """
+        Lists and tuples of validators are combined with and_.
+        """
+        v = memoize([instance_of(int), gt(0)])
+
+        assert and_(instance_of(int), gt(0)) == v.validator
+
+        with pytest.raises(ValueError):
+            v(None, simple_attr("test"), 0)
+
+    def test_threads(self, record, calls):
+        """
+        Concurrent validations don't break the cache.
+        """
+        v = memoize(record, maxsize=10)
+        a = simple_attr("test")
+
+        def validate(i):
+            v(None, a, i % 20)
+
+        with concurrent.futures.ThreadPoolExecutor(8) as pool:
+            list(pool.map(validate, range(10_000)))
+
+        assert 10 == len(v._passed)
+        assert set(range(20)) == set(calls)
+
+    def test_repr(self):
+        """
+        Returned validator has a useful `__repr__`.
+        """
+        assert (
+            "<memoizing validator for <instance_of validator for type"
+            " <class 'int'>>>"
+        ) == repr(memoize(instance_of(int)))
+
+    def test_is_hashable(self):
+        """
+        Memoizing validators are hashable.
+        """
+        assert hash(memoize(instance_of(int))) == hash(
+            memoize(instance_of(int))
+        )
+
+
+@attr.define(check_types=True)
+class Checked:
+    id: int
+    ratio: float = 1.0
+    tags: list[str] = attr.Factory(list)
+    scores: dict[str, int] = attr.Factory(dict)
+    parent: "Checked | None" = None
+    note: str | None = None
+
+
+@attr.define(check_types=True)
+class Unresolvable:
+    x: "Undefined"  # noqa: F821
+
+
+class TestCheckTypes:
+    @pytest.fixture(autouse=True)
+    def _reset_default(self):
+        """
+        Make sure type checks are always enabled after a test.
+        """
+        yield
+        _config._check_types = True
+
+    def test_valid(self):
+        """
+        Valid values pass, ints are accepted for floats, and forward
+        references are resolved.
+        """
+        parent = Checked(1, 2, ["a"], {"x": 1})
+
+        assert parent is Checked(2, parent=parent, note="n").parent
+
+    @pytest.mark.parametrize(
+        "kw",
+        [
+            {"id": "1"},
+            {"ratio": "1"},
+            {"tags": ["a", 1]},
+            {"tags": ("a",)},
+            {"scores": {1: 1}},
+            {"scores": {"x": "y"}},
+            {"parent": 42},
+            {"note": 42},
+        ],
+    )
+    def test_invalid(self, kw):
+        """
+        Invalid values raise TypeErrors in __init__ and on assignment.
+        """
+        kw = {"id": 1, **kw}
+
+        with pytest.raises(TypeError):
+            Checked(**kw)
+
+        c = Checked(1)
+        name, value = next(
+            (k, v) for k, v in kw.items() if k != "id" or len(kw) == 1
+        )
+        with pytest.raises(TypeError):
+            setattr(c, name, value)
+
+    def test_own_validators(self):
+        """
+        Type checks run before the fields' own validators.
+        """
+
+        @attr.define(check_types=True)
+        class C:
+            x: int = attr.field(validator=gt(0))
+
+        assert isinstance(
+            fields(C).x.validator, validator_module._AndValidator
+        )
+
+        with pytest.raises(TypeError):
+            C("1")
+        with pytest.raises(ValueError):
+            C(0)
+
+    def test_inlined(self):
+        """
+        Simple checks are inlined into __init__.
+        """
+        src = inspect.getsource(Checked.__init__)
+
+        assert "isinstance(value, " in src
+        assert "__attr_validator_id(self, __attr_id, value)" in src
+
+    def test_unchecked(self):
+        """
+        Any, type variables, unannotated fields, and protocols that aren't
+        runtime-checkable aren't checked.
+        """
+        T = typing.TypeVar("T")
+
+        class Proto(typing.Protocol):
+            def meth(self): ...
+
+        @attr.define(check_types=True)
+        class C(typing.Generic[T]):
+            a: typing.Any
+            b: T
+            c: Proto
+            d: list[typing.Any]
+
+        assert all(a.validator is None for a in fields(C)[:3])
+        assert instance_of(list) == fields(C).d.validator.validator
+
+        C(1, 2, 3, [object()])
+
+    @pytest.mark.parametrize(
+        ("annotation", "good", "bad"),
+        [
+            (typing.Literal["a", "b"], "a", "c"),
+            (typing.Callable[[], int], len, 42),
+            (typing.Annotated[int, "meta"], 1, "1"),
+            (typing.NewType("UserId", int), 1, "1"),
+            (int | list[int], [1], [None]),
+            (typing.Literal[1, "a"], 1, True),
+            (typing.Literal[1, "a"], 1, 1.0),
+            (tuple[int, ...], (1, 2), (1, "2")),
+            (tuple[int, str], (1, 2), [1, "2"]),
+            (typing.Iterator[int], iter(["no members checked"]), [1]),
+            (None, None, 0),
+            (complex, 1, "1"),
+        ],
+    )
+    def test_derive(self, annotation, good, bad):
+        """
+        Validators are derived for various kinds of annotations.
+        """
+        v = _type_check(annotation)
+        a = simple_attr("x")
+
+        v(None, a, good)
+
+        with pytest.raises((TypeError, ValueError)):
+            v(None, a, bad)
+
+    def test_cached(self):
+        """
+        Validators are cached by annotation, so fields with equal annotations
+        share them.
+        """
+
+        @attr.define(check_types=True)
+        class C:
+            x: list[int]
+            y: list[int]
+
+        assert fields(C).x.validator is fields(C).y.validator
+        assert fields(C).x.validator is _type_check(list[int])
+
+    def test_sampled(self):
+        """
+        Only a sample of the members of large collections is checked --
+        unless validators are exhaustive.
+        """
+        values = [*range(1000), "nope"]
+
+        @attr.define(check_types=True)
+        class C:
+            x: list[int]
+
+        with validator_module.exhaustive(), pytest.raises(TypeError):
+            C(values)
+
+        def rejected():
+            try:
+                C(values)
+            except TypeError:
+                return True
+
+            return False
+
+        assert sum(rejected() for _ in range(10)) < 10
+
+    def test_switch(self):
+        """
+        Type checks can be switched off globally while other validators keep
+        running.
+        """
+
+        @attr.define(check_types=True)
+        class C:
+            x: int = attr.field(validator=gt(0))
+
+        assert validator_module.get_check_types()
+
+        validator_module.set_check_types(False)
+
+        assert not validator_module.get_check_types()
+        assert 42 == Checked("1", parent=42).parent
+        assert 1.0 == C(1.0).x
+
+        with pytest.raises(ValueError):
+            C(0)
+
+        validator_module.set_check_types(True)
+
+        with pytest.raises(TypeError):
+            Checked(1, parent=42)
+        with pytest.raises(TypeError):
+            C(1.0)
+
+    def test_unresolvable(self):
+        """
+        Forward references that still can't be resolved aren't checked.
+        Classes that are defined in functions are warned about when they're
+        created, because their annotations can't be resolved later either.
+        """
+        with pytest.warns(
+            UserWarning, match=r"test_unresolvable\.<locals>\.C"
+        ) as ws:
+
+            @attr.define(check_types=True)
+            class C:
+                x: "Undefined"  # noqa: F821
+
+        assert __file__ == ws[0].filename
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+
+            assert 42 == C(42).x
+
+    def test_unresolvable_when_validated(self):
+        """
+        Forward references that can't be resolved when the first value is
+        validated are warned about once.
+        """
+        with pytest.warns(UserWarning, match="'x' of") as ws:
+            Unresolvable(1)
+
+        assert __file__ == ws[0].filename
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+
+            assert 2 == Unresolvable(2).x
+
+    def test_local_self_reference(self):
+        """
+        Classes that are defined in functions can reference themselves.
+        """
+
+        @attr.define(check_types=True)
+        class Node:
+            next: "Node | None" = None
+
+        Node(Node())
+
+        with pytest.raises(TypeError):
+            Node(42)
+
+    def test_inherited(self):
+        """
+        Subclasses keep the checks of their bases but only derive checks for
+        their own fields if asked to.
+        """
+
+        @attr.define
+        class Sub(Checked):
+            extra: int = 0
+
+        assert not attrs.inspect(Sub).added_type_checks
+        assert None is fields(Sub).extra.validator
+        assert "x" == Sub(1, extra="x").extra
+
+        with pytest.raises(TypeError):
+            Sub("1")
+
+    def test_props(self):
+        """
+        ClassProps reflect check_types.
+        """
+        assert attrs.inspect(Checked).added_type_checks
+        assert not attrs.inspect(attr.make_class("C", ["x"])).added_type_checks
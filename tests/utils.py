@@ -67,3 +67,12 @@ def simple_attr(
         alias=_default_init_alias_for(name),
         alias_is_default=True,
     )
+
+
+def ordered(inst):
+    """
+    An invariant that checks that ``inst.lo <= inst.hi``.
+    """
+    if inst.lo > inst.hi:
+        msg = f"{inst.lo} > {inst.hi}"
+        raise ValueError(msg)